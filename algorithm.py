@@ -1,27 +1,388 @@
 import numpy as np
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+import os
 import time
 
+# Ulaşılamayan durumlar için taşma yapmayacak kadar küçük bir değer
+NEG_INF = np.iinfo(np.int64).min // 4
+
+
+def _sliding_window_max(matrix: np.ndarray, window: int) -> np.ndarray:
+    """
+    Her satırda [k-window+1, k] penceresinin maksimumunu hesaplar (van Herk / Gil-Werman).
+
+    Blok başına önek ve sonek maksimumları kullanıldığı için pencere
+    boyutundan bağımsız olarak O(satır × sütun) sürer.
+    """
+    rows, cols = matrix.shape
+    if window >= cols:
+        return np.maximum.accumulate(matrix, axis=1)
+
+    total = cols + window - 1
+    padded_len = -(-total // window) * window
+    padded = np.full((rows, padded_len), NEG_INF, dtype=np.int64)
+    padded[:, window - 1:window - 1 + cols] = matrix
+
+    blocks = padded.reshape(rows, padded_len // window, window)
+    prefix = np.maximum.accumulate(blocks, axis=2).reshape(rows, padded_len)
+    suffix = np.maximum.accumulate(blocks[:, :, ::-1], axis=2)[:, :, ::-1].reshape(rows, padded_len)
+
+    return np.maximum(suffix[:, :cols], prefix[:, window - 1:window - 1 + cols])
+
+
+# _bounded_row_update'in satır uzunluğunda geçici dizi sayısı (dolgu, kaydırma,
+# kayan pencerenin iki kat uzun önek / sonek dizileri)
+ROW_UPDATE_TEMPS = 12
+
+# Dizi başlıkları, sonuç sözlüğü gibi dizi dışı küçük ayırmalar için sabit pay
+ENGINE_OVERHEAD = 64 * 1024
+
+# Çözücüye bütçe verilmediğinde çok boyutlu DP'nin otomatik motor seçimindeki sınırı
+MULTIDIMENSIONAL_MEMORY = 256 * 1024 ** 2
+
+# Pareto motorunda birleştirilmiş durum başına geçici bayt (ağırlık, değer,
+# ebeveyn, sıralama ve eleme dizileri) ve eşya başına saklanan ebeveyn baytı
+PARETO_MERGE_BYTES = 64
+PARETO_PARENT_BYTES = 9
+
+
+def _bounded_row_update(row: np.ndarray, weight: int, value: int, count: int) -> np.ndarray:
+    """
+    Bir eşyanın en fazla `count` kopyasını bir DP satırına uygular.
+
+    Kapasiteler ağırlığa göre kalan sınıflarına ayrılır; her sınıfta
+    dp[r + k·w] = max_{k-c ≤ t ≤ k} (dp[r + t·w] - t·v) + k·v
+    kayan pencere maksimumu ile tek geçişte hesaplanır.
+    """
+    size = len(row)
+    if weight >= size:
+        return row.copy()
+
+    steps = -(-size // weight)
+    padded = np.full(steps * weight, NEG_INF, dtype=np.int64)
+    padded[:size] = row
+
+    # grid[r, k] = row[r + k·w]
+    grid = padded.reshape(steps, weight).T
+    offsets = np.arange(steps, dtype=np.int64) * value
+    shifted = np.where(grid > NEG_INF, grid - offsets, NEG_INF)
+
+    best = _sliding_window_max(shifted, count + 1)
+    best = np.where(best > NEG_INF, best + offsets, NEG_INF)
+
+    return best.T.reshape(-1)[:size]
+
+
+def _undominated_items(weights: List[int], values: List[int]) -> List[int]:
+    """
+    Sınırsız knapsack için baskın olunmayan eşyaların indekslerini döner.
+
+    j eşyası, ⌊w_j / w_i⌋ kopyası v_j'den az olmayan değer veren bir i eşyası
+    varsa gereksizdir.
+    """
+    order = sorted(range(len(weights)), key=lambda i: (weights[i], -values[i]))
+    # Tutulan eşyalar önceden ayrılmış dizilerin başına yazılır; her eklemede kopyalanmaz
+    kept_weights = np.empty(len(order), dtype=np.int64)
+    kept_values = np.empty(len(order), dtype=np.int64)
+    kept = []
+
+    for j in order:
+        count = len(kept)
+        if count and np.any((weights[j] // kept_weights[:count]) * kept_values[:count] >= values[j]):
+            continue
+        kept_weights[count] = weights[j]
+        kept_values[count] = values[j]
+        kept.append(j)
+
+    return sorted(kept)
+
+
+def _undominated_group_members(weights: np.ndarray, values: np.ndarray,
+                               members: List[int]) -> List[int]:
+    """
+    Bir grupta daha hafif ve en az onun kadar değerli bir eşyası olan üyeleri eler
+    """
+    index = np.asarray(members, dtype=np.int64)
+    order = index[np.lexsort((-values[index], weights[index]))]
+    ordered_values = values[order]
+    # Ağırlık sırasında değer kesin artmıyorsa eşya baskındır
+    running = np.maximum.accumulate(ordered_values)
+    keep = np.ones(len(order), dtype=bool)
+    keep[1:] = ordered_values[1:] > running[:-1]
+    return order[keep].tolist()
+
+
+def _lp_hull(weights: np.ndarray, values: np.ndarray, members: List[int],
+             include_empty: bool) -> List[Tuple[int, int]]:
+    """
+    Grubun (ağırlık, değer) noktalarının üst konveks zarfını ağırlık sırasıyla döner.
+
+    Zarfın altında kalan (LP-baskın) eşyalar LP gevşetmesinde hiç seçilmez.
+    """
+    points = [(int(weights[i]), int(values[i]))
+              for i in _undominated_group_members(weights, values, members)]
+    if include_empty:
+        points = [(0, 0)] + points
+
+    hull = []
+    for point in points:
+        while len(hull) >= 2:
+            (w1, v1), (w2, v2) = hull[-2], hull[-1]
+            # Orta nokta, uç noktaları birleştiren doğrunun üstünde değilse atılır
+            if (v2 - v1) * (point[0] - w1) <= (point[1] - v1) * (w2 - w1):
+                hull.pop()
+            else:
+                break
+        hull.append(point)
+    return hull
+
+
+def _multiple_choice_lp_bound(weights: np.ndarray, values: np.ndarray,
+                              groups: List[List[int]], capacity: int,
+                              exactly_one: bool) -> float:
+    """
+    Çoktan seçmeli knapsack'in LP gevşetme üst sınırını (Sinha–Zoltners) hesaplar
+    """
+    base_weight = 0
+    base_value = 0
+    increments = []
+    for members in groups:
+        hull = _lp_hull(weights, values, members, include_empty=not exactly_one)
+        base_weight += hull[0][0]
+        base_value += hull[0][1]
+        for (w1, v1), (w2, v2) in zip(hull, hull[1:]):
+            increments.append((w2 - w1, v2 - v1))
+
+    if base_weight > capacity:
+        return float('-inf')
+
+    increments.sort(key=lambda step: step[1] / step[0], reverse=True)
+    remaining = capacity - base_weight
+    bound = float(base_value)
+    for dw, dv in increments:
+        if dw <= remaining:
+            remaining -= dw
+            bound += dv
+        else:
+            bound += dv * remaining / dw
+            break
+    return bound
+
+
+# Adım kaydı karar kodları
+STEP_TOO_HEAVY = 0
+STEP_TAKEN = 1
+STEP_SKIPPED = 2
+
+STEP_DTYPE = np.dtype([
+    ('item', np.int32),
+    ('capacity', np.int64),
+    ('take_value', np.int64),
+    ('dont_take_value', np.int64),
+    ('chosen', np.int64),
+    ('decision', np.int8)
+])
+
+
+def format_step_action(item: int, weight: int, value: int, capacity: int, decision: int) -> str:
+    """
+    Bir adım kaydının Türkçe açıklamasını üretir
+    """
+    if decision == STEP_TOO_HEAVY:
+        return f'Eşya {item + 1} çok ağır (ağırlık: {weight} > kapasite: {capacity})'
+    if decision == STEP_TAKEN:
+        return f'Eşya {item + 1} alındı (değer: {value}, ağırlık: {weight})'
+    return f'Eşya {item + 1} alınmadı (daha az değerli)'
+
+
+# Yerel aramada eşya çifti başına bayt: kazanç, ağırlık farkı geçicisi, uygunluk maskesi, np.where çıktısı
+ANYTIME_PAIR_BYTES = 32
+
+# solve_within_budget'in denediği bellek seviyeleri (pahalıdan ucuza)
+MEMORY_LEVELS = ('steps', 'no_trace', 'bitpacked', 'linear', 'approximate')
+MEMORY_LEVEL_LABELS = {
+    'steps': 'Adım kayıtlı tam tablo',
+    'no_trace': 'Adım kaydı olmadan tam tablo',
+    'bitpacked': 'Bit paketli kararlar',
+    'linear': 'Doğrusal bellekli böl-yönet',
+    'approximate': 'Süre bütçeli yaklaşık çözüm'
+}
+
+
+class StepView(Mapping):
+    """
+    Tek bir adım kaydının sözlük benzeri, tembel görünümü
+
+    'action' mesajı ve 'table_state' tablosu yalnızca istendiğinde üretilir.
+    """
+
+    def __init__(self, trace: 'StepTrace', index: int):
+        self._trace = trace
+        self._record = trace.records[index]
+
+    def _keys(self) -> List[str]:
+        keys = ['item', 'weight', 'value', 'current_capacity', 'action']
+        if self._record['decision'] == STEP_TOO_HEAVY:
+            keys.append('previous_value')
+        else:
+            keys += ['take_value', 'dont_take_value']
+        return keys + ['current_value', 'table_state']
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys():
+            raise KeyError(key)
+        record = self._record
+        item = int(record['item'])
+        if key == 'item':
+            return item
+        if key == 'weight':
+            return self._trace.weights[item]
+        if key == 'value':
+            return self._trace.values[item]
+        if key == 'current_capacity':
+            return int(record['capacity'])
+        if key == 'action':
+            return format_step_action(item, self._trace.weights[item], self._trace.values[item],
+                                      int(record['capacity']), int(record['decision']))
+        if key in ('previous_value', 'dont_take_value'):
+            return int(record['dont_take_value'])
+        if key == 'take_value':
+            return int(record['take_value'])
+        if key == 'current_value':
+            return int(record['chosen'])
+        return self._trace.table_state(item, int(record['capacity']))
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+
+class StepTrace(Sequence):
+    """
+    DP adımlarının yapılandırılmış NumPy dizisi olarak kompakt kaydı
+
+    Eleman erişimi eski sözlük biçimiyle uyumlu StepView döner.
+    """
+
+    def __init__(self, records: np.ndarray, weights: List[int], values: List[int],
+                 dp_table: np.ndarray):
+        self.records = records
+        self.weights = weights
+        self.values = values
+        self.dp_table = dp_table
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return StepView(self, index)
+
+    def table_state(self, item: int, capacity: int) -> np.ndarray:
+        """
+        Verilen hücre hesaplandığı andaki DP tablosunu yeniden oluşturur
+        """
+        table = self.dp_table.copy()
+        table[item + 2:] = 0
+        table[item + 1, capacity + 1:] = 0
+        return table
+
+    def viewport(self, index: int, rows: int = 20, cols: int = 60) -> Dict[str, Any]:
+        """
+        Adımın hücresi etrafındaki en fazla rows × cols'luk tablo penceresini döner
+
+        Yalnızca pencere kopyalanır; tablonun o adımdan sonra hesaplanan
+        hücreleri sıfırlanır. Boyut tablodan bağımsız olduğundan adım
+        kaydırıcısı her problem boyutunda hızlı kalır.
+
+        Returns:
+            'table' (pencere), 'row_offset', 'col_offset', 'item', 'capacity'
+        """
+        record = self.records[index]
+        item, capacity = int(record['item']), int(record['capacity'])
+        total_rows, total_cols = self.dp_table.shape
+        row = item + 1
+
+        # Pencere mevcut hücreyi ortalar, tablo kenarlarında kaydırılır
+        row_offset = min(max(row - rows // 2, 0), max(total_rows - rows, 0))
+        col_offset = min(max(capacity - cols // 2, 0), max(total_cols - cols, 0))
+        table = np.array(self.dp_table[row_offset:row_offset + rows,
+                                       col_offset:col_offset + cols])
+
+        table[max(row + 1 - row_offset, 0):] = 0
+        if row >= row_offset and row - row_offset < len(table):
+            table[row - row_offset, max(capacity + 1 - col_offset, 0):] = 0
+
+        return {
+            'table': table,
+            'row_offset': row_offset,
+            'col_offset': col_offset,
+            'item': item,
+            'capacity': capacity
+        }
+
+    @property
+    def nbytes(self) -> int:
+        return self.records.nbytes
+
+
+class SolveCancelled(Exception):
+    """
+    İlerleme geri çağrısı çözümü durdurduğunda fırlatılır
+    """
+
+
 class KnapsackSolver:
     """
     Knapsack Problem için Dinamik Programlama çözüm sınıfı
     """
     
-    def __init__(self):
+    def __init__(self, max_memory: Optional[int] = None):
         self.dp_table = None
         self.solution_steps = []
         self.selected_items = []
         self.execution_time = 0
+        # progress_callback(tamamlanan, toplam) satır başına çağrılır; False dönerse çözüm iptal edilir
+        self.progress_callback = None
+        # Bayt cinsinden bellek bütçesi; motorlar bunu aşacak tabloları ayırmaz
+        self.max_memory = max_memory
+
+    def _reserve(self, engine: str, nbytes: float) -> None:
+        if self.max_memory is not None and nbytes > self.max_memory:
+            raise MemoryError(
+                f"{engine} için tahmini {nbytes / 1024 ** 2:.1f} MB bellek gerekiyor, "
+                f"bütçe {self.max_memory / 1024 ** 2:.1f} MB"
+            )
+
+    def _report_progress(self, done: int, total: int) -> None:
+        if self.progress_callback is not None and self.progress_callback(done, total) is False:
+            raise SolveCancelled("Çözüm iptal edildi")
         
     def solve_knapsack_with_steps(self, weights: List[int], values: List[int], 
-                                 capacity: int) -> Dict[str, Any]:
+                                 capacity: int, record_all: bool = False,
+                                 trace: bool = True) -> Dict[str, Any]:
         """
         Knapsack problemini adım adım çözer ve tüm ara adımları kaydeder
         
+        Her satır tek vektörel işlemle doldurulur; adımlar yapılandırılmış bir
+        NumPy dizisinde (StepTrace) tutulur, mesajlar ve tablo görüntüleri
+        yalnızca bir adım okunduğunda üretilir.
+        
         Args:
             weights: Eşyaların ağırlıkları
             values: Eşyaların değerleri
             capacity: Çantanın kapasitesi
+            record_all: True ise yalnızca w == kapasite değil, her hücre kaydedilir
+            trace: False ise adım kaydı tutulmaz, yalnızca değer tablosu doldurulur
             
         Returns:
             Çözüm sonuçları ve ara adımlar
@@ -29,51 +390,48 @@ class KnapsackSolver:
         start_time = time.time()
         
         n = len(weights)
-        self.dp_table = np.zeros((n + 1, capacity + 1), dtype=int)
-        self.solution_steps = []
+        size = capacity + 1
+        phases = self.estimate_memory(n, capacity, record_all)['steps' if trace else 'no_trace']
+        self._reserve("Adım adım DP", sum(phases.values()))
+        self.dp_table = np.zeros((n + 1, size), dtype=np.int64)
+        records = np.zeros((n * size if record_all else n) if trace else 0, dtype=STEP_DTYPE)
+        columns = np.arange(size)
+        # Satır güncellemesi önceden ayrılmış tamponlarda yerinde yapılır;
+        # döngü boyunca geçici satır ayrılmaz
+        take_item = np.zeros(size, dtype=np.int64)
+        taken = np.zeros(size, dtype=bool)
+        decision = np.empty(size if trace else 0, dtype=np.int8)
         
         # DP tablosunu doldur
         for i in range(1, n + 1):
-            for w in range(capacity + 1):
-                # Mevcut eşyayı alamıyorsak
-                if weights[i-1] > w:
-                    self.dp_table[i][w] = self.dp_table[i-1][w]
-                    step_info = {
-                        'item': i-1,
-                        'weight': weights[i-1],
-                        'value': values[i-1],
-                        'current_capacity': w,
-                        'action': f'Eşya {i} çok ağır (ağırlık: {weights[i-1]} > kapasite: {w})',
-                        'previous_value': self.dp_table[i-1][w],
-                        'current_value': self.dp_table[i][w],
-                        'table_state': self.dp_table.copy()
-                    }
-                else:
-                    # Eşyayı alıp almama kararı
-                    take_item = self.dp_table[i-1][w - weights[i-1]] + values[i-1]
-                    dont_take = self.dp_table[i-1][w]
-                    
-                    if take_item > dont_take:
-                        self.dp_table[i][w] = take_item
-                        action = f'Eşya {i} alındı (değer: {values[i-1]}, ağırlık: {weights[i-1]})'
-                    else:
-                        self.dp_table[i][w] = dont_take
-                        action = f'Eşya {i} alınmadı (daha az değerli)'
-                    
-                    step_info = {
-                        'item': i-1,
-                        'weight': weights[i-1],
-                        'value': values[i-1],
-                        'current_capacity': w,
-                        'action': action,
-                        'take_value': take_item,
-                        'dont_take_value': dont_take,
-                        'current_value': self.dp_table[i][w],
-                        'table_state': self.dp_table.copy()
-                    }
-                
-                if w == capacity:  # Sadece maksimum kapasite için adımları kaydet
-                    self.solution_steps.append(step_info)
+            self._report_progress(i - 1, n)
+            weight, value = weights[i-1], values[i-1]
+            dont_take = self.dp_table[i-1]
+            fit = min(weight, size)
+            take_item[:fit] = 0
+            taken[:fit] = False
+            np.add(dont_take[:size - fit], value, out=take_item[fit:])
+            np.greater(take_item[fit:], dont_take[fit:], out=taken[fit:])
+            
+            self.dp_table[i] = dont_take
+            np.copyto(self.dp_table[i], take_item, where=taken)
+            if not trace:
+                continue
+            decision[:fit] = STEP_TOO_HEAVY
+            decision[fit:] = STEP_SKIPPED
+            np.copyto(decision, STEP_TAKEN, where=taken)
+            
+            # Sadece maksimum kapasite için adımları kaydet (record_all değilse)
+            cells = slice(None) if record_all else slice(capacity, size)
+            block = records[(i-1) * size:i * size] if record_all else records[i-1:i]
+            block['item'] = i - 1
+            block['capacity'] = columns[cells]
+            block['take_value'] = take_item[cells]
+            block['dont_take_value'] = dont_take[cells]
+            block['chosen'] = self.dp_table[i][cells]
+            block['decision'] = decision[cells]
+        
+        self.solution_steps = StepTrace(records, weights, values, self.dp_table) if trace else []
         
         # Seçilen eşyaları bulalım
         self.selected_items = self._backtrack_solution(weights, values, capacity)
@@ -105,47 +463,1403 @@ class KnapsackSolver:
                 w -= weights[i-1]
                 
         return selected[::-1]  # Düzgün sıralama için ters çevir
-    
-    def get_complexity_analysis(self, n: int, capacity: int) -> Dict[str, str]:
+
+    @staticmethod
+    def estimate_memory(n: int, capacity: int, record_all: bool = False) -> Dict[str, Dict[str, int]]:
         """
-        Algoritmanın zaman ve uzay karmaşıklığı analizini döner
+        Bellek seviyelerinin her aşaması için tahmini ayırmayı (bayt) döner
+
+        Seviyeler pahalıdan ucuza: 'steps' (tablo + adım kaydı), 'no_trace'
+        (yalnızca tablo), 'bitpacked' (bit paketli kararlar), 'linear'
+        (doğrusal bellekli böl-yönet), 'approximate' (süre bütçeli yaklaşık).
+        'export' tablonun JSON olarak dışa aktarım maliyetidir.
         """
+        size = capacity + 1
+        row = size * 8
+        table = (n + 1) * row
+        backtrack = n * 8
         return {
-            'time_complexity': f'O(n × W) = O({n} × {capacity}) = O({n * capacity})',
-            'space_complexity': f'O(n × W) = O({n} × {capacity}) = O({n * capacity})',
-            'explanation': {
-                'time': 'n eşya ve W kapasite için, her hücreyi bir kez hesaplıyoruz',
-                'space': 'DP tablosu n×W boyutunda 2D array gerektiriyor'
-            }
+            'steps': {
+                'table': table,
+                'trace': (n * size if record_all else n) * STEP_DTYPE.itemsize,
+                # Sütun indeksleri, alma satırı, alındı maskesi ve karar satırı
+                'rows': 2 * row + 2 * size,
+                'backtrack': backtrack + ENGINE_OVERHEAD
+            },
+            'no_trace': {'table': table, 'rows': 2 * row + size, 'backtrack': backtrack + ENGINE_OVERHEAD},
+            'bitpacked': {'decisions': n * ((size + 7) // 8), 'rows': 4 * row, 'backtrack': backtrack},
+            # İleri/geri satırlar ve özyineleme boyunca eşya indeksleri
+            'linear': {'rows': 4 * row, 'backtrack': 3 * backtrack},
+            # Zorunlu aşamalar; DP aşaması yalnızca kalan bütçeye sığarsa çalışır
+            'approximate': {key: phase for key, phase in
+                            KnapsackSolver._anytime_memory(n, capacity).items() if key != 'dp'},
+            # tolist() ile Python tam sayıları ve JSON metni
+            'export': {'table_json': (n + 1) * size * 48}
         }
-    
-    def solve_greedy_comparison(self, weights: List[int], values: List[int], 
-                               capacity: int) -> Dict[str, Any]:
+
+    def solve_within_budget(self, weights: List[int], values: List[int], capacity: int,
+                            record_all: bool = False, time_budget: float = 2.0) -> Dict[str, Any]:
         """
-        Karşılaştırma için açgözlü (greedy) yöntem ile çözüm
+        max_memory bütçesine sığan en zengin motorla çözer
+
+        Sırasıyla adım kaydı, tablo, bit paketli kararlar, doğrusal bellek ve
+        yaklaşık çözüm denenir; hiçbir tablo bütçeyi aşacak şekilde ayrılmaz.
+
+        Returns:
+            Standart çözüm sözlüğü ve seçilen seviye, aşama tahminleri ile
+            yapılan düşürmeleri içeren 'memory'
         """
         n = len(weights)
-        
-        # Değer/ağırlık oranına göre sırala
-        ratio_indices = sorted(range(n), key=lambda i: values[i]/weights[i], reverse=True)
-        
-        selected_greedy = []
-        total_weight = 0
-        total_value = 0
-        
-        for i in ratio_indices:
-            if total_weight + weights[i] <= capacity:
-                selected_greedy.append(i)
-                total_weight += weights[i]
-                total_value += values[i]
-        
+        estimates = self.estimate_memory(n, capacity, record_all)
+        budget = self.max_memory
+        downgrades = []
+
+        for level in MEMORY_LEVELS:
+            required = sum(estimates[level].values())
+            if budget is None or required <= budget:
+                break
+            downgrades.append(f"{MEMORY_LEVEL_LABELS[level]}: {required / 1024 ** 2:.1f} MB "
+                              f"bütçeyi aşıyor")
+        else:
+            raise MemoryError(f"Hiçbir motor {budget / 1024 ** 2:.1f} MB bütçeye sığmıyor")
+
+        if level == 'steps':
+            result = self.solve_knapsack_with_steps(weights, values, capacity, record_all)
+        elif level == 'no_trace':
+            result = self.solve_knapsack_with_steps(weights, values, capacity, trace=False)
+        elif level == 'bitpacked':
+            result = self.solve_parallel(weights, values, capacity)
+        elif level == 'linear':
+            result = self.solve_linear_space(weights, values, capacity)
+        else:
+            result = self.solve_anytime(weights, values, capacity, time_budget=time_budget,
+                                        max_memory=budget)
+
+        table_bytes = estimates['no_trace']['table'] + estimates['export']['table_json']
+        result['memory'] = {
+            'budget': budget,
+            'level': level,
+            'phases': estimates[level],
+            'estimate': sum(estimates[level].values()),
+            'downgrades': downgrades,
+            # Tablo yalnızca tam tablo tutan seviyelerde ve bütçeye sığıyorsa dışa aktarılır
+            'export_table': level in ('steps', 'no_trace') and (budget is None or table_bytes <= budget)
+        }
+        return result
+
+    def solve_linear_space(self, weights: List[int], values: List[int],
+                           capacity: int) -> Dict[str, Any]:
+        """
+        O(W) bellekli böl-yönet (Hirschberg) 0/1 knapsack
+
+        Eşyalar ikiye bölünür, iki yarının en iyi değer satırları hesaplanıp
+        kapasitenin en iyi bölünme noktası bulunur ve her yarı kendi
+        kapasitesiyle özyinelemeli çözülür. Toplam süre ~2·n·W, bellek
+        birkaç satır kadardır.
+        """
+        start_time = time.time()
+
+        n = len(weights)
+        self._reserve("Doğrusal bellekli DP",
+                      sum(self.estimate_memory(n, capacity)['linear'].values()))
+
+        selected = []
+        pending = [(np.arange(n), capacity)]
+        while pending:
+            items, limit = pending.pop()
+            if not len(items) or limit <= 0:
+                continue
+            if len(items) == 1:
+                if weights[items[0]] <= limit:
+                    selected.append(int(items[0]))
+                continue
+            half = len(items) // 2
+            left = self._best_value_row(weights, values, items[:half], limit)
+            right = self._best_value_row(weights, values, items[half:], limit)
+            split = int(np.argmax(left + right[::-1]))
+            pending.append((items[half:], limit - split))
+            pending.append((items[:half], split))
+
+        self.dp_table = None
+        self.solution_steps = []
+        self.selected_items = sorted(selected)
+        self.execution_time = time.time() - start_time
+        total_value = sum(values[i] for i in self.selected_items)
+
+        return {
+            'max_value': total_value,
+            'selected_items': self.selected_items,
+            'dp_table': self.dp_table,
+            'steps': self.solution_steps,
+            'execution_time': self.execution_time,
+            'total_weight': sum(weights[i] for i in self.selected_items),
+            'total_value': total_value
+        }
+
+    def _best_value_row(self, weights: List[int], values: List[int], items: np.ndarray,
+                        capacity: int) -> np.ndarray:
+        """
+        Verilen eşyalarla her kapasite için en iyi değeri tutan tek satırı hesaplar
+        """
+        size = capacity + 1
+        row = np.zeros(size, dtype=np.int64)
+        for i in items:
+            weight = weights[i]
+            if weight < size:
+                np.maximum(row[weight:], row[:size - weight] + values[i], out=row[weight:])
+        return row
+
+    def solve_bounded_knapsack(self, weights: List[int], values: List[int],
+                               counts: List[int], capacity: int,
+                               method: str = 'monotone_queue') -> Dict[str, Any]:
+        """
+        Her eşyanın stok adedi kadar kopyası alınabilen (bounded) knapsack çözümü
+
+        Args:
+            weights: Eşyaların ağırlıkları
+            values: Eşyaların değerleri
+            counts: Her eşyanın stok adedi
+            capacity: Çantanın kapasitesi
+            method: 'monotone_queue' (O(n·W)) veya 'binary_split' (O(W·Σlog c))
+
+        Returns:
+            Standart çözüm sözlüğü; 'selected_items' {eşya indeksi: adet} biçimindedir
+        """
+        if len(counts) != len(weights):
+            raise ValueError("Ağırlık ve stok listelerinin uzunluğu eşit olmalı")
+        if any(c < 0 for c in counts):
+            raise ValueError("Stok adetleri negatif olamaz")
+        if method not in ('monotone_queue', 'binary_split'):
+            raise ValueError(f"Bilinmeyen yöntem: {method}")
+
+        start_time = time.time()
+
+        n = len(weights)
+        # Tam tablo ve satır güncellemesinin geçici dizileri
+        self._reserve("Sınırlı knapsack DP",
+                      (n + 1) * (capacity + 1) * 8 + (capacity + 1) * 8 * ROW_UPDATE_TEMPS)
+        self.dp_table = np.zeros((n + 1, capacity + 1), dtype=np.int64)
+        self.solution_steps = []
+
+        for i in range(1, n + 1):
+            weight, value, count = weights[i-1], values[i-1], counts[i-1]
+            if method == 'monotone_queue':
+                self.dp_table[i] = _bounded_row_update(self.dp_table[i-1], weight, value, count)
+            else:
+                self.dp_table[i] = self._binary_split_row(self.dp_table[i-1], weight, value, count)
+
+        self.selected_items = self._backtrack_bounded(weights, values, counts, capacity)
+
+        self.execution_time = time.time() - start_time
+
+        return {
+            'max_value': self.dp_table[n][capacity],
+            'selected_items': self.selected_items,
+            'dp_table': self.dp_table,
+            'steps': self.solution_steps,
+            'execution_time': self.execution_time,
+            'total_weight': sum(weights[i] * q for i, q in self.selected_items.items()),
+            'total_value': sum(values[i] * q for i, q in self.selected_items.items())
+        }
+
+    @staticmethod
+    def _binary_split_row(row: np.ndarray, weight: int, value: int, count: int) -> np.ndarray:
+        """
+        Stok adedini 1, 2, 4, ... parçalarına bölüp her parçayı 0/1 eşya gibi uygular
+        """
+        row = row.copy()
+        remaining = count
+        chunk = 1
+        while remaining > 0:
+            take = min(chunk, remaining)
+            chunk_weight = weight * take
+            if chunk_weight < len(row):
+                candidate = row[:-chunk_weight] + value * take
+                np.maximum(row[chunk_weight:], candidate, out=row[chunk_weight:])
+            remaining -= take
+            chunk *= 2
+        return row
+
+    def _backtrack_bounded(self, weights: List[int], values: List[int],
+                           counts: List[int], capacity: int) -> Dict[int, int]:
+        """
+        DP tablosundan her eşyadan kaç adet alındığını geri çıkarır
+        """
+        n = len(weights)
+        selected = {}
+        w = capacity
+
+        for i in range(n, 0, -1):
+            weight, value = weights[i-1], values[i-1]
+            max_take = min(counts[i-1], w // weight)
+            if max_take == 0:
+                continue
+            takes = np.arange(max_take + 1)
+            candidates = self.dp_table[i-1][w - takes * weight] + takes * value
+            # Aynı değeri veren en küçük adet seçilir
+            quantity = int(np.argmax(candidates == self.dp_table[i][w]))
+            if quantity > 0:
+                selected[i-1] = quantity
+                w -= quantity * weight
+
+        return dict(sorted(selected.items()))
+
+    def solve_unbounded_knapsack(self, weights: List[int], values: List[int],
+                                 capacity: int, use_reduction: bool = True) -> Dict[str, Any]:
+        """
+        Her eşyadan sınırsız sayıda alınabilen (unbounded) knapsack çözümü
+
+        Tek boyutlu O(W) DP dizisi ve her kapasite için son iyileştiren eşya
+        tutulur. use_reduction açıkken baskın olunan eşyalar elenir ve çok büyük
+        kapasitelerde en verimli eşyanın periyodikliği kullanılarak DP kısaltılır.
+
+        Returns:
+            Standart çözüm sözlüğü; 'selected_items' {eşya indeksi: adet} biçimindedir
+        """
+        start_time = time.time()
+
+        n = len(weights)
+        self.solution_steps = []
+        candidates = _undominated_items(weights, values) if use_reduction else list(range(n))
+
+        reduced_capacity = capacity
+        periodic_copies = 0
+        best = None
+        if use_reduction and candidates:
+            # En verimli eşya dışındaki eşyaların toplam ağırlığı (w_b - 1)·w_max'ı aşmaz
+            best = max(candidates, key=lambda i: (values[i] * 1.0 / weights[i], -weights[i]))
+            bound = (weights[best] - 1) * max(weights[i] for i in candidates)
+            if capacity > bound:
+                periodic_copies = (capacity - bound) // weights[best]
+                reduced_capacity = capacity - periodic_copies * weights[best]
+
+        # DP satırı, son eşya dizisi ve satır güncellemesinin geçici dizileri
+        self._reserve("Sınırsız knapsack DP", (reduced_capacity + 1) * 8 * (2 + ROW_UPDATE_TEMPS))
+        dp = np.zeros(reduced_capacity + 1, dtype=np.int64)
+        last_item = np.full(reduced_capacity + 1, -1, dtype=np.int64)
+
+        for i in candidates:
+            updated = _bounded_row_update(dp, weights[i], values[i], reduced_capacity + 1)
+            last_item[updated > dp] = i
+            dp = updated
+
+        selected = {}
+        w = reduced_capacity
+        while last_item[w] >= 0:
+            item = int(last_item[w])
+            selected[item] = selected.get(item, 0) + 1
+            w -= weights[item]
+        if periodic_copies:
+            selected[best] = selected.get(best, 0) + periodic_copies
+
+        self.dp_table = dp[np.newaxis, :]
+        self.selected_items = dict(sorted(selected.items()))
+        self.execution_time = time.time() - start_time
+
+        return {
+            'max_value': dp[reduced_capacity] + periodic_copies * (values[best] if best is not None else 0),
+            'selected_items': self.selected_items,
+            'dp_table': self.dp_table,
+            'steps': self.solution_steps,
+            'execution_time': self.execution_time,
+            'total_weight': sum(weights[i] * q for i, q in self.selected_items.items()),
+            'total_value': sum(values[i] * q for i, q in self.selected_items.items()),
+            'reduction': {
+                'dominated_items': sorted(set(range(n)) - set(candidates)),
+                'periodic_item': best if periodic_copies else None,
+                'periodic_copies': periodic_copies,
+                'reduced_capacity': reduced_capacity
+            }
+        }
+
+    @staticmethod
+    def estimate_multidimensional_memory(n: int, capacities: List[int]) -> Dict[str, int]:
+        """
+        Çok boyutlu DP tablosunun bellek ihtiyacını (bayt) ayırmadan önce tahmin eder
+        """
+        cells = 1
+        for c in capacities:
+            cells *= int(c) + 1
+
+        value_bytes = cells * 8 * 2  # DP dizisi + aday değerler için tampon
+        mask_bytes = cells  # Eşyanın alındığı hücreler (paketlenmeden önce)
+        decision_bytes = n * ((cells + 7) // 8)  # Eşya başına bit paketli kararlar
+
+        return {
+            'cells': cells,
+            'value_bytes': value_bytes,
+            'mask_bytes': mask_bytes,
+            'decision_bytes': decision_bytes,
+            'total_bytes': value_bytes + mask_bytes + decision_bytes + ENGINE_OVERHEAD
+        }
+
+    def solve_multidimensional_knapsack(self, weights: List[List[int]], values: List[int],
+                                        capacities: List[int], engine: str = 'auto',
+                                        max_memory: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Ağırlık, hacim gibi d adet kısıtı olan çok boyutlu 0/1 knapsack çözümü
+
+        Args:
+            weights: Her eşya için d boyutlu ağırlık vektörü (n × d)
+            values: Eşyaların değerleri
+            capacities: Her boyut için kapasite (d)
+            engine: 'auto', 'dp' veya 'branch_and_bound'
+            max_memory: DP motoru için izin verilen en fazla bellek (bayt); verilmezse
+                çözücünün bütçesi, o da yoksa MULTIDIMENSIONAL_MEMORY kullanılır
+
+        Returns:
+            Standart çözüm sözlüğü; 'total_weight' boyut başına toplamlardır
+        """
+        weight_matrix = np.asarray(weights, dtype=np.int64).reshape(len(values), -1)
+        capacity_vector = np.asarray(capacities, dtype=np.int64)
+        if weight_matrix.shape[1] != len(capacity_vector):
+            raise ValueError("Ağırlık vektörleri ile kapasite boyutu eşleşmeli")
+        if engine not in ('auto', 'dp', 'branch_and_bound'):
+            raise ValueError(f"Bilinmeyen motor: {engine}")
+
+        start_time = time.time()
+
+        if max_memory is None:
+            max_memory = self.max_memory if self.max_memory is not None else MULTIDIMENSIONAL_MEMORY
+        memory = self.estimate_multidimensional_memory(len(values), capacity_vector)
+        fits = memory['total_bytes'] <= max_memory
+        if engine == 'dp' and not fits:
+            raise MemoryError(
+                f"DP tablosu {memory['total_bytes']:,} bayt gerektiriyor, sınır {max_memory:,} bayt"
+            )
+        if engine == 'auto':
+            engine = 'dp' if fits else 'branch_and_bound'
+
+        self.solution_steps = []
+        if engine == 'dp':
+            self.dp_table, selected = self._multidimensional_dp(weight_matrix, values, capacity_vector)
+        else:
+            self.dp_table = None
+            selected = self._multidimensional_branch_and_bound(weight_matrix, values, capacity_vector)
+
+        self.selected_items = selected
+        self.execution_time = time.time() - start_time
+
+        total_value = sum(values[i] for i in selected)
         return {
-            'selected_items': sorted(selected_greedy),
-            'total_weight': total_weight,
+            'max_value': total_value,
+            'selected_items': self.selected_items,
+            'dp_table': self.dp_table,
+            'steps': self.solution_steps,
+            'execution_time': self.execution_time,
+            'total_weight': weight_matrix[selected].sum(axis=0).tolist(),
             'total_value': total_value,
-            'efficiency_ratio': [values[i]/weights[i] for i in range(n)]
+            'engine': engine,
+            'memory_estimate': memory
         }
 
+    @staticmethod
+    def _multidimensional_dp(weight_matrix: np.ndarray, values: List[int],
+                             capacities: np.ndarray) -> Tuple[np.ndarray, List[int]]:
+        """
+        d boyutlu NumPy dizisi üzerinde eşya başına tek vektörel güncelleme yapar
+        """
+        shape = tuple(int(c) + 1 for c in capacities)
+        dp = np.zeros(shape, dtype=np.int64)
+        # Aday değerler ve alındı maskesi her eşyada yeniden kullanılır
+        slab = np.empty(dp.size, dtype=np.int64)
+        take = np.zeros(shape, dtype=bool)
+        decisions = []
+
+        for item_weights, value in zip(weight_matrix, values):
+            take.fill(False)
+            if np.all(item_weights <= capacities):
+                target = tuple(slice(int(w), None) for w in item_weights)
+                source = tuple(slice(0, s - int(w)) for s, w in zip(shape, item_weights))
+                region = tuple(s - int(w) for s, w in zip(shape, item_weights))
+                candidate = slab[:int(np.prod(region))].reshape(region)
+                np.add(dp[source], value, out=candidate)
+                np.greater(candidate, dp[target], out=take[target])
+                np.copyto(dp[target], candidate, where=take[target])
+            decisions.append(np.packbits(take.ravel()))
+
+        selected = []
+        position = capacities.copy()
+        for i in range(len(values) - 1, -1, -1):
+            flat = int(np.ravel_multi_index(tuple(position), shape))
+            if (decisions[i][flat >> 3] >> (7 - (flat & 7))) & 1:
+                selected.append(i)
+                position -= weight_matrix[i]
+
+        return dp, selected[::-1]
+
+    @staticmethod
+    def _multidimensional_branch_and_bound(weight_matrix: np.ndarray, values: List[int],
+                                           capacities: np.ndarray) -> List[int]:
+        """
+        Vekil (surrogate) gevşetmenin kesirli sınırı ile dal-sınır araması yapar
+
+        Kısıtlar 1/C_k çarpanlarıyla tek bir kısıta indirgenir; bu tek kısıtlı
+        problemin kesirli optimumu her düğümde üst sınır olarak kullanılır.
+        """
+        value_array = np.asarray(values, dtype=np.float64)
+        feasible = np.flatnonzero(np.all(weight_matrix <= capacities, axis=1))
+        scale = 1.0 / np.maximum(capacities, 1)
+        surrogate = weight_matrix[feasible] @ scale
+
+        order = feasible[np.argsort(-value_array[feasible] / np.maximum(surrogate, 1e-12), kind='stable')]
+        order_weights = weight_matrix[order]
+        order_values = value_array[order]
+        order_surrogate = weight_matrix[order] @ scale
+        prefix_surrogate = np.concatenate(([0.0], np.cumsum(order_surrogate)))
+        prefix_values = np.concatenate(([0.0], np.cumsum(order_values)))
+        m = len(order)
+
+        def upper_bound(index: int, value: float, used: np.ndarray) -> float:
+            residual = float((capacities - used) @ scale)
+            limit = prefix_surrogate[index] + residual
+            stop = int(np.searchsorted(prefix_surrogate, limit, side='right')) - 1
+            stop = max(index, min(stop, m))
+            bound = value + prefix_values[stop] - prefix_values[index]
+            if stop < m:
+                bound += order_values[stop] * (limit - prefix_surrogate[stop]) / order_surrogate[stop]
+            return bound
+
+        # Başlangıç çözümü: vekil verimlilik sırasıyla açgözlü doldurma
+        best_value = 0.0
+        best_set = []
+        used = np.zeros_like(capacities)
+        for k in range(m):
+            if np.all(used + order_weights[k] <= capacities):
+                used += order_weights[k]
+                best_value += order_values[k]
+                best_set.append(k)
+
+        stack = [(0, 0.0, np.zeros_like(capacities), [])]
+        while stack:
+            index, value, used, chosen = stack.pop()
+            if value > best_value:
+                best_value, best_set = value, chosen
+            # Değerler tam sayı olduğundan daha iyi bir çözüm en az best_value + 1 olmalı
+            if index == m or upper_bound(index, value, used) < best_value + 1 - 1e-9:
+                continue
+
+            # Önce dışlama dalını yığına koy ki dahil etme dalı önce işlensin
+            stack.append((index + 1, value, used, chosen))
+            new_used = used + order_weights[index]
+            if np.all(new_used <= capacities):
+                stack.append((index + 1, value + order_values[index], new_used, chosen + [index]))
+
+        return sorted(int(order[k]) for k in best_set)
+
+    def solve_multiple_choice_knapsack(self, weights: List[int], values: List[int],
+                                       groups: List[Any], capacity: int,
+                                       exactly_one: bool = False) -> Dict[str, Any]:
+        """
+        Her gruptan en fazla (veya tam) bir eşya seçilen çoktan seçmeli knapsack çözümü
+
+        Args:
+            weights: Eşyaların ağırlıkları
+            values: Eşyaların değerleri
+            groups: Her eşyanın grup etiketi
+            capacity: Çantanın kapasitesi
+            exactly_one: True ise her gruptan tam olarak bir eşya seçilir
+
+        Returns:
+            Standart çözüm sözlüğü; 'group_choices' grup başına seçilen eşyayı verir
+        """
+        if len(groups) != len(weights):
+            raise ValueError("Ağırlık ve grup listelerinin uzunluğu eşit olmalı")
+
+        start_time = time.time()
+
+        members = {}
+        for i, label in enumerate(groups):
+            members.setdefault(label, []).append(i)
+        labels = list(members)
+
+        weight_array = np.asarray(weights, dtype=np.int64)
+        value_array = np.asarray(values, dtype=np.int64)
+
+        # Değer satırları, seçim satırları, sonuç tablosu, en büyük grubun aday
+        # satırları ve satır başına geçiciler
+        row = (capacity + 1) * 8
+        largest = max((len(items) for items in members.values()), default=0)
+        self._reserve("Çoktan seçmeli knapsack DP",
+                      (3 * len(labels) + 2) * row + (largest + 1) * row + 4 * row)
+
+        rows = np.empty((len(labels) + 1, capacity + 1), dtype=np.int64)
+        rows[0] = 0
+        choices = []
+        pruned = []
+
+        for g, label in enumerate(labels, start=1):
+            group_items = _undominated_group_members(weight_array, value_array, members[label])
+            pruned.extend(sorted(set(members[label]) - set(group_items)))
+
+            # Aday satırlar: eşyayı almamak (izinliyse) ve gruptaki her eşya
+            candidates = np.full((len(group_items) + 1, capacity + 1), NEG_INF, dtype=np.int64)
+            if not exactly_one:
+                candidates[0] = rows[g-1]
+            for k, i in enumerate(group_items, start=1):
+                w = int(weight_array[i])
+                if w <= capacity:
+                    previous = rows[g-1][:capacity + 1 - w]
+                    candidates[k, w:] = np.where(previous > NEG_INF, previous + value_array[i], NEG_INF)
+
+            best = np.argmax(candidates, axis=0)
+            rows[g] = candidates[best, np.arange(capacity + 1)]
+            lookup = np.array([-1] + group_items, dtype=np.int64)
+            choices.append(np.where(rows[g] > NEG_INF, lookup[best], -1))
+
+        if rows[-1][capacity] == NEG_INF:
+            raise ValueError("Her gruptan bir eşya seçen uygun bir çözüm yok")
+
+        group_choices = {}
+        w = capacity
+        for g in range(len(labels), 0, -1):
+            item = int(choices[g-1][w])
+            group_choices[labels[g-1]] = item if item >= 0 else None
+            if item >= 0:
+                w -= weights[item]
+        group_choices = {label: group_choices[label] for label in labels}
+
+        self.dp_table = np.where(rows > NEG_INF, rows, -1)
+        self.solution_steps = []
+        self.selected_items = sorted(i for i in group_choices.values() if i is not None)
+        self.execution_time = time.time() - start_time
+
+        return {
+            'max_value': rows[-1][capacity],
+            'selected_items': self.selected_items,
+            'dp_table': self.dp_table,
+            'steps': self.solution_steps,
+            'execution_time': self.execution_time,
+            'total_weight': sum(weights[i] for i in self.selected_items),
+            'total_value': sum(values[i] for i in self.selected_items),
+            'group_choices': group_choices,
+            'pruned_items': sorted(pruned),
+            'lp_bound': _multiple_choice_lp_bound(weight_array, value_array,
+                                                  [members[label] for label in labels],
+                                                  capacity, exactly_one)
+        }
+
+    def solve_top_k(self, weights: List[int], values: List[int], capacity: int,
+                    k: int = 3) -> Dict[str, Any]:
+        """
+        En iyi k farklı eşya kümesini azalan değer sırasıyla bulur
+
+        Her DP hücresi en iyi k değeri tutar; yeni satır, önceki satırın
+        "alma" ve "al" listelerinin vektörel top-k birleşimidir. Toplam
+        maliyet O(k·n·W) olup k kez yeniden çözmeye gerek kalmaz.
+
+        Returns:
+            En iyi çözüm için standart sözlük ve 'alternatives' listesi
+        """
+        if k < 1:
+            raise ValueError("k en az 1 olmalı")
+
+        start_time = time.time()
+
+        n = len(weights)
+        size = capacity + 1
+        # Değer, karar ve kaynak sırası tabloları
+        self._reserve("En iyi k çözüm", (n + 1) * size * k * (8 + 1 + 4))
+        # top[i][w] = i eşyaya kadar, ağırlığı en fazla w olan en iyi k farklı kümenin değerleri
+        top = np.full((n + 1, size, k), NEG_INF, dtype=np.int64)
+        top[0, :, 0] = 0
+        took = np.zeros((n + 1, size, k), dtype=bool)
+        source_rank = np.zeros((n + 1, size, k), dtype=np.int32)
+        ranks = np.tile(np.arange(k, dtype=np.int32), 2)
+
+        for i in range(1, n + 1):
+            self._report_progress(i - 1, n)
+            weight, value = weights[i-1], values[i-1]
+            skip = top[i-1]
+            take = np.full((size, k), NEG_INF, dtype=np.int64)
+            if weight < size:
+                shifted = top[i-1, :size - weight]
+                take[weight:] = np.where(shifted > NEG_INF, shifted + value, NEG_INF)
+
+            merged = np.concatenate([skip, take], axis=1)
+            order = np.argsort(-merged, axis=1, kind='stable')[:, :k]
+            top[i] = np.take_along_axis(merged, order, axis=1)
+            took[i] = order >= k
+            source_rank[i] = ranks[order]
+
+        alternatives = []
+        for rank in range(k):
+            if top[n, capacity, rank] == NEG_INF:
+                break
+            selected = []
+            w, r = capacity, rank
+            for i in range(n, 0, -1):
+                taken, r = took[i, w, r], int(source_rank[i, w, r])
+                if taken:
+                    selected.append(i-1)
+                    w -= weights[i-1]
+            selected.reverse()
+            alternatives.append({
+                'rank': rank + 1,
+                'selected_items': selected,
+                'total_weight': sum(weights[i] for i in selected),
+                'total_value': sum(values[i] for i in selected)
+            })
+
+        self.dp_table = top[:, :, 0]
+        self.solution_steps = []
+        self.selected_items = alternatives[0]['selected_items']
+        self.execution_time = time.time() - start_time
+
+        return {
+            'max_value': self.dp_table[n][capacity],
+            'selected_items': self.selected_items,
+            'dp_table': self.dp_table,
+            'steps': self.solution_steps,
+            'execution_time': self.execution_time,
+            'total_weight': alternatives[0]['total_weight'],
+            'total_value': alternatives[0]['total_value'],
+            'alternatives': alternatives
+        }
+
+    def solve_sensitivity(self, weights: List[int], values: List[int],
+                          capacity: int) -> Dict[str, Any]:
+        """
+        Her eşya için zorla alındığında/dışarıda bırakıldığında en iyi değeri ve
+        optimal kümenin değişmeden kalacağı değer aralığını hesaplar
+
+        İleri tablo (ilk i eşya) bir kez doldurulur; geri satır (i'den sonraki
+        eşyalar) sondan başa güncellenirken her eşya için iki satırın
+        max-konvolüsyonu tek vektörel işlemle alınır. Toplam maliyet n kez
+        yeniden çözmenin O(n²·W)'si yerine O(n·W)'dir.
+
+        Returns:
+            Standart çözüm sözlüğü ve eşya başına dizileri içeren 'sensitivity':
+            'value_with', 'value_without', 'max_increase', 'max_decrease'
+            (sınırsız paylar np.inf, sığmayan eşyanın 'value_with'i -np.inf)
+        """
+        start_time = time.time()
+
+        n = len(weights)
+        size = capacity + 1
+        self._reserve("Duyarlılık analizi", (n + 1) * size * 8 + size * 8 * 4)
+        forward = np.zeros((n + 1, size), dtype=np.int64)
+        for i in range(n):
+            self._report_progress(i, n)
+            weight, value = weights[i], values[i]
+            forward[i + 1] = forward[i]
+            if weight < size:
+                np.maximum(forward[i + 1, weight:], forward[i, :size - weight] + value,
+                           out=forward[i + 1, weight:])
+
+        self.dp_table = forward
+        self.selected_items = self._backtrack_solution(weights, values, capacity)
+        best = int(forward[n, capacity])
+
+        value_with = np.full(n, -np.inf)
+        value_without = np.empty(n)
+        backward = np.zeros(size, dtype=np.int64)
+        for i in range(n - 1, -1, -1):
+            weight, value = weights[i], values[i]
+            # Kapasite ileri ve geri eşyalar arasında c + (W - c) olarak bölünür
+            value_without[i] = (forward[i] + backward[::-1]).max()
+            if weight < size:
+                rest = size - weight
+                value_with[i] = value + (forward[i, :rest] + backward[:rest][::-1]).max()
+                np.maximum(backward[weight:], backward[:rest] + value, out=backward[weight:])
+
+        selected = np.zeros(n, dtype=bool)
+        selected[self.selected_items] = True
+        max_increase = np.where(selected, np.inf, best - value_with)
+        max_decrease = np.where(selected, best - value_without, np.inf)
+
+        self.solution_steps = []
+        self.execution_time = time.time() - start_time
+
+        return {
+            'max_value': forward[n][capacity],
+            'selected_items': self.selected_items,
+            'dp_table': self.dp_table,
+            'steps': self.solution_steps,
+            'execution_time': self.execution_time,
+            'total_weight': sum(weights[i] for i in self.selected_items),
+            'total_value': sum(values[i] for i in self.selected_items),
+            'sensitivity': {
+                'value_with': value_with,
+                'value_without': value_without,
+                'max_increase': max_increase,
+                'max_decrease': max_decrease
+            }
+        }
+
+    def solve_parallel(self, weights: List[int], values: List[int], capacity: int,
+                       workers: Optional[int] = None,
+                       block_size: Optional[int] = None) -> Dict[str, Any]:
+        """
+        0/1 knapsack'i satır içi kapasite bloklarını iş parçacıklarına bölerek çözer
+
+        Her satırda önceki satır yalnızca okunur, yeni satır ayrı bir tampona
+        yazılır (çift tampon); bloklar birbirinden bağımsızdır. Büyük NumPy
+        işlemleri GIL'i bıraktığından bloklar gerçekten paralel çalışır.
+        Kararlar eşya başına bit paketli saklanır, değer tablosu tutulmaz.
+
+        Args:
+            workers: İş parçacığı sayısı (varsayılan: çekirdek sayısı)
+            block_size: Blok başına kapasite hücresi (8'in katına yuvarlanır)
+
+        Returns:
+            Standart çözüm sözlüğü; 'dp_table' yalnızca son satırı içerir
+        """
+        start_time = time.time()
+
+        n = len(weights)
+        size = capacity + 1
+        workers = max(1, workers or os.cpu_count() or 1)
+        if block_size is None:
+            # Küçük bloklar iş parçacığı yükünü artırır
+            block_size = max(-(-size // workers), 1 << 16)
+        block_size = -(-block_size // 8) * 8
+        blocks = [(lo, min(lo + block_size, size)) for lo in range(0, size, block_size)]
+        self._reserve("Bit paketli DP", sum(self.estimate_memory(n, capacity)['bitpacked'].values()))
+
+        current = np.zeros(size, dtype=np.int64)
+        following = np.empty(size, dtype=np.int64)
+        decisions = np.zeros((n, (size + 7) // 8), dtype=np.uint8)
+
+        def row_kernel(lo: int, hi: int, i: int) -> None:
+            weight, value = weights[i], values[i]
+            following[lo:hi] = current[lo:hi]
+            start = max(lo, weight)
+            if start >= hi:
+                return
+            candidate = current[start - weight:hi - weight] + value
+            take = candidate > current[start:hi]
+            np.copyto(following[start:hi], candidate, where=take)
+            mask = np.zeros(hi - lo, dtype=bool)
+            mask[start - lo:] = take
+            packed = np.packbits(mask)
+            decisions[i, lo // 8:lo // 8 + len(packed)] = packed
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for i in range(n):
+                # Satır bitmeden bir sonrakine geçilmez (satır sonu bariyeri)
+                self._report_progress(i, n)
+                list(pool.map(lambda bounds: row_kernel(bounds[0], bounds[1], i), blocks))
+                current, following = following, current
+
+        selected = []
+        w = capacity
+        for i in range(n - 1, -1, -1):
+            if (decisions[i, w >> 3] >> (7 - (w & 7))) & 1:
+                selected.append(i)
+                w -= weights[i]
+
+        self.dp_table = current[np.newaxis, :]
+        self.solution_steps = []
+        self.selected_items = selected[::-1]
+        self.execution_time = time.time() - start_time
+
+        return {
+            'max_value': current[capacity],
+            'selected_items': self.selected_items,
+            'dp_table': self.dp_table,
+            'steps': self.solution_steps,
+            'execution_time': self.execution_time,
+            'total_weight': sum(weights[i] for i in self.selected_items),
+            'total_value': sum(values[i] for i in self.selected_items),
+            'workers': workers,
+            'blocks_per_row': len(blocks)
+        }
+
+    @staticmethod
+    def _anytime_memory(n: int, capacity: int) -> Dict[str, int]:
+        """
+        solve_anytime aşamalarının ayırdığı baytlar
+
+        'local_search' en az bir aday sütunluk çift matrisidir; bütçenin
+        kalanı incelenen çift sayısını belirler. 'dp' bit paketli kararlar,
+        değer satırı ve satır geçicileridir (aday, karşılaştırma ve maske).
+        """
+        size = capacity + 1
+        return {
+            # Girdi dizileri, oranlar, açgözlü ve kesirli çözümün maskeleri ve indeksleri
+            'items': n * 8 * 16,
+            # Dal-sınır: sıralı önek dizileri ve her biri O(1) düğümlü yığın
+            'search': n * 8 * 8 + n * 3 * 256,
+            'local_search': n * ANYTIME_PAIR_BYTES,
+            # Önceki turun geçicileri yenileri ayrılırken hâlâ yaşar: iki aday satırı
+            'dp': n * ((size + 7) // 8) + size * 8 * 3 + size * 3
+        }
+
+    def solve_anytime(self, weights: List[int], values: List[int], capacity: int,
+                      time_budget: float = 1.0,
+                      max_memory: Optional[int] = 256 * 1024 ** 2) -> Dict[str, Any]:
+        """
+        Verilen süre içinde en iyi çözümü arayan ve optimallik açığını raporlayan çözüm
+
+        Açgözlü çözüm hemen elde edilir, yerel arama (ekleme / birebir
+        değiş-tokuş) ile iyileştirilir, kalan sürede bit paketli kararlarla
+        DP (bellek yetmezse dal-sınır) çalıştırılır. Süre dolduğunda eldeki
+        en iyi çözüm, LP üst sınırı ve açık döner.
+
+        Args:
+            time_budget: Saniye cinsinden süre bütçesi
+            max_memory: Tüm aşamalar için izin verilen en fazla bellek (bayt); yerel
+                aramadaki çift sayısı buna göre sınırlanır, DP sığmazsa dal-sınır
+                kullanılır
+
+        Returns:
+            Standart çözüm sözlüğü ve 'upper_bound', 'gap', 'optimal', 'phases'
+        """
+        start_time = time.time()
+        deadline = time.perf_counter() + time_budget
+        phases = []
+
+        weight_array = np.asarray(weights, dtype=np.int64)
+        value_array = np.asarray(values, dtype=np.int64)
+
+        memory = self._anytime_memory(len(weight_array), capacity)
+        base_bytes = memory['items'] + memory['search']
+        max_pairs = 4_000_000
+        if max_memory is not None:
+            max_pairs = min(max_pairs, max(max_memory - base_bytes, 0) // ANYTIME_PAIR_BYTES)
+
+        # 1. Açgözlü başlangıç çözümü ve LP üst sınırı
+        greedy = self.solve_greedy_comparison(weight_array, value_array, capacity)
+        taken = np.zeros(len(weight_array), dtype=bool)
+        taken[greedy['selected_items']] = True
+        fitting = np.flatnonzero(weight_array <= capacity)
+        if fitting.size:
+            best_single = fitting[np.argmax(value_array[fitting])]
+            if value_array[best_single] > greedy['total_value']:
+                taken[:] = False
+                taken[best_single] = True
+        # Değerler tam sayı olduğundan LP sınırı aşağı yuvarlanabilir
+        upper_bound = int(np.floor(greedy['fractional_value'] + 1e-9))
+        phases.append(('greedy', time.time() - start_time, int(value_array[taken].sum())))
+
+        # 2. Yerel arama
+        taken = self._local_search(weight_array, value_array, capacity, taken, deadline, max_pairs)
+        phases.append(('local_search', time.time() - start_time, int(value_array[taken].sum())))
+
+        # 3. Süre kalırsa kesin arama
+        optimal = int(value_array[taken].sum()) >= upper_bound
+        last_row = None
+        if not optimal and time.perf_counter() < deadline:
+            # Değer satırı ve satır geçicileri de bütçeye sayılır
+            if max_memory is None or base_bytes + memory['dp'] <= max_memory:
+                exact = self._deadline_dp(weight_array, value_array, capacity, deadline)
+                phase = 'dp'
+            else:
+                exact = self._deadline_branch_and_bound(weight_array, value_array, capacity,
+                                                        taken, deadline)
+                phase = 'branch_and_bound'
+            if exact is not None:
+                exact_taken, last_row, optimal = exact
+                if value_array[exact_taken].sum() >= value_array[taken].sum():
+                    taken = exact_taken
+            phases.append((phase, time.time() - start_time, int(value_array[taken].sum())))
+
+        incumbent = int(value_array[taken].sum())
+        if optimal:
+            upper_bound = incumbent
+
+        self.dp_table = last_row[np.newaxis, :] if last_row is not None else None
+        self.solution_steps = []
+        self.selected_items = np.flatnonzero(taken).tolist()
+        self.execution_time = time.time() - start_time
+
+        return {
+            'max_value': incumbent,
+            'selected_items': self.selected_items,
+            'dp_table': self.dp_table,
+            'steps': self.solution_steps,
+            'execution_time': self.execution_time,
+            'total_weight': int(weight_array[taken].sum()),
+            'total_value': incumbent,
+            'upper_bound': upper_bound,
+            'gap': (upper_bound - incumbent) / upper_bound if upper_bound > 0 else 0.0,
+            'optimal': optimal,
+            'phases': [{'phase': name, 'elapsed': elapsed, 'incumbent': value}
+                       for name, elapsed, value in phases]
+        }
+
+    @staticmethod
+    def _local_search(weights: np.ndarray, values: np.ndarray, capacity: int,
+                      taken: np.ndarray, deadline: float, max_pairs: int = 4_000_000) -> np.ndarray:
+        """
+        Ekleme ve birebir değiş-tokuş hamleleriyle çözümü süre dolana kadar iyileştirir
+        """
+        taken = taken.copy()
+        while time.perf_counter() < deadline:
+            residual = capacity - int(weights[taken].sum())
+            inside = np.flatnonzero(taken)
+            outside = np.flatnonzero(~taken & (weights <= residual + (weights[inside].max() if inside.size else 0)))
+            if outside.size == 0:
+                break
+
+            addable = outside[weights[outside] <= residual]
+            if addable.size:
+                taken[addable[np.argmax(values[addable])]] = True
+                continue
+
+            if inside.size * outside.size > max_pairs:
+                # En değerli adaylarla sınırla; tek sütun bile sığmıyorsa değiş-tokuş yapılmaz
+                keep = max_pairs // max(inside.size, 1)
+                if keep == 0:
+                    break
+                outside = outside[np.argsort(-values[outside], kind='stable')[:keep]]
+
+            gain = values[outside][np.newaxis, :] - values[inside][:, np.newaxis]
+            fits = weights[outside][np.newaxis, :] - weights[inside][:, np.newaxis] <= residual
+            gain = np.where(fits, gain, 0)
+            best = int(np.argmax(gain))
+            if gain.flat[best] <= 0:
+                break
+            row, col = divmod(best, outside.size)
+            taken[inside[row]] = False
+            taken[outside[col]] = True
+        return taken
+
+    @staticmethod
+    def _deadline_dp(weights: np.ndarray, values: np.ndarray, capacity: int,
+                     deadline: float) -> Optional[Tuple[np.ndarray, np.ndarray, bool]]:
+        """
+        Bit paketli kararlarla satır satır DP; süre dolarsa None döner
+        """
+        n = len(weights)
+        size = capacity + 1
+        row = np.zeros(size, dtype=np.int64)
+        decisions = np.zeros((n, (size + 7) // 8), dtype=np.uint8)
+
+        for i in range(n):
+            if time.perf_counter() >= deadline:
+                return None
+            weight = int(weights[i])
+            if weight < size:
+                candidate = row[:size - weight] + values[i]
+                take = candidate > row[weight:]
+                mask = np.zeros(size, dtype=bool)
+                mask[weight:] = take
+                decisions[i] = np.packbits(mask)
+                np.copyto(row[weight:], candidate, where=take)
+
+        taken = np.zeros(n, dtype=bool)
+        w = capacity
+        for i in range(n - 1, -1, -1):
+            if (decisions[i, w >> 3] >> (7 - (w & 7))) & 1:
+                taken[i] = True
+                w -= int(weights[i])
+        return taken, row, True
+
+    @staticmethod
+    def _deadline_branch_and_bound(weights: np.ndarray, values: np.ndarray, capacity: int,
+                                   incumbent: np.ndarray,
+                                   deadline: float) -> Tuple[np.ndarray, None, bool]:
+        """
+        Kesirli sınırlı derinlik öncelikli dal-sınır
+
+        Süre dolarsa o ana kadarki en iyi çözüm tamamlanmadı bilgisiyle döner.
+        """
+        order = np.argsort(-(values / weights), kind='stable')
+        order = order[weights[order] <= capacity]
+        order_weights = weights[order]
+        order_values = values[order]
+        prefix_weights = np.concatenate(([0], np.cumsum(order_weights)))
+        prefix_values = np.concatenate(([0], np.cumsum(order_values)))
+        m = len(order)
+
+        best_value = int(values[incumbent].sum())
+        best_set = None
+        # Seçimler (indeks, önceki) düğümlerinden oluşan paylaşılan bağlı listedir;
+        # yığın girdisi başına bellek derinlikten bağımsız kalır
+        stack = [(0, 0, 0, None)]
+        nodes = 0
+        completed = True
+        while stack:
+            nodes += 1
+            if nodes % 256 == 0 and time.perf_counter() >= deadline:
+                completed = False
+                break
+            index, weight, value, chosen = stack.pop()
+            if value > best_value:
+                best_value, best_set = value, chosen
+            if index == m:
+                continue
+
+            limit = prefix_weights[index] + capacity - weight
+            stop = max(index, int(np.searchsorted(prefix_weights, limit, side='right')) - 1)
+            bound = value + prefix_values[stop] - prefix_values[index]
+            if stop < m:
+                bound += order_values[stop] * (limit - prefix_weights[stop]) / order_weights[stop]
+            if bound < best_value + 1:
+                continue
+
+            stack.append((index + 1, weight, value, chosen))
+            if weight + order_weights[index] <= capacity:
+                stack.append((index + 1, weight + int(order_weights[index]),
+                              value + int(order_values[index]), (index, chosen)))
+
+        if best_set is None:
+            return incumbent.copy(), None, completed
+        taken = np.zeros(len(weights), dtype=bool)
+        while best_set is not None:
+            index, best_set = best_set
+            taken[order[index]] = True
+        return taken, None, completed
+
+    def solve_by_value(self, weights: List[int], values: List[int],
+                       capacity: int) -> Dict[str, Any]:
+        """
+        Değer indeksli DP: her toplam değer için gereken en küçük ağırlığı tutar
+
+        O(n·Σv) sürer; değerler küçük, kapasite büyük olduğunda kapasite
+        indeksli DP'den çok daha ucuzdur.
+
+        Returns:
+            Standart çözüm sözlüğü; 'dp_table' son satırı (değer → en küçük ağırlık) içerir
+        """
+        start_time = time.time()
+
+        n = len(weights)
+        total = int(sum(values))
+        size = total + 1
+        unreachable = np.iinfo(np.int64).max
+        # Bit paketli kararlar, değer satırı ve satır başına aday / maske geçicileri
+        self._reserve("Değer indeksli DP", n * ((size + 7) // 8) + size * 8 * 4 + size * 4)
+        # min_weight[v] = tam olarak v değerine ulaşmak için gereken en küçük ağırlık
+        min_weight = np.full(size, unreachable, dtype=np.int64)
+        min_weight[0] = 0
+        decisions = np.zeros((n, (size + 7) // 8), dtype=np.uint8)
+
+        for i in range(n):
+            value, weight = int(values[i]), int(weights[i])
+            self._report_progress(i, n)
+            previous = min_weight[:size - value]
+            candidate = np.where(previous < unreachable, previous + weight, unreachable)
+            take = candidate < min_weight[value:]
+            np.copyto(min_weight[value:], candidate, where=take)
+            mask = np.zeros(size, dtype=bool)
+            mask[value:] = take
+            decisions[i] = np.packbits(mask)
+
+        best = int(np.flatnonzero(min_weight <= capacity).max())
+        selected = []
+        v = best
+        for i in range(n - 1, -1, -1):
+            if (decisions[i, v >> 3] >> (7 - (v & 7))) & 1:
+                selected.append(i)
+                v -= int(values[i])
+
+        self.dp_table = min_weight[np.newaxis, :]
+        self.solution_steps = []
+        self.selected_items = selected[::-1]
+        self.execution_time = time.time() - start_time
+
+        return {
+            'max_value': best,
+            'selected_items': self.selected_items,
+            'dp_table': self.dp_table,
+            'steps': self.solution_steps,
+            'execution_time': self.execution_time,
+            'total_weight': sum(weights[i] for i in self.selected_items),
+            'total_value': sum(values[i] for i in self.selected_items)
+        }
+
+    def solve_pareto(self, weights: List[int], values: List[int], capacity: int,
+                     max_states: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Nemhauser–Ullmann yöntemi: yalnızca baskın olmayan (ağırlık, değer) durumlarını tutar
+
+        Her eşyada durum listesinin kaydırılmış kopyası mevcut listeyle
+        birleştirilir ve baskın durumlar vektörel olarak elenir. Maliyet W veya
+        Σv'ye değil, gerçekte oluşan Pareto durumlarının sayısına bağlıdır.
+
+        Args:
+            max_states: Bir listede izin verilen en fazla durum (aşılırsa MemoryError)
+
+        Returns:
+            Standart çözüm sözlüğü; 'dp_table' yerine son Pareto cephesini tutan
+            'pareto_front' ((ağırlık, değer) satırları) ve 'peak_states'
+        """
+        start_time = time.time()
+
+        n = len(weights)
+        state_weights = np.zeros(1, dtype=np.int64)
+        state_values = np.zeros(1, dtype=np.int64)
+        parents = []
+        parent_bytes = 0
+        peak_states = 1
+
+        for i in range(n):
+            weight, value = weights[i], values[i]
+            self._report_progress(i, n)
+            count = len(state_weights)
+            # Durum sayısı önceden bilinmez; her birleştirme ayrılmadan önce denetlenir
+            self._reserve("Pareto DP", parent_bytes + 2 * count * PARETO_MERGE_BYTES + ENGINE_OVERHEAD)
+            fits = state_weights <= capacity - weight
+            merged_weights = np.concatenate([state_weights, state_weights[fits] + weight])
+            merged_values = np.concatenate([state_values, state_values[fits] + value])
+            merged_parents = np.concatenate([np.arange(count), np.flatnonzero(fits)])
+            merged_taken = np.arange(len(merged_weights)) >= count
+
+            # Ağırlığa göre artan, eşit ağırlıkta değere göre azalan sırala;
+            # kendinden önceki tüm durumlardan daha değerli olan durumlar kalır
+            order = np.lexsort((-merged_values, merged_weights))
+            sorted_values = merged_values[order]
+            keep = np.ones(len(order), dtype=bool)
+            keep[1:] = sorted_values[1:] > np.maximum.accumulate(sorted_values)[:-1]
+            order = order[keep]
+
+            state_weights = merged_weights[order]
+            state_values = merged_values[order]
+            parents.append((merged_parents[order], merged_taken[order]))
+            parent_bytes += len(order) * PARETO_PARENT_BYTES
+            peak_states = max(peak_states, len(order))
+            if max_states is not None and len(order) > max_states:
+                raise MemoryError(
+                    f"Pareto durum sayısı {len(order):,} eşya {i} noktasında "
+                    f"{max_states:,} sınırını aştı"
+                )
+
+        # Değerler ağırlıkla birlikte arttığından en iyi durum listenin sonudur
+        index = len(state_weights) - 1
+        selected = []
+        for i in range(n - 1, -1, -1):
+            parent, taken = parents[i]
+            if taken[index]:
+                selected.append(i)
+            index = int(parent[index])
+
+        self.dp_table = None
+        self.solution_steps = []
+        self.selected_items = selected[::-1]
+        self.execution_time = time.time() - start_time
+
+        return {
+            'max_value': int(state_values[-1]),
+            'selected_items': self.selected_items,
+            'dp_table': self.dp_table,
+            'steps': self.solution_steps,
+            'execution_time': self.execution_time,
+            'total_weight': sum(weights[i] for i in self.selected_items),
+            'total_value': sum(values[i] for i in self.selected_items),
+            'pareto_front': np.column_stack([state_weights, state_values]),
+            'peak_states': peak_states
+        }
+
+    @staticmethod
+    def _shift_or(bits: np.ndarray, shift: int, scratch: np.ndarray) -> None:
+        """
+        Bit kümesini yerinde günceller: bits |= bits << shift (taşan bitler atılır)
+        """
+        words = len(bits)
+        q, r = divmod(shift, 64)
+        if q >= words:
+            return
+        if r:
+            np.left_shift(bits[:words - q], np.uint64(r), out=scratch[q:])
+            scratch[q + 1:] |= bits[:words - q - 1] >> np.uint64(64 - r)
+        else:
+            scratch[q:] = bits[:words - q]
+        bits[q:] |= scratch[q:]
+
+    def solve_subset_sum(self, weights: List[int], capacity: int,
+                         checkpoint_interval: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Değer = ağırlık olan problemler için bit kümesi tabanlı subset-sum motoru
+
+        Ulaşılabilir toplamlar 64 bitlik kelimelere paketlenmiş bir bit kümesinde
+        tutulur ve her eşya için tek kaydır-veya işlemiyle güncellenir; bu, int64
+        DP satırından 64 kat az bellek ve iş demektir. Seçim, her
+        checkpoint_interval eşyada bir saklanan bit kümelerinden blok blok
+        yeniden hesaplanarak bulunur (varsayılan aralık √n).
+
+        Returns:
+            Standart çözüm sözlüğü; 'dp_table' yerine son bit kümesini tutan
+            'reachable' (c toplamı, c // 64. kelimenin c % 64. biti)
+        """
+        start_time = time.time()
+
+        n = len(weights)
+        words = (capacity + 1 + 63) // 64
+        interval = checkpoint_interval or max(1, int(np.ceil(np.sqrt(max(n, 1)))))
+        # Bit kümesi ve karalama dizisi, kontrol noktaları ve bir bloğun ara durumları
+        self._reserve("Subset-sum bit kümesi", words * 8 * (2 + -(-n // interval) + interval))
+
+        bits = np.zeros(words, dtype=np.uint64)
+        bits[0] = 1
+        scratch = np.empty(words, dtype=np.uint64)
+        top_word, top_bit = capacity >> 6, np.uint64(1) << np.uint64(capacity & 63)
+        checkpoints = []
+        processed = n
+
+        for i in range(n):
+            if i % interval == 0:
+                checkpoints.append(bits.copy())
+            self._report_progress(i, n)
+            self._shift_or(bits, int(weights[i]), scratch)
+            # Kapasite tam dolduysa kalan eşyalar sonucu değiştiremez
+            if bits[top_word] & top_bit:
+                processed = i + 1
+                break
+
+        # Kapasiteyi aşan bitleri atıp en büyük ulaşılabilir toplamı bul
+        if (capacity + 1) % 64:
+            bits[-1] &= np.uint64((1 << ((capacity + 1) % 64)) - 1)
+        nonzero = np.flatnonzero(bits)
+        best = int(nonzero[-1]) * 64 + int(bits[nonzero[-1]]).bit_length() - 1
+
+        selected = []
+        target = best
+        for block in range(len(checkpoints) - 1, -1, -1):
+            lo = block * interval
+            hi = min(lo + interval, processed)
+            # Blok içindeki ara durumları kontrol noktasından yeniden üret
+            states = [checkpoints[block]]
+            for i in range(lo, hi - 1):
+                state = states[-1].copy()
+                self._shift_or(state, int(weights[i]), scratch)
+                states.append(state)
+            for i in range(hi - 1, lo - 1, -1):
+                state = states[i - lo]
+                if not (int(state[target >> 6]) >> (target & 63)) & 1:
+                    selected.append(i)
+                    target -= int(weights[i])
+            checkpoints[block] = None
+
+        self.dp_table = None
+        self.solution_steps = []
+        self.selected_items = selected[::-1]
+        self.execution_time = time.time() - start_time
+
+        return {
+            'max_value': best,
+            'selected_items': self.selected_items,
+            'dp_table': self.dp_table,
+            'steps': self.solution_steps,
+            'execution_time': self.execution_time,
+            'total_weight': sum(weights[i] for i in self.selected_items),
+            'total_value': sum(weights[i] for i in self.selected_items),
+            'reachable': bits
+        }
+
+    def get_complexity_analysis(self, n: int, capacity: int) -> Dict[str, str]:
+        """
+        Algoritmanın zaman ve uzay karmaşıklığı analizini döner
+        """
+        return {
+            'time_complexity': f'O(n × W) = O({n} × {capacity}) = O({n * capacity})',
+            'space_complexity': f'O(n × W) = O({n} × {capacity}) = O({n * capacity})',
+            'explanation': {
+                'time': 'n eşya ve W kapasite için, her hücreyi bir kez hesaplıyoruz',
+                'space': 'DP tablosu n×W boyutunda 2D array gerektiriyor'
+            }
+        }
+    
+    def solve_greedy_comparison(self, weights: List[int], values: List[int], 
+                               capacity: int) -> Dict[str, Any]:
+        """
+        Karşılaştırma için açgözlü (greedy) yöntem ile çözüm
+
+        Kırılma eşyasına kadar olan eşyalar doğrusal zamanlı seçimle bulunur;
+        yalnızca kalan kapasiteye sığan sonraki eşyalar sıralanır. Kesirli
+        knapsack optimumu (LP üst sınırı) ve kırılma eşyası da döner.
+        """
+        weight_array = np.asarray(weights, dtype=np.int64)
+        value_array = np.asarray(values, dtype=np.int64)
+        ratio = value_array / weight_array
+
+        fractional = fractional_knapsack(weight_array, value_array, capacity)
+        taken = fractional['taken_mask'].copy()
+        break_item = fractional['break_item']
+
+        if break_item is not None:
+            residual = capacity - int(weight_array[taken].sum())
+            # Sıralamada kırılma eşyasından sonra gelen ve hâlâ sığabilen eşyalar
+            index = np.arange(len(weight_array))
+            after = (ratio < ratio[break_item]) | ((ratio == ratio[break_item]) & (index > break_item))
+            candidates = np.flatnonzero(after & (weight_array <= residual))
+            candidates = candidates[np.lexsort((candidates, -ratio[candidates]))]
+
+            # Tek sıralama ve kalan kapasiteyi taşıyan tek doğrusal geçiş; kalan
+            # adayların en hafifi bile sığmıyorsa geçiş erken biter
+            candidate_weights = weight_array[candidates]
+            lightest_after = np.minimum.accumulate(candidate_weights[::-1])[::-1].tolist()
+            chosen = []
+            for position, weight in enumerate(candidate_weights.tolist()):
+                if residual < lightest_after[position]:
+                    break
+                if weight <= residual:
+                    chosen.append(position)
+                    residual -= weight
+            taken[candidates[chosen]] = True
+
+        return {
+            'selected_items': np.flatnonzero(taken).tolist(),
+            'total_weight': int(weight_array[taken].sum()),
+            'total_value': int(value_array[taken].sum()),
+            'efficiency_ratio': ratio,
+            'fractional_value': fractional['upper_bound'],
+            'break_item': break_item
+        }
+
+
+def fractional_knapsack(weights, values, capacity: int) -> Dict[str, Any]:
+    """
+    Kesirli knapsack optimumunu ve kırılma eşyasını beklenen O(n) sürede bulur
+
+    Sıralama yerine ağırlıklı medyan seçimi kullanılır: oranlar bir pivot
+    etrafında bölünür ve yalnızca kapasitenin dolduğu parçaya inilir. Eşit
+    oranlı eşyalar indeks sırasıyla değerlendirilir. Sonuç her kesin motor
+    için bir LP üst sınırıdır.
+
+    Returns:
+        'upper_bound', 'break_item' (tümü sığarsa None), 'break_fraction' ve
+        tamamen alınan eşyaların 'taken_mask' dizisi
+    """
+    weight_array = np.asarray(weights, dtype=np.int64)
+    value_array = np.asarray(values, dtype=np.int64)
+    ratio = value_array / weight_array
+
+    taken = np.zeros(len(weight_array), dtype=bool)
+    remaining = capacity
+    index = np.arange(len(weight_array))
+    break_item = None
+    fraction = 0.0
+
+    while index.size:
+        current = ratio[index]
+        pivot = np.partition(current, len(current) // 2)[len(current) // 2]
+        higher = index[current > pivot]
+        equal = index[current == pivot]
+
+        higher_weight = int(weight_array[higher].sum())
+        if higher_weight > remaining:
+            index = higher
+            continue
+
+        cumulative = np.cumsum(weight_array[equal])
+        if higher_weight + cumulative[-1] > remaining:
+            fit = int(np.searchsorted(cumulative, remaining - higher_weight, side='right'))
+            taken[higher] = True
+            taken[equal[:fit]] = True
+            used = higher_weight + (int(cumulative[fit - 1]) if fit else 0)
+            break_item = int(equal[fit])
+            fraction = (remaining - used) / weight_array[break_item]
+            break
+
+        taken[higher] = True
+        taken[equal] = True
+        remaining -= higher_weight + int(cumulative[-1])
+        index = index[current < pivot]
+
+    upper_bound = float(value_array[taken].sum())
+    if break_item is not None:
+        upper_bound += fraction * value_array[break_item]
+
+    return {
+        'upper_bound': upper_bound,
+        'break_item': break_item,
+        'break_fraction': fraction,
+        'taken_mask': taken
+    }
+
 # Test fonksiyonu
 def test_knapsack():
     """
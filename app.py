@@ -3,6 +3,8 @@ import pandas as pd
 import numpy as np
 import sys
 import os
+import time
+import uuid
 from pathlib import Path
 
 # Ensure current directory is in path for imports
@@ -17,34 +19,69 @@ def safe_import():
         # Import algorithm module
         import algorithm
         KnapsackSolver = algorithm.KnapsackSolver
+        MEMORY_LEVEL_LABELS = algorithm.MEMORY_LEVEL_LABELS
         
         # Import utils module (now contains visualizer too)
         import utils
         KnapsackVisualizer = utils.KnapsackVisualizer
         load_sample_data = utils.load_sample_data
-        validate_input = utils.validate_input
         format_results = utils.format_results
         create_downloadable_results = utils.create_downloadable_results
         parse_list_input = utils.parse_list_input
         create_random_problem = utils.create_random_problem
+        INSTANCE_CLASSES = utils.INSTANCE_CLASSES
         display_problem_info = utils.display_problem_info
         calculate_problem_difficulty = utils.calculate_problem_difficulty
         get_algorithm_explanation = utils.get_algorithm_explanation
         export_to_csv = utils.export_to_csv
         
+        # Import planner module
+        import planner
+        plan_engine = planner.plan_engine
+        solve_with_plan = planner.solve_with_plan
+        ENGINE_LABELS = planner.ENGINE_LABELS
+        
+        # Import problem normalization module
+        import problem
+        check_problem = problem.check_problem
+        describe_errors = problem.describe_errors
+        
+        # Import result store module
+        import result_store
+        get_result_store = result_store.get_result_store
+        
+        # Import background job module
+        import solve_jobs
+        get_job_manager = solve_jobs.get_job_manager
+        
+        # Import precomputed instance library module
+        import instance_library
+        get_instance_library = instance_library.get_instance_library
+        
         return {
             'KnapsackSolver': KnapsackSolver,
+            'MEMORY_LEVEL_LABELS': MEMORY_LEVEL_LABELS,
             'KnapsackVisualizer': KnapsackVisualizer,
             'load_sample_data': load_sample_data,
-            'validate_input': validate_input,
             'format_results': format_results,
             'create_downloadable_results': create_downloadable_results,
             'parse_list_input': parse_list_input,
             'create_random_problem': create_random_problem,
+            'INSTANCE_CLASSES': INSTANCE_CLASSES,
             'display_problem_info': display_problem_info,
             'calculate_problem_difficulty': calculate_problem_difficulty,
             'get_algorithm_explanation': get_algorithm_explanation,
-            'export_to_csv': export_to_csv
+            'export_to_csv': export_to_csv,
+            'plan_engine': plan_engine,
+            'solve_with_plan': solve_with_plan,
+            'ENGINE_LABELS': ENGINE_LABELS,
+            'check_problem': check_problem,
+            'describe_errors': describe_errors,
+            'get_result_store': get_result_store,
+            'get_job_manager': get_job_manager,
+            'get_instance_library': get_instance_library,
+            'JOB_DONE': solve_jobs.JOB_DONE,
+            'JOB_CANCELLED': solve_jobs.JOB_CANCELLED
         }
         
     except ImportError as e:
@@ -64,17 +101,28 @@ def safe_import():
 modules = safe_import()
 if modules:
     KnapsackSolver = modules['KnapsackSolver']
+    MEMORY_LEVEL_LABELS = modules['MEMORY_LEVEL_LABELS']
     KnapsackVisualizer = modules['KnapsackVisualizer']
     load_sample_data = modules['load_sample_data']
-    validate_input = modules['validate_input']
     format_results = modules['format_results']
     create_downloadable_results = modules['create_downloadable_results']
     parse_list_input = modules['parse_list_input']
     create_random_problem = modules['create_random_problem']
+    INSTANCE_CLASSES = modules['INSTANCE_CLASSES']
     display_problem_info = modules['display_problem_info']
     calculate_problem_difficulty = modules['calculate_problem_difficulty']
     get_algorithm_explanation = modules['get_algorithm_explanation']
     export_to_csv = modules['export_to_csv']
+    plan_engine = modules['plan_engine']
+    solve_with_plan = modules['solve_with_plan']
+    ENGINE_LABELS = modules['ENGINE_LABELS']
+    check_problem = modules['check_problem']
+    describe_errors = modules['describe_errors']
+    get_result_store = modules['get_result_store']
+    get_job_manager = modules['get_job_manager']
+    get_instance_library = modules['get_instance_library']
+    JOB_DONE = modules['JOB_DONE']
+    JOB_CANCELLED = modules['JOB_CANCELLED']
 
 # Sayfa yapılandırması
 st.set_page_config(
@@ -88,6 +136,23 @@ st.set_page_config(
 st.title("🎒 Knapsack Problem Solver")
 st.markdown("**Abdullah Bakla** - Fırat Üniversitesi Algoritma ve Programlama II")
 
+# Büyük sonuçlar oturumda değil, paylaşılan depoda tutulur
+result_store = get_result_store()
+job_manager = get_job_manager()
+instance_library = get_instance_library()
+session_id = st.session_state.setdefault('session_id', uuid.uuid4().hex)
+poll_job = False
+
+
+def load_result():
+    """Oturumun son çözümünü depodan yükler; depodan çıkarılmışsa bildirir"""
+    handle = st.session_state.get('result_handle')
+    result = result_store.get(handle)
+    if handle is not None and result is None:
+        st.warning("⚠️ Önceki çözüm bellek sınırı nedeniyle silindi, lütfen yeniden çözün.")
+        del st.session_state['result_handle']
+    return result
+
 # Sidebar için problem seçimi
 st.sidebar.header("⚙️ Problem Ayarları")
 
@@ -131,7 +196,10 @@ if problem_type == "Manuel Girdi":
 
 elif problem_type == "Örnek Problemler":
     st.sidebar.subheader("📚 Örnek Problemler")
-    samples = load_sample_data()
+    # Kıyaslama örnekleri kütüphaneden bellek eşlemeli olarak okunur
+    samples = dict(load_sample_data())
+    for name in instance_library.names(benchmark=True):
+        samples[name] = instance_library.instance(name)
     
     selected_sample = st.sidebar.selectbox(
         "Örnek Seçin:",
@@ -148,13 +216,23 @@ elif problem_type == "Örnek Problemler":
 else:  # Rastgele Problem
     st.sidebar.subheader("🎲 Rastgele Problem")
     
-    num_items = st.sidebar.slider("Eşya Sayısı:", 3, 20, 8)
+    instance_kind = st.sidebar.selectbox(
+        "Problem Sınıfı:",
+        list(INSTANCE_CLASSES.keys()),
+        format_func=lambda kind: INSTANCE_CLASSES[kind]
+    )
+    num_items = st.sidebar.number_input("Eşya Sayısı:", min_value=3, max_value=1_000_000,
+                                        value=8, step=1)
     max_weight = st.sidebar.slider("Maksimum Ağırlık:", 5, 50, 20)
     max_value = st.sidebar.slider("Maksimum Değer:", 10, 100, 50)
     capacity_ratio = st.sidebar.slider("Kapasite Oranı:", 0.3, 0.8, 0.5)
+    seed = st.sidebar.number_input("Tohum (0 = her seferinde farklı):", min_value=0, value=0,
+                                   step=1)
     
     if st.sidebar.button("Yeni Rastgele Problem Oluştur"):
-        random_problem = create_random_problem(num_items, max_weight, max_value, capacity_ratio)
+        random_problem = create_random_problem(int(num_items), max_weight, max_value,
+                                               capacity_ratio, kind=instance_kind,
+                                               seed=int(seed) or None)
         st.session_state.random_weights = random_problem["weights"]
         st.session_state.random_values = random_problem["values"]
         st.session_state.random_capacity = random_problem["capacity"]
@@ -165,13 +243,24 @@ else:  # Rastgele Problem
         values = st.session_state.random_values
         capacity = st.session_state.random_capacity
 
-# Input validation
-valid_input, error_msg = validate_input(weights, values, capacity)
+# Oturumun sonuç deposu kullanımı
+usage = result_store.session_usage(session_id)
+if usage['results']:
+    st.sidebar.caption(
+        f"💾 Oturum belleği: {usage['memory_bytes'] / 1024 ** 2:.1f} MB RAM, "
+        f"{usage['disk_bytes'] / 1024 ** 2:.1f} MB disk"
+    )
+
+# Input validation: girdi bir kez salt okunur dizilere çevrilir, sonraki tüm adımlar bunları kullanır
+problem, input_errors = check_problem(weights, values, capacity)
 
-if not valid_input:
-    st.error(f"❌ {error_msg}")
+if problem is None:
+    for line in describe_errors(input_errors, weights, values):
+        st.error(f"❌ {line}")
     st.stop()
 
+weights, values, capacity = problem.weights, problem.values, problem.capacity
+
 # Ana içerik alanı
 tab1, tab2, tab3, tab4, tab5 = st.tabs([
     "📊 Problem Analizi", 
@@ -188,21 +277,111 @@ with tab1:
     difficulty = calculate_problem_difficulty(weights, values, capacity)
     st.info(f"**Problem Zorluğu:** {difficulty}")
     
-    # Çözümü çalıştır
+    # Motor planı
+    plan = plan_engine(weights, values, capacity, require_steps=True)
+    st.info(f"**Motor Planlayıcı:** {plan['explanation']}")
+    with st.expander("🧮 Motor Maliyet Tahminleri"):
+        plan_df = pd.DataFrame({
+            'Motor': list(plan['predictions'].keys()),
+            'Tahmini Süre (ms)': [f"{p['time'] * 1000:.2f}" for p in plan['predictions'].values()],
+            'Tahmini Bellek (MB)': [f"{p['memory'] / 1024 ** 2:.2f}" for p in plan['predictions'].values()],
+            'Bütçeye Sığar': ['✅' if p['fits'] else '❌' for p in plan['predictions'].values()]
+        })
+        st.dataframe(plan_df, use_container_width=True)
+    
+    num_alternatives = st.number_input(
+        "Listelenecek Alternatif Çözüm Sayısı:",
+        min_value=1,
+        max_value=10,
+        value=1,
+        step=1,
+        help="En iyi k farklı eşya kümesi azalan değer sırasıyla listelenir; 1'den büyük "
+             "değerler ek bir O(k·n×W) çözüm gerektirir"
+    )
+    
+    # Çözümü arka planda çalıştır; oturumda yalnızca iş kimliği tutulur
     if st.button("🚀 Problemi Çöz", type="primary"):
-        with st.spinner("Çözüm hesaplanıyor..."):
-            solver = KnapsackSolver()
-            result = solver.solve_knapsack_with_steps(weights, values, capacity)
+        # Kütüphanedeki örnekler için önceden hesaplanmış sonuç kullanılır
+        known = instance_library.lookup(weights, values, capacity)
+        
+        def solve_task(job, weights=weights, values=values, capacity=capacity,
+                       k=int(num_alternatives), engine=plan['engine'],
+                       budget=plan['memory_budget'], known=known):
+            if known is not None:
+                result = known
+            else:
+                job.stage = "Açgözlü başlangıç çözümü"
+                job.partial = job.solver().solve_greedy_comparison(weights, values, capacity)
+                
+                job.stage = ENGINE_LABELS[engine]
+                result = solve_with_plan(weights, values, capacity, require_steps=True,
+                                         solver=job.solver())
+                
+                # Duyarlılık analizi adım adım motorla aynı O(n×W) tabloyu gerektirir;
+                # yeniden çalıştırmalarda tekrarlanmasın diye sonuçla birlikte saklanır
+                if result.get('engine') == 'steps' and result['dp_table'] is not None:
+                    job.stage = "Duyarlılık analizi"
+                    sensitivity_solver = job.solver()
+                    sensitivity_solver.max_memory = budget
+                    try:
+                        result['sensitivity'] = sensitivity_solver.solve_sensitivity(
+                            weights, values, capacity)['sensitivity']
+                    except MemoryError as error:
+                        result['sensitivity_note'] = str(error)
             
-            # Sonuçları session state'e kaydet
-            st.session_state.result = result
-            st.session_state.solver = solver
+            if k > 1:
+                job.stage = "Alternatif çözümler"
+                alt_solver = job.solver()
+                alt_solver.max_memory = budget
+                try:
+                    result['alternatives'] = alt_solver.solve_top_k(weights, values, capacity,
+                                                                    k)['alternatives']
+                except MemoryError as error:
+                    result['alternatives_note'] = str(error)
+            return result
+        
+        if known is not None and int(num_alternatives) == 1:
+            # Alternatif istenmiyorsa arka plan işine gerek yok
+            result_store.release(st.session_state.get('result_handle'))
+            st.session_state.result_handle = result_store.put(known, session_id)
+        else:
+            st.session_state.job_id = job_manager.submit(session_id, solve_task).job_id
+    
+    # Yeniden çalıştırmalarda çalışan işe yeniden bağlan
+    job = job_manager.get(st.session_state.get('job_id'))
+    if job is not None and job.running:
+        poll_job = True
+        st.progress(min(job.progress, 1.0),
+                    text=f"⏳ {job.stage}... ({job.elapsed():.1f} sn)")
+        if job.partial is not None:
+            st.info(f"**Ara sonuç (açgözlü):** değer {job.partial['total_value']:,}, "
+                    f"ağırlık {job.partial['total_weight']}/{capacity}")
+        if st.button("⏹️ Çözümü İptal Et"):
+            job_manager.cancel(job.job_id)
+    elif job is not None and job.status == JOB_DONE:
+        # Önceki çözümü bırak, yenisini kullan
+        if st.session_state.get('result_handle') != job.result_handle:
+            result_store.release(st.session_state.get('result_handle'))
+            st.session_state.result_handle = job.result_handle
+        del st.session_state['job_id']
+    elif job is not None:
+        if job.status == JOB_CANCELLED:
+            st.warning(f"⏹️ Çözüm {job.elapsed():.1f} sn sonra iptal edildi.")
+        else:
+            st.error(f"❌ Çözüm başarısız: {job.error}")
+        if job.partial is not None:
+            st.info(f"**Kısmi sonuç (açgözlü):** değer {job.partial['total_value']:,}, "
+                    f"seçilen eşyalar {job.partial['selected_items']}")
     
     # Sonuçları göster
-    if 'result' in st.session_state:
-        result = st.session_state.result
+    result = load_result()
+    if result is not None:
         
         st.success("✅ Çözüm tamamlandı!")
+        if result.get('library'):
+            st.caption(f"📚 Sonuç örnek kütüphanesinden alındı (sürüm {result['library']['version']}, "
+                       f"ilk çözüm {result['library']['solve_time'] * 1000:.1f} ms, "
+                       f"LP üst sınırı {result['bounds']['upper']:,.1f})")
         
         # Sonuç metrikleri
         col1, col2, col3, col4 = st.columns(4)
@@ -219,17 +398,47 @@ with tab1:
         with col4:
             st.metric("Çalışma Süresi", f"{result['execution_time']*1000:.2f} ms")
         
+        # Çalışan motor ve optimallik kanıtı
+        engine_label = ENGINE_LABELS.get(result.get('engine'), "Örnek kütüphanesi")
+        if result.get('optimal'):
+            st.caption(f"⚙️ Motor: {engine_label} · ✅ Kanıtlanmış optimum")
+        else:
+            st.warning(f"⚙️ Motor: {engine_label} · ⚠️ Optimum kanıtlanamadı; üst sınır "
+                       f"{result['upper_bound']:,.1f}, optimallik açığı %{result['gap'] * 100:.2f}")
+        
+        # Bellek bütçesi nedeniyle yapılan motor düşürmeleri
+        memory = result.get('memory', {})
+        if memory.get('downgrades'):
+            st.warning(f"💾 Bellek bütçesi ({memory['budget'] / 1024 ** 2:.0f} MB) nedeniyle "
+                       f"'{MEMORY_LEVEL_LABELS[memory['level']]}' kullanıldı: "
+                       + "; ".join(memory['downgrades']))
+        if result.get('alternatives_note'):
+            st.caption(f"Alternatif çözümler atlandı: {result['alternatives_note']}")
+        
         # Seçilen eşyalar
-        if result['selected_items']:
+        if len(result['selected_items']):
             st.subheader("🎯 Seçilen Eşyalar")
+            selected = np.asarray(result['selected_items'], dtype=np.int64)
             selected_df = pd.DataFrame({
-                'Eşya No': [i+1 for i in result['selected_items']],
-                'Ağırlık': [weights[i] for i in result['selected_items']],
-                'Değer': [values[i] for i in result['selected_items']],
-                'Verimlilik': [f"{values[i]/weights[i]:.2f}" for i in result['selected_items']]
+                'Eşya No': selected + 1,
+                'Ağırlık': weights[selected],
+                'Değer': values[selected],
+                'Verimlilik': np.round(problem.efficiency[selected], 2)
             })
             st.dataframe(selected_df, use_container_width=True)
         
+        # Alternatif çözümler
+        if len(result.get('alternatives', [])) > 1:
+            st.subheader("🔀 Alternatif Çözümler")
+            alternatives_df = pd.DataFrame({
+                'Sıra': [alt['rank'] for alt in result['alternatives']],
+                'Eşyalar': [', '.join(str(i+1) for i in alt['selected_items']) or '-'
+                            for alt in result['alternatives']],
+                'Toplam Ağırlık': [alt['total_weight'] for alt in result['alternatives']],
+                'Toplam Değer': [alt['total_value'] for alt in result['alternatives']]
+            })
+            st.dataframe(alternatives_df, use_container_width=True)
+        
         # İndirme butonu
         download_data = create_downloadable_results(result, weights, values, capacity)
         st.download_button(
@@ -252,8 +461,8 @@ with tab1:
 with tab2:
     st.header("🔄 Adım Adım Çözüm Süreci")
     
-    if 'result' in st.session_state:
-        result = st.session_state.result
+    result = load_result()
+    if result is not None:
         visualizer = KnapsackVisualizer()
         
         if result['steps']:
@@ -266,10 +475,14 @@ with tab2:
             # Adım detaylarını göster
             visualizer.display_step_by_step(result['steps'], step_index)
             
-            # DP tablosu animasyonu
+            # DP tablosu animasyonu: yalnızca mevcut hücre etrafındaki pencere gönderilir
             if step_index < len(result['steps']):
-                current_table = result['steps'][step_index]['table_state']
-                fig_table = visualizer.create_dp_table_heatmap(current_table, step_index + 1)
+                window_cols = st.slider("Tablo Penceresi (kapasite sütunu):", 10, 200, 60)
+                view = result['steps'].viewport(step_index, rows=20, cols=window_cols)
+                fig_table = visualizer.create_dp_table_heatmap(
+                    view['table'], step_index + 1,
+                    row_offset=view['row_offset'], col_offset=view['col_offset']
+                )
                 st.plotly_chart(fig_table, use_container_width=True)
         
         # İlerleme grafiği
@@ -283,16 +496,19 @@ with tab2:
 with tab3:
     st.header("📈 Görselleştirmeler")
     
-    if 'result' in st.session_state:
-        result = st.session_state.result
+    result = load_result()
+    if result is not None:
         visualizer = KnapsackVisualizer()
         
         col1, col2 = st.columns(2)
         
         with col1:
-            # DP tablosu ısı haritası
-            fig_heatmap = visualizer.create_dp_table_heatmap(result['dp_table'])
-            st.plotly_chart(fig_heatmap, use_container_width=True)
+            # DP tablosu ısı haritası (düşük bellek seviyelerinde tablo tutulmaz)
+            if result['dp_table'] is not None:
+                fig_heatmap = visualizer.create_dp_table_heatmap(result['dp_table'])
+                st.plotly_chart(fig_heatmap, use_container_width=True)
+            else:
+                st.info("Bu çözüm için DP tablosu tutulmadı.")
         
         with col2:
             # Çanta görselleştirmesi
@@ -306,6 +522,16 @@ with tab3:
             weights, values, result['selected_items']
         )
         st.plotly_chart(fig_items, use_container_width=True)
+
+        # Duyarlılık analizi çözüm işinde bir kez hesaplanıp sonuçla saklanır
+        if result.get('sensitivity') is not None:
+            if st.checkbox("🎚️ Eşya Duyarlılık Analizini Göster"):
+                fig_sensitivity = visualizer.create_sensitivity_chart(result['sensitivity'])
+                st.plotly_chart(fig_sensitivity, use_container_width=True)
+                st.caption("Seçilen bir eşyanın değeri azalış payından fazla düşerse, seçilmeyen bir "
+                           "eşyanın değeri artış payından fazla artarsa optimal küme değişir.")
+        elif result.get('sensitivity_note'):
+            st.caption(f"Duyarlılık analizi atlandı: {result['sensitivity_note']}")
     else:
         st.info("Önce çözümü çalıştırın.")
 
@@ -313,20 +539,24 @@ with tab3:
 with tab4:
     st.header("⚡ Dinamik Programlama vs Açgözlü Yöntem")
     
-    if 'result' in st.session_state:
-        result = st.session_state.result
-        solver = st.session_state.solver
+    result = load_result()
+    if result is not None:
+        solver = KnapsackSolver()
         
         # Greedy çözümü
         greedy_result = solver.solve_greedy_comparison(weights, values, capacity)
         
         # Karşılaştırma tablosu
         comparison_df = pd.DataFrame({
-            'Yöntem': ['Dinamik Programlama', 'Açgözlü (Greedy)'],
+            'Yöntem': [ENGINE_LABELS.get(result.get('engine'), 'Dinamik Programlama'), 'Açgözlü (Greedy)'],
             'Toplam Değer': [result['total_value'], greedy_result['total_value']],
             'Toplam Ağırlık': [result['total_weight'], greedy_result['total_weight']],
             'Seçilen Eşya Sayısı': [len(result['selected_items']), len(greedy_result['selected_items'])],
-            'Optimallik': ['✅ Optimal', '❌ Optimal değil' if greedy_result['total_value'] < result['total_value'] else '✅ Bu durumda optimal']
+            'Optimallik': [
+                '✅ Optimal' if result.get('optimal') else f"⚠️ Yaklaşık (açık %{result['gap'] * 100:.2f})",
+                '❌ Optimal değil' if greedy_result['total_value'] < result['total_value']
+                else '✅ Bu durumda optimal' if result.get('optimal') else '❔ Kanıtlanamadı'
+            ]
         })
         
         st.dataframe(comparison_df, use_container_width=True)
@@ -352,8 +582,8 @@ with tab5:
     st.markdown(get_algorithm_explanation())
     
     # Komplekslik analizi
-    if 'result' in st.session_state:
-        solver = st.session_state.solver
+    if load_result() is not None:
+        solver = KnapsackSolver()
         complexity = solver.get_complexity_analysis(len(weights), capacity)
         
         st.subheader("🔍 Komplekslik Analizi")
@@ -388,6 +618,11 @@ function knapsack(weights, values, capacity):
     return dp[n][capacity]
 """, language="python")
 
+# Arka plan işi sürüyorsa ilerlemeyi yenilemek için kısa aralıklarla yeniden çalıştır
+if poll_job:
+    time.sleep(0.5)
+    st.rerun()
+
 # Footer
 st.markdown("---")
 st.markdown(
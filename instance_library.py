@@ -0,0 +1,338 @@
+import hashlib
+import json
+import os
+import stat
+import struct
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+from algorithm import KnapsackSolver, StepTrace, fractional_knapsack
+from utils import SAMPLE_PROBLEMS, generate_instance
+
+# Biçim veya çözücü çıktısı değişince artırılır; eski dosyalar yeniden oluşturulur
+LIBRARY_VERSION = 1
+LIBRARY_MAGIC = b'KNAPLIB\0'
+_PREAMBLE = struct.Struct('<8sII')
+_ALIGN = 64
+
+# Bu kadar hücreye kadar tam tablo ve adım kaydı da saklanır
+TABLE_CELL_LIMIT = 250_000
+
+# Kıyaslama örnekleri: (ad, eşya sayısı, sınıf, maksimum ağırlık, kapasite oranı, tohum)
+BENCHMARK_SPECS = (
+    ("Kıyas: İlişkisiz 200", 200, 'uncorrelated', 1000, 0.5, 1),
+    ("Kıyas: Güçlü İlişkili 200", 200, 'strongly_correlated', 1000, 0.5, 2),
+    ("Kıyas: Ters Güçlü İlişkili 200", 200, 'inverse_strongly_correlated', 1000, 0.5, 3),
+    ("Kıyas: Alt Küme Toplamı 100", 100, 'subset_sum', 1000, 0.5, 4),
+    ("Kıyas: Spanner 100", 100, 'spanner', 1000, 0.5, 5)
+)
+
+
+def instance_key(weights: Any, values: Any, capacity: int) -> str:
+    """
+    Örneğin içeriğinden türetilen, ada bağlı olmayan anahtar
+    """
+    digest = hashlib.sha1()
+    digest.update(np.ascontiguousarray(weights, dtype=np.int64).tobytes())
+    digest.update(b'|')
+    digest.update(np.ascontiguousarray(values, dtype=np.int64).tobytes())
+    digest.update(b'|%d' % int(capacity))
+    return digest.hexdigest()
+
+
+def library_instances() -> Dict[str, Dict[str, Any]]:
+    """
+    Kütüphaneye girecek örnek ve kıyaslama problemlerini döner
+    """
+    instances = {name: dict(sample) for name, sample in SAMPLE_PROBLEMS.items()}
+    for name, num_items, kind, max_weight, capacity_ratio, seed in BENCHMARK_SPECS:
+        instance = generate_instance(num_items, kind, max_weight, capacity_ratio=capacity_ratio,
+                                     seed=seed)
+        instance['benchmark'] = True
+        instances[name] = instance
+    return instances
+
+
+def default_library_path() -> str:
+    """
+    Kullanıcıya özel önbellek dizinindeki sürüm numaralı kütüphane dosyası
+
+    Paylaşılan geçici dizindeki tahmin edilebilir bir yol başka bir
+    kullanıcının hazırladığı dosyanın okunmasına yol açabilir.
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or os.environ.get('LOCALAPPDATA') or \
+        os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'knapsack', f'knapsack_library_v{LIBRARY_VERSION}.bin')
+
+
+def _is_trusted(info: os.stat_result, path: str) -> bool:
+    # Dosya bu kullanıcıya ait olmalı ve başkalarınca yazılamamalı; dizin de
+    # başkalarınca yazılabiliyorsa (yapışkan bit yoksa) dosya değiştirilebilir
+    if not hasattr(os, 'getuid'):
+        return True
+    if info.st_uid != os.getuid() or info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        return False
+    directory = os.stat(os.path.dirname(os.path.abspath(path)))
+    return not (directory.st_mode & (stat.S_IWGRP | stat.S_IWOTH)) or \
+        bool(directory.st_mode & stat.S_ISVTX)
+
+
+def _fingerprint() -> str:
+    # Örnek tanımları değişince dosya bayatlar; kıyaslamalar tohumlarından belirlenir
+    source = json.dumps([LIBRARY_VERSION, SAMPLE_PROBLEMS, BENCHMARK_SPECS], sort_keys=True)
+    return hashlib.sha1(source.encode('utf-8')).hexdigest()
+
+
+def build_library(path: str, instances: Optional[Dict[str, Dict[str, Any]]] = None) -> str:
+    """
+    Örnekleri çözer ve kütüphane dosyasını atomik olarak yazar
+
+    Dosya düzeni: sihirli sayı, sürüm, JSON başlık uzunluğu, JSON başlık
+    (örnek meta verileri ve dizi konumları), ardından 64 bayta hizalı ham
+    diziler. Her örnek için ağırlıklar, değerler, optimal seçim, DP
+    tablosunun son satırı ve LP üst / açgözlü alt sınırı saklanır; küçük
+    örneklerde tam tablo ve adım kaydı da eklenir.
+    """
+    instances = library_instances() if instances is None else instances
+    entries = {}
+    blobs = []
+    offset = 0
+
+    def add(array: np.ndarray) -> Dict[str, Any]:
+        nonlocal offset
+        array = np.ascontiguousarray(array)
+        spec = {'offset': offset, 'dtype': np.lib.format.dtype_to_descr(array.dtype),
+                'shape': list(array.shape)}
+        padding = -array.nbytes % _ALIGN
+        blobs.append(array.tobytes() + b'\0' * padding)
+        offset += array.nbytes + padding
+        return spec
+
+    for name, instance in instances.items():
+        weights = np.asarray(instance['weights'], dtype=np.int64)
+        values = np.asarray(instance['values'], dtype=np.int64)
+        capacity = int(instance['capacity'])
+        n = len(weights)
+        solver = KnapsackSolver()
+
+        start_time = time.time()
+        arrays = {'weights': add(weights), 'values': add(values)}
+        if (n + 1) * (capacity + 1) <= TABLE_CELL_LIMIT:
+            result = solver.solve_knapsack_with_steps(weights, values, capacity)
+            arrays['dp_table'] = add(result['dp_table'])
+            arrays['steps'] = add(result['steps'].records)
+            last_row = result['dp_table'][-1]
+        else:
+            result = solver.solve_parallel(weights, values, capacity)
+            last_row = solver._best_value_row(weights, values, np.arange(n), capacity)
+        arrays['selected_items'] = add(np.asarray(result['selected_items'], dtype=np.int64))
+        arrays['last_row'] = add(last_row)
+
+        entries[instance_key(weights, values, capacity)] = {
+            'name': name,
+            'description': instance.get('description', ''),
+            'benchmark': bool(instance.get('benchmark', False)),
+            'capacity': capacity,
+            'max_value': int(result['max_value']),
+            'total_weight': int(result['total_weight']),
+            'total_value': int(result['total_value']),
+            'upper_bound': float(fractional_knapsack(weights, values, capacity)['upper_bound']),
+            'lower_bound': int(solver.solve_greedy_comparison(weights, values, capacity)['total_value']),
+            'solve_time': time.time() - start_time,
+            'arrays': arrays
+        }
+
+    header = json.dumps({'version': LIBRARY_VERSION, 'fingerprint': _fingerprint(),
+                         'instances': entries}).encode('utf-8')
+    header += b' ' * (-(_PREAMBLE.size + len(header)) % _ALIGN)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.knapsack_library_')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_PREAMBLE.pack(LIBRARY_MAGIC, LIBRARY_VERSION, len(header)))
+            f.write(header)
+            for blob in blobs:
+                f.write(blob)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path
+
+
+class InstanceLibrary:
+    """
+    Çözülmüş örneklerin sürümlü, bellek eşlemeli kütüphanesi
+
+    Yalnızca JSON başlık okunur; diziler istendiğinde dosyanın bellek
+    eşlemesinden kopyasız, salt okunur görünümler olarak döner. Dosya yoksa,
+    güvenilir değilse, sürümü veya örnek tanımları değişmişse ilk erişimde
+    yeniden oluşturulur.
+    """
+
+    def __init__(self, path: str, auto_build: bool = True):
+        self.path = path
+        self.auto_build = auto_build
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._names: Dict[str, str] = {}
+        self._map: Optional[np.memmap] = None
+        self._data_offset = 0
+        self._lock = threading.Lock()
+
+    def _read_header(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path, 'rb') as f:
+                if not _is_trusted(os.fstat(f.fileno()), self.path):
+                    return None
+                magic, version, header_len = _PREAMBLE.unpack(f.read(_PREAMBLE.size))
+                if magic != LIBRARY_MAGIC or version != LIBRARY_VERSION:
+                    return None
+                header = json.loads(f.read(header_len))
+        except (OSError, struct.error, ValueError):
+            return None
+        if header.get('fingerprint') != _fingerprint():
+            return None
+        self._data_offset = _PREAMBLE.size + header_len
+        return header
+
+    def _ensure_index(self) -> Dict[str, Dict[str, Any]]:
+        if self._index is not None:
+            return self._index
+        with self._lock:
+            if self._index is None:
+                header = self._read_header()
+                if header is None and self.auto_build:
+                    try:
+                        build_library(self.path)
+                        header = self._read_header()
+                    except OSError:
+                        header = None
+                # Dosya kullanılamıyorsa kütüphane boş davranır, çağıranlar çözmeye düşer
+                instances = header['instances'] if header is not None else {}
+                self._names = {entry['name']: key for key, entry in instances.items()}
+                self._index = instances
+        return self._index
+
+    def _array(self, entry: Dict[str, Any], name: str) -> np.ndarray:
+        if self._map is None:
+            self._map = np.memmap(self.path, dtype=np.uint8, mode='r')
+        spec = entry['arrays'][name]
+        dtype = np.lib.format.descr_to_dtype(
+            spec['dtype'] if isinstance(spec['dtype'], str) else [tuple(f) for f in spec['dtype']])
+        start = self._data_offset + spec['offset']
+        count = int(np.prod(spec['shape'], dtype=np.int64))
+        return self._map[start:start + count * dtype.itemsize].view(dtype).reshape(spec['shape'])
+
+    def __len__(self) -> int:
+        return len(self._ensure_index())
+
+    def __contains__(self, name: str) -> bool:
+        self._ensure_index()
+        return name in self._names
+
+    def names(self, benchmark: Optional[bool] = None):
+        """
+        Kütüphanedeki örnek adları; benchmark verilirse yalnızca o türdekiler
+        """
+        return [entry['name'] for entry in self._ensure_index().values()
+                if benchmark is None or entry['benchmark'] == benchmark]
+
+    def instance(self, name: str) -> Dict[str, Any]:
+        """
+        Örneğin girdisini bellek eşlemeli dizilerle döner
+        """
+        entry = self._ensure_index()[self._names[name]]
+        return {
+            'weights': self._array(entry, 'weights'),
+            'values': self._array(entry, 'values'),
+            'capacity': entry['capacity'],
+            'description': entry['description']
+        }
+
+    def lookup(self, weights: Any, values: Any, capacity: int) -> Optional[Dict[str, Any]]:
+        """
+        Örnek kütüphanede varsa önceden hesaplanmış sonucu, yoksa None döner
+        """
+        index = self._ensure_index()
+        if not index:
+            return None
+        start_time = time.time()
+        entry = index.get(instance_key(weights, values, capacity))
+        if entry is None:
+            return None
+
+        dp_table = self._array(entry, 'dp_table') if 'dp_table' in entry['arrays'] else None
+        steps = []
+        if 'steps' in entry['arrays']:
+            steps = StepTrace(self._array(entry, 'steps'), self._array(entry, 'weights'),
+                              self._array(entry, 'values'), dp_table)
+        return {
+            'max_value': entry['max_value'],
+            'selected_items': self._array(entry, 'selected_items'),
+            'dp_table': dp_table,
+            'steps': steps,
+            'execution_time': time.time() - start_time,
+            'total_weight': entry['total_weight'],
+            'total_value': entry['total_value'],
+            'last_row': self._array(entry, 'last_row'),
+            'bounds': {'upper': entry['upper_bound'], 'lower': entry['lower_bound']},
+            # Kütüphane sonuçları kesin DP ile çözülmüştür
+            'optimal': True,
+            'upper_bound': float(entry['max_value']),
+            'gap': 0.0,
+            'library': {'name': entry['name'], 'version': LIBRARY_VERSION,
+                        'solve_time': entry['solve_time']}
+        }
+
+    def best_value(self, name: str, capacity: int) -> int:
+        """
+        Örneğin aynı eşyalarla daha küçük bir kapasitedeki optimumunu son DP satırından okur
+        """
+        entry = self._ensure_index()[self._names[name]]
+        if not 0 <= capacity <= entry['capacity']:
+            raise ValueError(f"Kapasite 0 ile {entry['capacity']} arasında olmalı")
+        return int(self._array(entry, 'last_row')[capacity])
+
+
+def solve_with_library(weights: Any, values: Any, capacity: int,
+                       solve: Optional[Callable[[], Dict[str, Any]]] = None,
+                       library: Optional[InstanceLibrary] = None) -> Dict[str, Any]:
+    """
+    Bilinen örnekler için kütüphane sonucunu döner, yalnızca ıskalamada çözer
+
+    solve verilmezse adım kaydı tutmayan vektörel motor kullanılır.
+    """
+    library = library or get_instance_library()
+    result = library.lookup(weights, values, capacity)
+    if result is not None:
+        return result
+    if solve is None:
+        return KnapsackSolver().solve_parallel(weights, values, capacity)
+    return solve()
+
+
+_LIBRARY: Optional[InstanceLibrary] = None
+_LIBRARY_LOCK = threading.Lock()
+
+
+def get_instance_library() -> InstanceLibrary:
+    """
+    Süreç genelinde paylaşılan örnek kütüphanesini döner
+
+    Dosya yolu KNAPSACK_LIBRARY_PATH ortam değişkeniyle ayarlanabilir;
+    varsayılan olarak kullanıcının önbellek dizininde sürüm numaralı bir
+    dosya kullanılır. Başka bir kullanıcıya ait veya başkalarınca
+    yazılabilen dosyalara güvenilmez, yeniden oluşturulur.
+    """
+    global _LIBRARY
+    with _LIBRARY_LOCK:
+        if _LIBRARY is None:
+            path = os.environ.get('KNAPSACK_LIBRARY_PATH') or default_library_path()
+            _LIBRARY = InstanceLibrary(path)
+        return _LIBRARY
@@ -0,0 +1,255 @@
+import math
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from algorithm import KnapsackSolver, STEP_DTYPE
+from problem import normalize_problem
+
+# Her motorun hücre başına süre katsayıları; calibrate() ile bu makinede ölçülür
+_CALIBRATION: Dict[str, float] = {}
+
+ENGINE_LABELS = {
+    'steps': 'Adım adım DP',
+    'parallel': 'Vektörel satır DP',
+    'value_dp': 'Değer indeksli DP',
+    'subset_sum': 'Bit kümesi subset-sum',
+    'pareto': 'Pareto durum listesi',
+    'anytime': 'Süre bütçeli yaklaşık çözüm'
+}
+
+
+def calibrate(force: bool = False) -> Dict[str, float]:
+    """
+    Motorların birim maliyetlerini küçük ölçüm problemleriyle bu makinede kalibre eder
+
+    Sonuçlar süreç boyunca önbellekte tutulur; force=True yeniden ölçer.
+    """
+    if _CALIBRATION and not force:
+        return _CALIBRATION
+
+    rng = np.random.default_rng(0)
+    solver = KnapsackSolver()
+
+    weights = rng.integers(1, 5000, 40).tolist()
+    values = rng.integers(1, 200, 40).tolist()
+
+    # Adım kaydı tutan motor: tam tablo + satır başına kayıt
+    start = time.perf_counter()
+    solver.solve_knapsack_with_steps(weights, values, 200_000)
+    steps_cell = (time.perf_counter() - start) / (40 * 200_001)
+
+    # Bit paketli vektörel motorlar: hücre başına süre
+    start = time.perf_counter()
+    solver.solve_parallel(weights, values, 200_000, workers=1)
+    parallel_cell = (time.perf_counter() - start) / (40 * 200_001)
+
+    start = time.perf_counter()
+    solver.solve_by_value(weights, values, 200_000)
+    value_cell = (time.perf_counter() - start) / (40 * (sum(values) + 1))
+
+    # Bit kümesi motoru: 64 bitlik kelime başına süre (tam doldurma erken bitirmesin diye çift ağırlıklar)
+    start = time.perf_counter()
+    solver.solve_subset_sum([2 * w for w in weights], 4_000_001)
+    bitset_word = (time.perf_counter() - start) / (40 * (4_000_002 / 64))
+
+    # Pareto listesi: eşya başına durum başına süre
+    start = time.perf_counter()
+    pareto = solver.solve_pareto(weights, values, 200_000)
+    pareto_state = (time.perf_counter() - start) / (40 * pareto['peak_states'])
+
+    _CALIBRATION.update({
+        'steps_cell': steps_cell,
+        'parallel_cell': parallel_cell,
+        'value_cell': value_cell,
+        'bitset_word': bitset_word,
+        'pareto_state': pareto_state
+    })
+    return _CALIBRATION
+
+
+def load_calibration(calibration: Dict[str, float]) -> None:
+    """
+    Başka bir süreçte ölçülmüş katsayıları yükler; calibrate() yeniden ölçmez
+
+    Süreç havuzlarında katsayılar ana süreçte bir kez ölçülür ve işçilere
+    başlatıcı (initializer) ile verilir.
+    """
+    _CALIBRATION.clear()
+    _CALIBRATION.update(calibration)
+
+
+def analyze_instance(weights: List[int], values: List[int], capacity: int) -> Dict[str, Any]:
+    """
+    Motor seçimini etkileyen problem özelliklerini çıkarır
+    """
+    # Kapasiteden ağır eşyalar planlamada geçerlidir, yalnızca hiçbir çözüme girmez
+    problem = normalize_problem(weights, values, capacity, require_fit=False)
+    weight_array, value_array = problem.weights, problem.values
+    weight_gcd, value_gcd = problem.weight_gcd, problem.value_gcd
+    if len(weight_array) > 1 and weight_array.std() > 0 and value_array.std() > 0:
+        correlation = float(np.corrcoef(weight_array, value_array)[0, 1])
+    else:
+        correlation = 1.0
+
+    return {
+        'n': problem.n,
+        'capacity': problem.capacity,
+        'total_value': problem.total_value,
+        'weight_gcd': weight_gcd,
+        'value_gcd': value_gcd,
+        # Ağırlıkların ortak böleni kapasite eksenini kısaltır
+        'scaled_capacity': problem.capacity // weight_gcd,
+        'scaled_total_value': problem.total_value // value_gcd,
+        'correlation': correlation,
+        # Değer = ağırlık ise problem subset-sum'dır
+        'subset_sum': problem.is_subset_sum
+    }
+
+
+def predict_costs(features: Dict[str, Any],
+                  calibration: Optional[Dict[str, float]] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Her motor için tahmini süre (saniye) ve tepe bellek (bayt) döner
+    """
+    calibration = calibration or calibrate()
+    n = features['n']
+    cells = n * (features['scaled_capacity'] + 1)
+    value_cells = n * (features['scaled_total_value'] + 1)
+    # Adım adım motor, gösterilen tablo gerçek kapasiteyle kalsın diye ölçeklenmez
+    step_cells = n * (features['capacity'] + 1)
+    table_bytes = (n + 1) * (features['capacity'] + 1) * 8
+    words = (features['scaled_capacity'] + 64) // 64
+    # Pareto durum sayısı 2^n, kapasite ve toplam değerle sınırlıdır
+    states = min(2 ** min(n, 62), features['scaled_capacity'] + 1, features['scaled_total_value'] + 1)
+
+    predictions = {
+        'steps': {
+            # Tam değer tablosu, satır başına geçici diziler ve eşya başına bir adım kaydı
+            'time': step_cells * calibration['steps_cell'],
+            'memory': table_bytes + (features['capacity'] + 1) * 8 * 4 + n * STEP_DTYPE.itemsize
+        },
+        'parallel': {
+            'time': cells * calibration['parallel_cell'],
+            'memory': (features['scaled_capacity'] + 1) * 8 * 3 + cells / 8
+        },
+        'value_dp': {
+            'time': value_cells * calibration['value_cell'],
+            'memory': (features['scaled_total_value'] + 1) * 8 * 3 + value_cells / 8
+        },
+        'pareto': {
+            # Üst sınır tahmini; gerçek durum sayısı genellikle çok daha küçüktür
+            'time': n * states * calibration['pareto_state'],
+            'memory': n * states * 9 + states * 8 * 6
+        },
+        'anytime': {
+            'time': 1.0,
+            'memory': n * 8 * 8
+        }
+    }
+    if features['subset_sum']:
+        # √n kontrol noktası ve yeniden üretilen bir blok kadar bit kümesi
+        predictions['subset_sum'] = {
+            'time': n * words * calibration['bitset_word'] * 2,
+            'memory': (2 * math.isqrt(max(n, 1)) + 4) * words * 8
+        }
+    return predictions
+
+
+def plan_engine(weights: List[int], values: List[int], capacity: int,
+                memory_budget: int = 512 * 1024 ** 2,
+                require_steps: bool = False) -> Dict[str, Any]:
+    """
+    Bellek bütçesine sığan en hızlı kesin motoru seçer ve gerekçesini açıklar
+
+    Args:
+        memory_budget: İzin verilen tepe bellek (bayt)
+        require_steps: True ise adım kaydı üreten motor sığdığı sürece tercih edilir
+
+    Returns:
+        'engine', 'features', 'predictions' ve Türkçe 'explanation'
+    """
+    features = analyze_instance(weights, values, capacity)
+    predictions = predict_costs(features)
+    for prediction in predictions.values():
+        prediction['fits'] = prediction['memory'] <= memory_budget
+
+    exact = [name for name in ('steps', 'parallel', 'value_dp', 'subset_sum', 'pareto')
+             if name in predictions and predictions[name]['fits']]
+    if require_steps and 'steps' in exact:
+        engine = 'steps'
+        reason = "adım adım görünüm istendiği ve bellek bütçesine sığdığı için"
+    elif exact:
+        engine = min(exact, key=lambda name: predictions[name]['time'])
+        reason = "bellek bütçesine sığan kesin motorlar arasında en hızlısı olduğu için"
+    else:
+        engine = 'anytime'
+        reason = "hiçbir kesin motor bellek bütçesine sığmadığı için"
+
+    explanation = (
+        f"{ENGINE_LABELS[engine]} seçildi: {reason}. "
+        f"Tahmini süre {predictions[engine]['time'] * 1000:.2f} ms, "
+        f"tahmini bellek {predictions[engine]['memory'] / 1024 ** 2:.2f} MB."
+    )
+    if engine in ('parallel', 'subset_sum') and features['weight_gcd'] > 1:
+        explanation += f" Ağırlıkların EBOB'u {features['weight_gcd']}, kapasite ekseni o oranda kısaltıldı."
+    if engine == 'anytime' and features['correlation'] > 0.9:
+        explanation += " Ağırlık ve değerler güçlü korelasyonlu; optimallik açığı yüksek kalabilir."
+
+    return {
+        'engine': engine,
+        'features': features,
+        'predictions': predictions,
+        'memory_budget': memory_budget,
+        'explanation': explanation
+    }
+
+
+def solve_with_plan(weights: List[int], values: List[int], capacity: int,
+                    memory_budget: int = 512 * 1024 ** 2, require_steps: bool = False,
+                    time_budget: float = 2.0, solver: Optional[KnapsackSolver] = None) -> Dict[str, Any]:
+    """
+    Planlayıcının seçtiği motorla çözer; sonuç sözlüğüne 'plan' ile çalışan
+    motoru, optimallik bayrağını, üst sınırı ve açığı ekler
+    """
+    # Girdi bir kez normalize edilir; planlayıcı ve motorlar aynı dizileri kopyalamadan kullanır
+    problem = normalize_problem(weights, values, capacity, require_fit=False)
+    weights, values, capacity = problem.weights, problem.values, problem.capacity
+    plan = plan_engine(weights, values, capacity, memory_budget, require_steps)
+    solver = solver or KnapsackSolver(max_memory=memory_budget)
+    if solver.max_memory is None:
+        solver.max_memory = memory_budget
+    gcd = plan['features']['weight_gcd']
+    scaled_weights = weights // gcd if gcd > 1 else weights
+
+    if plan['engine'] == 'steps':
+        # Tahmin aşılırsa bütçeye sığan bir alt seviyeye düşülür
+        result = solver.solve_within_budget(weights, values, capacity, time_budget=time_budget)
+    elif plan['engine'] == 'parallel':
+        result = solver.solve_parallel(scaled_weights, values, capacity // gcd)
+    elif plan['engine'] == 'subset_sum':
+        result = solver.solve_subset_sum(scaled_weights, capacity // gcd)
+        result['max_value'] = int(result['max_value']) * gcd
+    elif plan['engine'] == 'pareto':
+        result = solver.solve_pareto(weights, values, capacity)
+    elif plan['engine'] == 'value_dp':
+        value_gcd = plan['features']['value_gcd']
+        result = solver.solve_by_value(weights, values // value_gcd if value_gcd > 1 else values,
+                                       capacity)
+        result['max_value'] = int(result['max_value']) * value_gcd
+    else:
+        result = solver.solve_anytime(weights, values, capacity, time_budget=time_budget,
+                                      max_memory=memory_budget)
+
+    # Ölçeklenmiş ağırlık ve değerler yerine gerçek toplamları raporla
+    selected = np.asarray(result['selected_items'], dtype=np.int64)
+    result['total_weight'] = int(weights[selected].sum())
+    result['total_value'] = int(values[selected].sum())
+    # Kesin motorlar optimumu kanıtlar; yaklaşık çözüm kendi üst sınırını ve açığını taşır
+    if 'optimal' not in result:
+        result.update(optimal=True, upper_bound=float(result['max_value']), gap=0.0)
+    approximate = result.get('memory', {}).get('level') == 'approximate'
+    result['engine'] = 'anytime' if approximate else plan['engine']
+    result['plan'] = plan
+    return result
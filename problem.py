@@ -0,0 +1,229 @@
+import threading
+from collections import OrderedDict
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class ProblemValidationError(ValueError):
+    """
+    Girdi doğrulaması başarısız olduğunda fırlatılır; 'errors' tüm hataları içerir
+    """
+
+    def __init__(self, errors: List[Dict[str, Any]]):
+        self.errors = errors
+        super().__init__(errors[0]['message'])
+
+
+class KnapsackProblem:
+    """
+    Normalize edilmiş knapsack girdisi
+
+    Ağırlık ve değerler bitişik, salt okunur int64 dizileridir; türetilmiş
+    istatistikler ilk erişimde hesaplanıp saklanır. Aşağı akıştaki
+    fonksiyonlar bu dizileri kopyalamadan kullanır.
+    """
+
+    def __init__(self, weights: np.ndarray, values: np.ndarray, capacity: int):
+        self.weights = weights
+        self.values = values
+        self.capacity = capacity
+
+    @property
+    def n(self) -> int:
+        return len(self.weights)
+
+    @cached_property
+    def total_weight(self) -> int:
+        return int(self.weights.sum())
+
+    @cached_property
+    def total_value(self) -> int:
+        return int(self.values.sum())
+
+    @cached_property
+    def max_weight(self) -> int:
+        return int(self.weights.max())
+
+    @property
+    def mean_weight(self) -> float:
+        return self.total_weight / self.n
+
+    @property
+    def mean_value(self) -> float:
+        return self.total_value / self.n
+
+    @cached_property
+    def efficiency(self) -> np.ndarray:
+        """Değer/ağırlık oranları (salt okunur)"""
+        ratio = self.values / self.weights
+        ratio.flags.writeable = False
+        return ratio
+
+    @cached_property
+    def weight_gcd(self) -> int:
+        return int(np.gcd.reduce(self.weights))
+
+    @cached_property
+    def value_gcd(self) -> int:
+        return int(np.gcd.reduce(self.values))
+
+    @cached_property
+    def is_subset_sum(self) -> bool:
+        return bool(np.array_equal(self.weights, self.values))
+
+
+def _to_readonly_int64(data: Any, field: str, label: str,
+                       errors: List[Dict[str, Any]]) -> Optional[np.ndarray]:
+    # Zaten salt okunur, bitişik int64 diziler olduğu gibi döner; böylece kimlikleri
+    # korunur ve önbellek isabet eder. Yazılabilir int64 diziler kopyalanmaz,
+    # yalnızca salt okunur görünümü alınır
+    if isinstance(data, np.ndarray) and data.dtype == np.int64 and data.ndim == 1 \
+            and data.flags.c_contiguous and not data.flags.writeable:
+        return data
+    array = np.asarray(data)
+    if array.ndim != 1:
+        errors.append({'field': field, 'message': f"{label} tek boyutlu bir liste olmalı",
+                       'items': np.empty(0, dtype=np.int64)})
+        return None
+
+    if array.dtype.kind == 'f':
+        bad = np.flatnonzero(~np.isfinite(array) | (array != np.round(array)))
+        if len(bad):
+            errors.append({'field': field, 'message': f"Tüm {label.lower()} tam sayı olmalı",
+                           'items': bad})
+            return None
+    elif array.dtype.kind not in 'iub':
+        try:
+            array = np.asarray(array, dtype=np.int64)
+        except (TypeError, ValueError, OverflowError):
+            errors.append({'field': field, 'message': f"Tüm {label.lower()} tam sayı olmalı",
+                           'items': np.empty(0, dtype=np.int64)})
+            return None
+
+    array = np.ascontiguousarray(array, dtype=np.int64).view()
+    array.flags.writeable = False
+    return array
+
+
+def check_problem(weights: Any, values: Any, capacity: Any,
+                  require_fit: bool = True) -> Tuple[Optional[KnapsackProblem], List[Dict[str, Any]]]:
+    """
+    Girdiyi tek geçişte normalize eder ve vektörel olarak doğrular
+
+    Args:
+        require_fit: True ise kapasiteden ağır eşyalar da hata sayılır
+
+    Returns:
+        (KnapsackProblem veya None, hata listesi); her hata 'field', özet
+        'message' ve hatalı eşyaların indekslerini ('items') içerir
+    """
+    errors: List[Dict[str, Any]] = []
+    no_items = np.empty(0, dtype=np.int64)
+
+    if weights is None or values is None or len(weights) == 0 or len(values) == 0:
+        errors.append({'field': 'items', 'message': "Ağırlık ve değer listeleri boş olamaz",
+                       'items': no_items})
+        return None, errors
+
+    if len(weights) != len(values):
+        errors.append({'field': 'items',
+                       'message': "Ağırlık ve değer listelerinin uzunluğu eşit olmalı",
+                       'items': no_items})
+        return None, errors
+
+    weight_array = _to_readonly_int64(weights, 'weights', "Ağırlıklar", errors)
+    value_array = _to_readonly_int64(values, 'values', "Değerler", errors)
+    if weight_array is None or value_array is None:
+        return None, errors
+
+    bad_weights = np.flatnonzero(weight_array <= 0)
+    if len(bad_weights):
+        errors.append({'field': 'weights', 'message': "Tüm ağırlıklar pozitif olmalı",
+                       'items': bad_weights})
+    bad_values = np.flatnonzero(value_array <= 0)
+    if len(bad_values):
+        errors.append({'field': 'values', 'message': "Tüm değerler pozitif olmalı",
+                       'items': bad_values})
+
+    try:
+        capacity = int(capacity)
+    except (TypeError, ValueError):
+        capacity = 0
+    if capacity <= 0:
+        errors.append({'field': 'capacity', 'message': "Kapasite pozitif olmalı",
+                       'items': no_items})
+    elif require_fit:
+        too_heavy = np.flatnonzero(weight_array > capacity)
+        if len(too_heavy):
+            errors.append({'field': 'weights', 'message': "En az bir eşya çantaya sığmalı",
+                           'items': too_heavy})
+
+    if errors:
+        return None, errors
+    return _remember(KnapsackProblem(weight_array, value_array, capacity)), errors
+
+
+def describe_errors(errors: List[Dict[str, Any]], weights: Any = None, values: Any = None,
+                    max_items: int = 5) -> List[str]:
+    """
+    Hataları, hatalı eşyaları ve değerlerini listeleyen okunabilir satırlara çevirir
+    """
+    lines = []
+    for error in errors:
+        items = error['items']
+        if not len(items):
+            lines.append(error['message'])
+            continue
+        source = {'weights': weights, 'values': values}.get(error['field'])
+        shown = []
+        for index in items[:max_items]:
+            entry = f"eşya {int(index) + 1}"
+            if source is not None:
+                entry += f" ({source[int(index)]})"
+            shown.append(entry)
+        line = f"{error['message']}: " + ", ".join(shown)
+        if len(items) > max_items:
+            line += f" ve {len(items) - max_items} eşya daha"
+        lines.append(line)
+    return lines
+
+
+# Aynı dizilerle tekrar tekrar yapılan çağrılar için normalize edilmiş problemler
+_PROBLEM_CACHE: 'OrderedDict[Tuple[int, int, int], KnapsackProblem]' = OrderedDict()
+_PROBLEM_CACHE_SIZE = 16
+_PROBLEM_CACHE_LOCK = threading.Lock()
+
+
+def _remember(problem: KnapsackProblem) -> KnapsackProblem:
+    with _PROBLEM_CACHE_LOCK:
+        # Anahtar problemin kendi dizilerine bağlanır; diziler önbellekte yaşadıkça kimlikleri değişmez
+        _PROBLEM_CACHE[(id(problem.weights), id(problem.values), problem.capacity)] = problem
+        while len(_PROBLEM_CACHE) > _PROBLEM_CACHE_SIZE:
+            _PROBLEM_CACHE.popitem(last=False)
+    return problem
+
+
+def normalize_problem(weights: Any, values: Any = None, capacity: Any = None,
+                      require_fit: bool = True) -> KnapsackProblem:
+    """
+    Girdiyi KnapsackProblem'e çevirir; geçersizse ProblemValidationError fırlatır
+
+    Bir KnapsackProblem veya onun dizileri tekrar verilirse doğrulama ve
+    istatistikler yeniden hesaplanmaz.
+    """
+    if isinstance(weights, KnapsackProblem):
+        return weights
+
+    with _PROBLEM_CACHE_LOCK:
+        cached = _PROBLEM_CACHE.get((id(weights), id(values), capacity))
+        if cached is not None and cached.weights is weights and cached.values is values \
+                and not (require_fit and cached.max_weight > cached.capacity):
+            _PROBLEM_CACHE.move_to_end((id(weights), id(values), capacity))
+            return cached
+
+    problem, errors = check_problem(weights, values, capacity, require_fit)
+    if problem is None:
+        raise ProblemValidationError(errors)
+    return problem
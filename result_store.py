@@ -0,0 +1,228 @@
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from algorithm import StepTrace
+
+
+def _result_nbytes(result: Dict[str, Any]) -> int:
+    """
+    Sonuç sözlüğündeki büyük dizilerin bellekte kapladığı baytı hesaplar
+    """
+    total = 0
+    seen = set()
+    for value in result.values():
+        arrays = [value] if isinstance(value, np.ndarray) else []
+        if isinstance(value, StepTrace):
+            arrays = [value.records, value.dp_table]
+        for array in arrays:
+            # Bellek eşlemeli veya paylaşılan diziler bir kez sayılır
+            if id(array) in seen or isinstance(array, np.memmap):
+                continue
+            seen.add(id(array))
+            total += array.nbytes
+    return total
+
+
+class ResultStore:
+    """
+    Oturumlar arasında paylaşılan, sınırlı boyutlu çözüm sonucu deposu
+
+    Oturumda yalnızca kısa bir tanıtıcı (handle) tutulur; büyük diziler
+    buradadır. Toplam boyut max_bytes'ı aşınca en az yakın zamanda
+    kullanılan sonuçlar diske, bellek eşlemeli .npy dosyalarına taşınır
+    (spill_dir verilmişse) ya da tamamen çıkarılır.
+    """
+
+    def __init__(self, max_bytes: int = 512 * 1024 ** 2, spill_dir: Optional[str] = None,
+                 max_spill_bytes: int = 4 * 1024 ** 3):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.max_spill_bytes = max_spill_bytes
+        self._entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.RLock()
+        self._memory_bytes = 0
+        self._spilled_bytes = 0
+
+    def put(self, result: Dict[str, Any], session_id: str, owner: Any = None) -> str:
+        """
+        Sonucu depolar ve oturumda saklanacak tanıtıcıyı döner
+
+        owner verilirse (ör. SharedResult) sonuç silinince veya diske
+        taşınınca owner.release() çağrılır; paylaşılan bellek böylece depo
+        ile birlikte serbest kalır.
+
+        Tek başına max_bytes'ı aşan sonuç hemen diske taşınır; taşınamıyorsa
+        bırakılır ve MemoryError fırlatılır.
+        """
+        handle = uuid.uuid4().hex
+        size = _result_nbytes(result)
+        with self._lock:
+            self._entries[handle] = {
+                'result': result,
+                'session_id': session_id,
+                'memory_bytes': size,
+                'disk_bytes': 0,
+                'spill_path': None,
+                'owner': owner
+            }
+            self._memory_bytes += size
+            self._enforce_limits(keep=handle)
+        return handle
+
+    def get(self, handle: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Tanıtıcıya ait sonucu döner; çıkarılmışsa None döner
+        """
+        if handle is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(handle)
+            if entry is None:
+                return None
+            self._entries.move_to_end(handle)
+            return entry['result']
+
+    def release(self, handle: Optional[str]):
+        """
+        Tek bir sonucu bellekten ve diskten siler
+        """
+        with self._lock:
+            entry = self._entries.pop(handle, None)
+            if entry is not None:
+                self._discard(entry)
+
+    def release_session(self, session_id: str):
+        """
+        Bir oturuma ait tüm sonuçları siler
+        """
+        with self._lock:
+            for handle in [h for h, e in self._entries.items() if e['session_id'] == session_id]:
+                self._discard(self._entries.pop(handle))
+
+    def session_usage(self, session_id: str) -> Dict[str, int]:
+        """
+        Bir oturumun bellekte ve diskte kapladığı baytı raporlar
+        """
+        with self._lock:
+            entries = [e for e in self._entries.values() if e['session_id'] == session_id]
+            return {
+                'results': len(entries),
+                'memory_bytes': sum(e['memory_bytes'] for e in entries),
+                'disk_bytes': sum(e['disk_bytes'] for e in entries)
+            }
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Deponun toplam kullanımını raporlar
+        """
+        with self._lock:
+            return {
+                'results': len(self._entries),
+                'sessions': len({e['session_id'] for e in self._entries.values()}),
+                'memory_bytes': self._memory_bytes,
+                'disk_bytes': self._spilled_bytes,
+                'max_bytes': self.max_bytes
+            }
+
+    def _enforce_limits(self, keep: str):
+        for handle in list(self._entries):
+            if self._memory_bytes <= self.max_bytes:
+                break
+            entry = self._entries[handle]
+            if handle == keep or entry['memory_bytes'] == 0:
+                continue
+            if self._can_spill(entry):
+                self._spill(handle, entry)
+            else:
+                self._discard(self._entries.pop(handle))
+
+        # Diğerleri çıkarıldığı halde sınır aşılıyorsa yeni sonuç tek başına büyüktür
+        if self._memory_bytes > self.max_bytes:
+            entry = self._entries[keep]
+            if not self._can_spill(entry):
+                self._discard(self._entries.pop(keep))
+                raise MemoryError(
+                    f"Sonuç {entry['memory_bytes'] / 1024 ** 2:.1f} MB, depo sınırı "
+                    f"{self.max_bytes / 1024 ** 2:.1f} MB ve diske taşınamıyor"
+                )
+            self._spill(keep, entry)
+
+        # Disk sınırı aşılırsa en eski taşınmış sonuçlar silinir
+        for handle in list(self._entries):
+            if self._spilled_bytes <= self.max_spill_bytes:
+                break
+            if self._entries[handle]['spill_path'] is not None and handle != keep:
+                self._discard(self._entries.pop(handle))
+
+    def _can_spill(self, entry: Dict[str, Any]) -> bool:
+        return self.spill_dir is not None and \
+            self._spilled_bytes + entry['memory_bytes'] <= self.max_spill_bytes
+
+    def _spill(self, handle: str, entry: Dict[str, Any]):
+        path = os.path.join(self.spill_dir, handle)
+        os.makedirs(path, exist_ok=True)
+        result = dict(entry['result'])
+        mapped = {}
+
+        def spill_array(name: str, array: np.ndarray) -> np.ndarray:
+            if id(array) not in mapped:
+                file_name = os.path.join(path, f'{name}.npy')
+                np.save(file_name, array)
+                mapped[id(array)] = np.load(file_name, mmap_mode='r')
+            return mapped[id(array)]
+
+        for key, value in entry['result'].items():
+            if isinstance(value, np.ndarray) and not isinstance(value, np.memmap):
+                result[key] = spill_array(key, value)
+        for key, value in entry['result'].items():
+            if isinstance(value, StepTrace):
+                result[key] = StepTrace(spill_array(f'{key}_records', value.records),
+                                        value.weights, value.values,
+                                        spill_array(f'{key}_table', value.dp_table))
+
+        disk_bytes = sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+        self._memory_bytes -= entry['memory_bytes']
+        self._spilled_bytes += disk_bytes
+        self._release_owner(entry)
+        entry.update(result=result, memory_bytes=0, disk_bytes=disk_bytes, spill_path=path)
+
+    def _discard(self, entry: Dict[str, Any]):
+        self._memory_bytes -= entry['memory_bytes']
+        self._spilled_bytes -= entry['disk_bytes']
+        self._release_owner(entry)
+        if entry['spill_path'] is not None:
+            shutil.rmtree(entry['spill_path'], ignore_errors=True)
+
+    def _release_owner(self, entry: Dict[str, Any]):
+        if entry['owner'] is not None:
+            entry['owner'].release()
+            entry['owner'] = None
+
+
+_STORE: Optional[ResultStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_result_store() -> ResultStore:
+    """
+    Süreç genelinde paylaşılan sonuç deposunu döner
+
+    Sınırlar KNAPSACK_STORE_MAX_MB ve KNAPSACK_SPILL_DIR ortam
+    değişkenleriyle ayarlanabilir; taşma dizini verilmezse geçici bir dizin
+    kullanılır.
+    """
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            max_mb = int(os.environ.get('KNAPSACK_STORE_MAX_MB', 512))
+            spill_dir = os.environ.get('KNAPSACK_SPILL_DIR') or \
+                tempfile.mkdtemp(prefix='knapsack_results_')
+            _STORE = ResultStore(max_bytes=max_mb * 1024 ** 2, spill_dir=spill_dir)
+        return _STORE
@@ -0,0 +1,279 @@
+import asyncio
+import argparse
+import json
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from algorithm import KnapsackSolver
+from planner import calibrate, load_calibration, solve_with_plan
+from utils import validate_input
+
+SOLVE_MODES = ('01', 'bounded', 'unbounded')
+# İşçi süreç başına izin verilen tepe bellek; aşan istekler süreci öldürmeden reddedilir
+DEFAULT_MEMORY_BUDGET = 512 * 1024 ** 2
+
+
+def _solve_job(payload: Dict[str, Any],
+               memory_budget: int = DEFAULT_MEMORY_BUDGET) -> Dict[str, Any]:
+    """
+    İşçi süreçte çalışan çözüm işi; JSON'a çevrilebilir sonuç döner
+
+    Hiçbir motor bütçeyi aşacak şekilde bellek ayırmaz; sığmayan istekler
+    MemoryError ile biter ve havuz sağlam kalır.
+    """
+    solver = KnapsackSolver(max_memory=memory_budget)
+    weights, values, capacity = payload['weights'], payload['values'], payload['capacity']
+    mode = payload.get('mode', '01')
+
+    if mode == 'bounded':
+        result = solver.solve_bounded_knapsack(weights, values, payload['counts'], capacity)
+        selected = {str(i): int(q) for i, q in result['selected_items'].items()}
+    elif mode == 'unbounded':
+        result = solver.solve_unbounded_knapsack(weights, values, capacity)
+        selected = {str(i): int(q) for i, q in result['selected_items'].items()}
+    else:
+        # Planlayıcı bütçeye sığan en ucuz motoru seçer (subset-sum için bit kümesi dahil)
+        result = solve_with_plan(weights, values, capacity, memory_budget=memory_budget,
+                                 solver=solver)
+        selected = [int(i) for i in result['selected_items']]
+
+    # Sınırlı / sınırsız motorlar kesindir; 01 modunda bütçe yalnızca yaklaşık
+    # motora yetiyorsa istemci bunu 'optimal' ve 'gap' alanlarından görür
+    return {
+        'max_value': int(result['max_value']),
+        'selected_items': selected,
+        'total_weight': int(result['total_weight']),
+        'total_value': int(result['total_value']),
+        'execution_time': float(result['execution_time']),
+        'engine': result.get('engine', mode),
+        'optimal': bool(result.get('optimal', True)),
+        'upper_bound': float(result.get('upper_bound', result['max_value'])),
+        'gap': float(result.get('gap', 0.0))
+    }
+
+
+def _init_worker(calibration: Dict[str, float]):
+    # Planlayıcı katsayıları ana süreçte bir kez ölçülür; her işçide yeniden
+    # ölçüm bellek bütçesini aşan ölçüm tabloları ayırır
+    load_calibration(calibration)
+
+
+def parse_solve_request(body: bytes) -> Tuple[Optional[Dict[str, Any]], str]:
+    """
+    İstek gövdesini çözümler ve validate_input ile doğrular
+    """
+    try:
+        payload = json.loads(body.decode('utf-8'))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None, "Geçersiz JSON"
+
+    if not isinstance(payload, dict):
+        return None, "İstek bir JSON nesnesi olmalı"
+
+    mode = payload.get('mode', '01')
+    if mode not in SOLVE_MODES:
+        return None, f"Bilinmeyen mod: {mode}"
+
+    try:
+        weights = [int(w) for w in payload.get('weights', [])]
+        values = [int(v) for v in payload.get('values', [])]
+        capacity = int(payload.get('capacity', 0))
+        counts = [int(c) for c in payload['counts']] if mode == 'bounded' else None
+    except (TypeError, ValueError, KeyError):
+        return None, "weights, values, capacity (ve bounded için counts) tam sayı olmalı"
+
+    valid, message = validate_input(weights, values, capacity)
+    if not valid:
+        return None, message
+    if counts is not None and (len(counts) != len(weights) or any(c < 0 for c in counts)):
+        return None, "Stok adetleri eşya sayısı kadar ve negatif olmayan değerler olmalı"
+
+    request = {'mode': mode, 'weights': weights, 'values': values, 'capacity': capacity}
+    if counts is not None:
+        request['counts'] = counts
+    return request, "Geçerli girdi"
+
+
+def _failure_body(error: Exception) -> Dict[str, Any]:
+    return {'error': f"Çözüm başarısız: {str(error)}"}
+
+
+class SolveService:
+    """
+    Yerel asyncio HTTP çözüm servisi
+
+    POST /solve çözüm isteklerini süreç havuzuna dağıtır, aynı anda gelen özdeş
+    istekleri tek işte birleştirir ve kuyruk doluysa 503 ile geri çevirir.
+    GET /metrics gecikme yüzdeliklerini ve kuyruk derinliğini döner.
+    """
+
+    def __init__(self, workers: int = 2, max_queue: int = 64,
+                 executor: Optional[Executor] = None,
+                 memory_budget: int = DEFAULT_MEMORY_BUDGET):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.memory_budget = memory_budget
+        self.executor = executor
+        self._owns_executor = executor is None
+        self._slots = None
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._pending = 0
+        self._latencies = deque(maxlen=1000)
+        self._counters = {'completed': 0, 'coalesced': 0, 'rejected': 0, 'failed': 0}
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8765) -> asyncio.AbstractServer:
+        """
+        Sunucuyu başlatır ve asyncio sunucu nesnesini döner
+        """
+        if self.executor is None:
+            calibration = await asyncio.get_running_loop().run_in_executor(None, calibrate)
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                initargs=(dict(calibration),))
+        self._slots = asyncio.Semaphore(self.workers)
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+    def close(self):
+        """
+        Servisin sahip olduğu süreç havuzunu kapatır
+        """
+        if self._owns_executor and self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    async def solve(self, request: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        """
+        Doğrulanmış bir isteği çözer; (HTTP durum kodu, gövde) döner
+        """
+        key = json.dumps(request, sort_keys=True)
+        existing = self._in_flight.get(key)
+        if existing is not None:
+            self._counters['coalesced'] += 1
+            try:
+                return 200, await asyncio.shield(existing)
+            except Exception as e:
+                # Öncü işin hatası birleştirilen her isteğe aynı yanıtla döner
+                self._counters['failed'] += 1
+                return 500, _failure_body(e)
+
+        if self._pending >= self.max_queue:
+            self._counters['rejected'] += 1
+            return 503, {'error': "Kuyruk dolu, daha sonra tekrar deneyin"}
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        self._pending += 1
+        started = time.perf_counter()
+        try:
+            async with self._slots:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self.executor, _solve_job, request,
+                                                    self.memory_budget)
+            future.set_result(result)
+            self._counters['completed'] += 1
+            return 200, result
+        except Exception as e:
+            self._counters['failed'] += 1
+            future.set_exception(e)
+            # Birleştirilmiş bekleyen yoksa istisnanın alınmadı uyarısını önle
+            future.exception()
+            return 500, _failure_body(e)
+        finally:
+            self._pending -= 1
+            self._in_flight.pop(key, None)
+            self._latencies.append(time.perf_counter() - started)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Gecikme yüzdeliklerini (ms) ve kuyruk durumunu döner
+        """
+        latencies = np.asarray(self._latencies, dtype=np.float64) * 1000
+        percentiles = {}
+        if latencies.size:
+            p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+            percentiles = {'p50_ms': float(p50), 'p90_ms': float(p90), 'p99_ms': float(p99)}
+
+        return {
+            'queue_depth': self._pending,
+            'max_queue': self.max_queue,
+            'in_flight_unique': len(self._in_flight),
+            'workers': self.workers,
+            'latency': percentiles,
+            **self._counters
+        }
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter):
+        try:
+            request_line = (await reader.readline()).decode('latin-1').split()
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode('latin-1').strip()
+                if not line:
+                    break
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+            if len(request_line) < 2:
+                status, body = 400, {'error': "Geçersiz HTTP isteği"}
+            else:
+                method, path = request_line[0], request_line[1]
+                length = int(headers.get('content-length', 0) or 0)
+                payload = await reader.readexactly(length) if length else b''
+                status, body = await self._route(method, path, payload)
+        except (ValueError, asyncio.IncompleteReadError):
+            status, body = 400, {'error': "Geçersiz HTTP isteği"}
+
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        reason = {200: 'OK', 400: 'Bad Request', 404: 'Not Found',
+                  500: 'Internal Server Error', 503: 'Service Unavailable'}[status]
+        extra = 'Retry-After: 1\r\n' if status == 503 else ''
+        writer.write(
+            f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(data)}\r\n{extra}Connection: close\r\n\r\n".encode('latin-1') + data
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _route(self, method: str, path: str, payload: bytes) -> Tuple[int, Dict[str, Any]]:
+        if method == 'GET' and path == '/metrics':
+            return 200, self.metrics()
+        if method == 'POST' and path == '/solve':
+            request, message = parse_solve_request(payload)
+            if request is None:
+                return 400, {'error': message}
+            return await self.solve(request)
+        return 404, {'error': "Bulunamadı"}
+
+
+async def _serve(host: str, port: int, workers: int, max_queue: int, memory_budget: int):
+    service = SolveService(workers=workers, max_queue=max_queue, memory_budget=memory_budget)
+    server = await service.start(host, port)
+    print(f"🎒 Knapsack servisi http://{host}:{port} adresinde çalışıyor")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Yerel knapsack JSON çözüm servisi")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--max-queue', type=int, default=64)
+    parser.add_argument('--max-memory-mb', type=int, default=DEFAULT_MEMORY_BUDGET // 1024 ** 2,
+                        help="İşçi süreç başına çözüm bellek bütçesi (MB)")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(_serve(args.host, args.port, args.workers, args.max_queue,
+                           args.max_memory_mb * 1024 ** 2))
+    except KeyboardInterrupt:
+        pass
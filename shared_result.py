@@ -0,0 +1,174 @@
+from concurrent.futures import Executor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from algorithm import KnapsackSolver, StepTrace
+
+
+def _untrack(segment: SharedMemory):
+    # Sahiplik devredilen segmentler bu sürecin kaynak izleyicisinden çıkarılır;
+    # aksi halde süreç kapanırken tüketici hâlâ okurken silinir
+    try:
+        resource_tracker.unregister(segment._name, 'shared_memory')
+    except Exception:
+        pass
+
+
+def _unlink(name: str):
+    try:
+        segment = SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    segment.close()
+    segment.unlink()
+
+
+class SharedResult:
+    """
+    Büyük dizileri paylaşılan bellekte duran çözüm sonucu
+
+    Çalışan süreç export_result ile dizileri paylaşılan bellek
+    segmentlerine yazar ve yalnızca küçük, pickle edilebilir bir tanımlayıcı
+    (descriptor) gönderir. Tüketici attach_result ile segmentlere bağlanır;
+    'result' içindeki diziler kopyasız, salt okunur görünümlerdir.
+
+    Segmentlerin tek bir sahibi vardır: sahip release() ile segmentleri
+    siler, sahip olmayanlar yalnızca bağlantısını kapatır. Görünümler hâlâ
+    kullanılıyorsa bellek, son görünüm bırakılınca işletim sistemine döner.
+    """
+
+    def __init__(self, result: Dict[str, Any], segments: List[SharedMemory], owner: bool):
+        self.result = result
+        self.segments = segments
+        self.owner = owner
+        self.released = False
+
+    @property
+    def nbytes(self) -> int:
+        return sum(segment.size for segment in self.segments)
+
+    def release(self):
+        """
+        Segment bağlantılarını kapatır; sahipse segmentleri siler
+        """
+        if self.released:
+            return
+        self.released = True
+        self.result = None
+        for segment in self.segments:
+            if self.owner:
+                try:
+                    segment.unlink()
+                except FileNotFoundError:
+                    pass
+            try:
+                segment.close()
+            except BufferError:
+                # Dışarıda yaşayan görünümler eşlemeyi kendileri bırakır
+                pass
+        self.segments = []
+
+    def __enter__(self) -> 'SharedResult':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+def export_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Sonucun dizilerini paylaşılan belleğe yazar ve tanımlayıcıyı döner
+
+    dp_table, selected_items ve adım kaydı segmentlere taşınır; aynı dizi
+    (ör. adım kaydının tablosu ile dp_table) tek segmentte paylaşılır.
+    Sınırlı / sınırsız motorların {indeks: adet} seçimleri indeks ve adet
+    dizileri olarak paylaşılır.
+    Segmentlerin sahipliği tanımlayıcıyı attach_result ile açan sürece
+    geçer.
+    """
+    fields = {}
+    arrays = {}
+    counts = {}
+    traces = {}
+    segments = {}
+
+    def share(array: np.ndarray) -> Dict[str, Any]:
+        if id(array) not in segments:
+            segment = SharedMemory(create=True, size=max(array.nbytes, 1))
+            np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)[...] = array
+            segments[id(array)] = {'name': segment.name, 'shape': array.shape, 'dtype': array.dtype}
+            segment.close()
+            _untrack(segment)
+        return segments[id(array)]
+
+    try:
+        for key, value in result.items():
+            if key == 'selected_items' and isinstance(value, dict):
+                counts[key] = {
+                    'items': share(np.fromiter(value.keys(), dtype=np.int64, count=len(value))),
+                    'counts': share(np.fromiter(value.values(), dtype=np.int64, count=len(value)))
+                }
+            elif key == 'selected_items':
+                arrays[key] = share(np.asarray(value, dtype=np.int64))
+            elif isinstance(value, np.ndarray):
+                arrays[key] = share(value)
+            elif isinstance(value, StepTrace):
+                traces[key] = {'records': share(value.records), 'table': share(value.dp_table),
+                               'weights': value.weights, 'values': value.values}
+            else:
+                fields[key] = value
+    except BaseException:
+        for spec in segments.values():
+            _unlink(spec['name'])
+        raise
+
+    return {'fields': fields, 'arrays': arrays, 'counts': counts, 'traces': traces}
+
+
+def attach_result(descriptor: Dict[str, Any], owner: bool = True) -> SharedResult:
+    """
+    Tanımlayıcıdaki segmentlere bağlanır ve sonucu kopyasız görünümlerle kurar
+    """
+    segments = {}
+
+    def view(spec: Dict[str, Any]) -> np.ndarray:
+        if spec['name'] not in segments:
+            segments[spec['name']] = SharedMemory(name=spec['name'])
+            if not owner:
+                _untrack(segments[spec['name']])
+        array = np.ndarray(spec['shape'], dtype=spec['dtype'], buffer=segments[spec['name']].buf)
+        array.flags.writeable = False
+        return array
+
+    result = dict(descriptor['fields'])
+    for key, spec in descriptor['arrays'].items():
+        result[key] = view(spec)
+    for key, spec in descriptor['counts'].items():
+        # Seçim sözlükleri eşya sayısı kadar küçüktür; motorların döndürdüğü biçimde kurulur
+        result[key] = dict(zip(view(spec['items']).tolist(), view(spec['counts']).tolist()))
+    for key, spec in descriptor['traces'].items():
+        result[key] = StepTrace(view(spec['records']), spec['weights'], spec['values'],
+                                view(spec['table']))
+    return SharedResult(result, list(segments.values()), owner)
+
+
+def solve_to_shared(method: str, *args, max_memory: Optional[int] = None, **kwargs) -> Dict[str, Any]:
+    """
+    Çalışan süreçte KnapsackSolver metodunu çalıştırır ve paylaşılan bellek tanımlayıcısını döner
+
+    ProcessPoolExecutor'a gönderilebilen üst düzey fonksiyondur; büyük
+    diziler sürece geri pickle edilmez.
+    """
+    result = getattr(KnapsackSolver(max_memory=max_memory), method)(*args, **kwargs)
+    return export_result(result)
+
+
+def solve_in_process(executor: Executor, method: str, *args, **kwargs) -> SharedResult:
+    """
+    Çözümü süreç havuzunda çalıştırır ve sonucu sahibi olarak bağlar
+    """
+    descriptor = executor.submit(solve_to_shared, method, *args, **kwargs).result()
+    return attach_result(descriptor)
@@ -0,0 +1,159 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from algorithm import KnapsackSolver, SolveCancelled
+from result_store import ResultStore, get_result_store
+from shared_result import SharedResult
+
+JOB_RUNNING = 'running'
+JOB_DONE = 'done'
+JOB_CANCELLED = 'cancelled'
+JOB_FAILED = 'failed'
+
+
+class SolveJob:
+    """
+    Arka planda çalışan tek bir çözüm işi
+
+    İş parçacığı yalnızca bu nesnenin alanlarını günceller; arayüz her
+    yeniden çalıştırmada durumu, ilerlemeyi ve kısmi sonucu buradan okur.
+    """
+
+    def __init__(self, job_id: str, session_id: str):
+        self.job_id = job_id
+        self.session_id = session_id
+        self.status = JOB_RUNNING
+        self.stage = "Sırada"
+        self.progress = 0.0
+        self.partial: Optional[Dict[str, Any]] = None
+        self.result_handle: Optional[str] = None
+        self.error: Optional[str] = None
+        self.started = time.time()
+        self.finished: Optional[float] = None
+        self.cancel_event = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self.status == JOB_RUNNING
+
+    def solver(self) -> KnapsackSolver:
+        """
+        İlerlemeyi bu işe bildiren ve iptal edildiğinde duran bir çözücü döner
+        """
+        solver = KnapsackSolver()
+
+        def report(done: int, total: int) -> bool:
+            self.progress = done / max(total, 1)
+            return not self.cancel_event.is_set()
+
+        solver.progress_callback = report
+        return solver
+
+    def elapsed(self) -> float:
+        return (self.finished or time.time()) - self.started
+
+
+class SolveJobManager:
+    """
+    Oturumlara bağlı arka plan çözüm işlerini yürütür
+
+    İşler bir iş parçacığı havuzunda çalışır; sonuçlar ResultStore'a
+    yazılır ve oturumda yalnızca iş kimliği tutulur. Böylece arayüz
+    etkileşimiyle tetiklenen yeniden çalıştırmalar çalışan işe yeniden bağlanır.
+    """
+
+    def __init__(self, workers: int = 2, store: Optional[ResultStore] = None,
+                 max_finished: int = 256):
+        self.store = store or get_result_store()
+        self.max_finished = max_finished
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='knapsack-job')
+        self._jobs: Dict[str, SolveJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, session_id: str, task: Callable[[SolveJob], Dict[str, Any]]) -> SolveJob:
+        """
+        task(job) çağrısını arka planda başlatır; oturumun çalışan işi varsa önce iptal edilir
+
+        task, job.solver() ile çözücü almalı ve isteğe bağlı olarak job.partial
+        ile kısmi sonuç yayınlamalıdır. Süreç havuzunda çözen görevler
+        solve_in_process'in SharedResult'ını döndürebilir.
+        """
+        with self._lock:
+            for job in self._jobs.values():
+                if job.session_id == session_id and job.running:
+                    job.cancel_event.set()
+            job = SolveJob(uuid.uuid4().hex, session_id)
+            self._jobs[job.job_id] = job
+            self._prune()
+        self._executor.submit(self._run, job, task)
+        return job
+
+    def get(self, job_id: Optional[str]) -> Optional[SolveJob]:
+        """
+        Kimliği verilen işi döner; bilinmiyorsa None
+        """
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: Optional[str]) -> bool:
+        """
+        Çalışan işe iptal isteği gönderir; iş bir sonraki satırda durur
+        """
+        job = self.get(job_id)
+        if job is None or not job.running:
+            return False
+        job.cancel_event.set()
+        return True
+
+    def shutdown(self):
+        """
+        Çalışan tüm işleri iptal eder ve havuzu kapatır
+        """
+        with self._lock:
+            for job in self._jobs.values():
+                job.cancel_event.set()
+        self._executor.shutdown(wait=True)
+
+    def _run(self, job: SolveJob, task: Callable[[SolveJob], Dict[str, Any]]):
+        try:
+            if job.cancel_event.is_set():
+                raise SolveCancelled("Çözüm iptal edildi")
+            result = task(job)
+            # Süreç havuzundan gelen paylaşılan bellekli sonuçların sahipliği depoya geçer
+            if isinstance(result, SharedResult):
+                job.result_handle = self.store.put(result.result, job.session_id, owner=result)
+            else:
+                job.result_handle = self.store.put(result, job.session_id)
+            job.progress = 1.0
+            job.status = JOB_DONE
+        except SolveCancelled:
+            job.status = JOB_CANCELLED
+        except Exception as e:
+            job.error = str(e)
+            job.status = JOB_FAILED
+        finally:
+            job.finished = time.time()
+
+    def _prune(self):
+        # Biten en eski işler unutulur; sonuçları depoda kalır
+        finished = [job_id for job_id, job in self._jobs.items() if not job.running]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+
+_MANAGER: Optional[SolveJobManager] = None
+_MANAGER_LOCK = threading.Lock()
+
+
+def get_job_manager() -> SolveJobManager:
+    """
+    Süreç genelinde paylaşılan iş yöneticisini döner
+    """
+    global _MANAGER
+    with _MANAGER_LOCK:
+        if _MANAGER is None:
+            _MANAGER = SolveJobManager()
+        return _MANAGER
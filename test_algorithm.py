@@ -1,6 +1,9 @@
+import tracemalloc
+import time
+
 import pytest
 import numpy as np
-from algorithm import KnapsackSolver
+from algorithm import KnapsackSolver, fractional_knapsack
 
 class TestKnapsackSolver:
     """
@@ -101,6 +104,47 @@ class TestKnapsackSolver:
         assert 'total_weight' in greedy_result
         assert 'total_value' in greedy_result
         assert greedy_result['total_weight'] <= capacity
+
+    def test_greedy_scaling(self):
+        """Kırılma eşyasından sonraki tarama büyük girdide doğrusal kalmalı"""
+        self.setUp()
+        # Her turda yalnızca bir hafif eşya sığar, ardından gelen ağır eşya tam sığmaz
+        pairs = 100000
+        residual = pairs + 10
+        weights = [100, 10 ** 9]
+        values = [(10 ** 7 + 10) * 100, (10 ** 7 + 5) * 10 ** 9]
+        for j in range(pairs):
+            weights += [1, residual - j]
+            values += [(10 ** 7 - 2 * j), (10 ** 7 - 2 * j - 1) * (residual - j)]
+        capacity = 100 + residual
+
+        start = time.perf_counter()
+        greedy_result = self.solver.solve_greedy_comparison(weights, values, capacity)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1.0
+        assert greedy_result['total_weight'] == 100 + pairs
+        assert greedy_result['total_weight'] <= capacity
+        assert greedy_result['break_item'] == 1
+
+    def test_fractional_bound(self):
+        """Kesirli optimum ve kırılma eşyası testi"""
+        self.setUp()
+        weights = [10, 20, 30]
+        values = [60, 100, 120]
+        capacity = 50
+        
+        greedy_result = self.solver.solve_greedy_comparison(weights, values, capacity)
+        dp_result = self.solver.solve_knapsack_with_steps(weights, values, capacity)
+        
+        assert greedy_result['break_item'] == 2
+        assert greedy_result['fractional_value'] == pytest.approx(240.0)
+        assert greedy_result['fractional_value'] >= dp_result['max_value']
+        assert greedy_result['selected_items'] == [0, 1]
+        
+        bound = fractional_knapsack(weights, values, 100)
+        assert bound['break_item'] is None
+        assert bound['upper_bound'] == 280.0
     
     def test_complexity_analysis(self):
         """Komplekslik analizi testi"""
@@ -143,6 +187,578 @@ class TestKnapsackSolver:
             assert 'value' in step
             assert 'action' in step
             assert 'current_value' in step
+    
+    def test_compact_step_trace(self):
+        """Tüm hücreler kaydedildiğinde adım kaydı kompakt ve tembel olmalı"""
+        self.setUp()
+        weights = [2, 3]
+        values = [3, 4]
+        capacity = 4
+        
+        result = self.solver.solve_knapsack_with_steps(weights, values, capacity,
+                                                       record_all=True)
+        steps = result['steps']
+        
+        assert len(steps) == 2 * (capacity + 1)
+        assert steps.records.dtype.names == ('item', 'capacity', 'take_value',
+                                             'dont_take_value', 'chosen', 'decision')
+        assert steps[0]['action'] == 'Eşya 1 çok ağır (ağırlık: 2 > kapasite: 0)'
+        assert steps[2]['action'] == 'Eşya 1 alındı (değer: 3, ağırlık: 2)'
+        assert steps[-1]['current_value'] == result['max_value']
+        
+        # Tablo görüntüsü yalnızca o hücreye kadar doldurulmuş olmalı
+        table = steps[7]['table_state']
+        assert np.array_equal(table[1], result['dp_table'][1])
+        assert table[2, 2] == result['dp_table'][2, 2]
+        assert table[2, 3:].sum() == 0
+
+    def test_step_viewport(self):
+        """Pencere, tam tablo görüntüsünün ilgili dilimiyle aynı olmalı"""
+        self.setUp()
+        rng = np.random.default_rng(8)
+        weights = rng.integers(1, 50, 40).tolist()
+        values = rng.integers(1, 50, 40).tolist()
+
+        result = self.solver.solve_knapsack_with_steps(weights, values, 500, record_all=True)
+        steps = result['steps']
+        for index in (0, 777, len(steps) - 1):
+            view = steps.viewport(index, rows=10, cols=30)
+            r, c = view['row_offset'], view['col_offset']
+            full = steps[index]['table_state']
+
+            assert view['table'].shape == (10, 30)
+            assert np.array_equal(view['table'], full[r:r + 10, c:c + 30])
+            assert r <= view['item'] + 1 < r + 10
+            assert c <= view['capacity'] < c + 30
+
+class TestBoundedKnapsack:
+    """
+    Stok adetli (bounded) knapsack testleri
+    """
+
+    def setUp(self):
+        self.solver = KnapsackSolver()
+
+    def test_bounded_quantities(self):
+        """Seçimler eşya başına adet olarak dönmeli"""
+        self.setUp()
+        weights = [3, 4, 5]
+        values = [4, 5, 7]
+        counts = [2, 1, 3]
+        capacity = 15
+
+        result = self.solver.solve_bounded_knapsack(weights, values, counts, capacity)
+
+        assert result['max_value'] == 21  # 3 adet eşya 3
+        assert result['selected_items'] == {2: 3}
+        assert result['total_weight'] == 15
+
+    def test_methods_agree(self):
+        """Monoton kuyruk ve ikili bölme aynı sonucu vermeli"""
+        self.setUp()
+        weights = [2, 3, 7, 4]
+        values = [3, 5, 11, 6]
+        counts = [5, 200, 1, 3]
+        capacity = 40
+
+        queue = self.solver.solve_bounded_knapsack(weights, values, counts, capacity)
+        split = KnapsackSolver().solve_bounded_knapsack(weights, values, counts, capacity,
+                                                        method='binary_split')
+
+        assert queue['max_value'] == split['max_value']
+        assert queue['total_weight'] <= capacity
+        assert all(q <= counts[i] for i, q in queue['selected_items'].items())
+
+    def test_bounded_matches_duplicated_items(self):
+        """Eşyaları çoğaltarak çözülen 0/1 problemle aynı değeri vermeli"""
+        self.setUp()
+        weights = [4, 6, 9]
+        values = [7, 10, 16]
+        counts = [3, 2, 2]
+        capacity = 25
+
+        expanded_w = [w for w, c in zip(weights, counts) for _ in range(c)]
+        expanded_v = [v for v, c in zip(values, counts) for _ in range(c)]
+
+        bounded = self.solver.solve_bounded_knapsack(weights, values, counts, capacity)
+        classic = KnapsackSolver().solve_knapsack_with_steps(expanded_w, expanded_v, capacity)
+
+        assert bounded['max_value'] == classic['max_value']
+        assert bounded['dp_table'].shape == (4, 26)
+
+class TestUnboundedKnapsack:
+    """
+    Sınırsız (unbounded) knapsack testleri
+    """
+
+    def setUp(self):
+        self.solver = KnapsackSolver()
+
+    def test_unbounded_counts(self):
+        """Aynı eşyadan birden fazla adet seçilebilmeli"""
+        self.setUp()
+        weights = [5, 10, 15]
+        values = [10, 30, 20]
+        capacity = 100
+
+        result = self.solver.solve_unbounded_knapsack(weights, values, capacity)
+
+        assert result['max_value'] == 300
+        assert result['selected_items'] == {1: 10}
+        assert result['total_weight'] == 100
+        assert result['dp_table'].ndim == 2
+
+    def test_reduction_matches_plain_dp(self):
+        """Periyodiklik ve baskınlık indirgemesi sonucu değiştirmemeli"""
+        self.setUp()
+        weights = [7, 11, 13, 22]
+        values = [15, 25, 27, 40]
+        capacity = 5000
+
+        reduced = self.solver.solve_unbounded_knapsack(weights, values, capacity)
+        plain = KnapsackSolver().solve_unbounded_knapsack(weights, values, capacity,
+                                                          use_reduction=False)
+
+        assert reduced['max_value'] == plain['max_value']
+        assert reduced['total_value'] == reduced['max_value']
+        assert reduced['reduction']['reduced_capacity'] < capacity
+        assert 3 in reduced['reduction']['dominated_items']  # 2 × eşya 2 daha iyi
+
+class TestMultidimensionalKnapsack:
+    """
+    Çok boyutlu (ağırlık + hacim) knapsack testleri
+    """
+
+    def setUp(self):
+        self.solver = KnapsackSolver()
+        # (ağırlık, hacim) çiftleri
+        self.weights = [[3, 5], [4, 2], [2, 6], [5, 3], [1, 4]]
+        self.values = [10, 9, 8, 11, 4]
+        self.capacities = [9, 10]
+
+    def test_dp_engine(self):
+        """Küçük kapasitelerde N boyutlu DP kullanılmalı"""
+        self.setUp()
+        result = self.solver.solve_multidimensional_knapsack(self.weights, self.values,
+                                                             self.capacities)
+
+        assert result['engine'] == 'dp'
+        assert result['max_value'] == 21  # Eşya 0 ve 3
+        assert result['selected_items'] == [0, 3]
+        assert result['total_weight'] == [8, 8]
+        assert result['dp_table'].shape == (10, 11)
+
+    def test_engines_agree(self):
+        """Dal-sınır motoru DP ile aynı optimumu bulmalı"""
+        self.setUp()
+        dp = self.solver.solve_multidimensional_knapsack(self.weights, self.values,
+                                                         self.capacities, engine='dp')
+        bnb = KnapsackSolver().solve_multidimensional_knapsack(self.weights, self.values,
+                                                               self.capacities,
+                                                               engine='branch_and_bound')
+
+        assert dp['max_value'] == bnb['max_value']
+
+    def test_memory_budget(self):
+        """Bellek sınırı aşılırsa DP reddedilmeli, otomatik modda motor değişmeli"""
+        self.setUp()
+        large = [10 ** 6, 10 ** 6]
+
+        with pytest.raises(MemoryError):
+            self.solver.solve_multidimensional_knapsack(self.weights, self.values, large,
+                                                        engine='dp')
+
+        result = self.solver.solve_multidimensional_knapsack(self.weights, self.values, large)
+        assert result['engine'] == 'branch_and_bound'
+        assert result['max_value'] == sum(self.values)
+
+    def test_dp_stays_within_estimate(self):
+        """DP motorunun gerçek tepe ayırması kendi tahminini aşmamalı"""
+        self.setUp()
+        capacities = [3000, 2500]
+
+        tracemalloc.start()
+        result = self.solver.solve_multidimensional_knapsack(self.weights, self.values,
+                                                             capacities, engine='dp')
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert result['max_value'] == sum(self.values)
+        assert peak <= result['memory_estimate']['total_bytes']
+
+class TestMultipleChoiceKnapsack:
+    """
+    Gruplu (çoktan seçmeli) knapsack testleri
+    """
+
+    def setUp(self):
+        self.solver = KnapsackSolver()
+        self.weights = [2, 3, 5, 4, 6, 1, 3]
+        self.values = [3, 4, 8, 6, 7, 1, 2]
+        self.groups = ['S', 'S', 'S', 'M', 'M', 'L', 'L']
+
+    def test_one_item_per_group(self):
+        """Her gruptan en fazla bir eşya seçilmeli"""
+        self.setUp()
+        result = self.solver.solve_multiple_choice_knapsack(self.weights, self.values,
+                                                            self.groups, 9)
+
+        assert result['max_value'] == 14  # Eşya 2 ve 3
+        assert result['group_choices'] == {'S': 2, 'M': 3, 'L': None}
+        assert result['selected_items'] == [2, 3]
+        assert result['lp_bound'] >= result['max_value']
+
+    def test_exactly_one(self):
+        """Tam bir seçimde boş grup kalmamalı"""
+        self.setUp()
+        result = self.solver.solve_multiple_choice_knapsack(self.weights, self.values,
+                                                            self.groups, 9,
+                                                            exactly_one=True)
+
+        assert all(item is not None for item in result['group_choices'].values())
+        assert result['max_value'] == 11  # Eşya 1, 3 ve 5 ya da eşya 0, 3 ve 6
+        assert result['total_weight'] <= 9
+
+        with pytest.raises(ValueError):
+            self.solver.solve_multiple_choice_knapsack(self.weights, self.values,
+                                                       self.groups, 5, exactly_one=True)
+
+    def test_dominated_members_pruned(self):
+        """Daha ağır ve daha az değerli grup üyeleri elenmeli"""
+        self.setUp()
+        result = self.solver.solve_multiple_choice_knapsack([2, 3, 4], [5, 4, 9],
+                                                            ['A', 'A', 'A'], 10)
+
+        assert result['pruned_items'] == [1]
+        assert result['selected_items'] == [2]
+
+class TestTopKSolutions:
+    """
+    En iyi k çözüm testleri
+    """
+
+    def setUp(self):
+        self.solver = KnapsackSolver()
+
+    def test_top_k_order(self):
+        """Alternatifler farklı ve azalan değer sırasında olmalı"""
+        self.setUp()
+        weights = [10, 20, 30]
+        values = [60, 100, 120]
+        capacity = 50
+
+        result = self.solver.solve_top_k(weights, values, capacity, k=4)
+        alternatives = result['alternatives']
+
+        assert [alt['total_value'] for alt in alternatives] == [220, 180, 160, 120]
+        assert alternatives[0]['selected_items'] == [1, 2]
+        assert len({tuple(alt['selected_items']) for alt in alternatives}) == 4
+        assert result['max_value'] == 220
+
+    def test_fewer_subsets_than_k(self):
+        """Uygun küme sayısı k'den azsa hepsi dönmeli"""
+        self.setUp()
+        result = self.solver.solve_top_k([5], [10], 10, k=5)
+
+        assert [alt['selected_items'] for alt in result['alternatives']] == [[0], []]
+
+class TestSensitivityAnalysis:
+    """
+    Eşya duyarlılık analizi testleri
+    """
+
+    def setUp(self):
+        self.solver = KnapsackSolver()
+
+    def test_classic_margins(self):
+        """Zorla alma/bırakma değerleri ve paylar klasik örnekte doğru olmalı"""
+        self.setUp()
+        result = self.solver.solve_sensitivity([10, 20, 30], [60, 100, 120], 50)
+        sensitivity = result['sensitivity']
+
+        assert result['max_value'] == 220
+        assert sensitivity['value_with'].tolist() == [180, 220, 220]
+        assert sensitivity['value_without'].tolist() == [220, 180, 160]
+        assert sensitivity['max_increase'].tolist() == [40, np.inf, np.inf]
+        assert sensitivity['max_decrease'].tolist() == [np.inf, 40, 60]
+
+    def test_matches_resolving(self):
+        """Her eşya için sonuç, eşyayı çıkarıp/zorlayıp yeniden çözmeyle aynı olmalı"""
+        self.setUp()
+        rng = np.random.default_rng(5)
+        weights = rng.integers(1, 30, 12).tolist()
+        values = rng.integers(1, 50, 12).tolist()
+        capacity = 80
+
+        sensitivity = self.solver.solve_sensitivity(weights, values, capacity)['sensitivity']
+        for i in range(len(weights)):
+            rest_weights = weights[:i] + weights[i+1:]
+            rest_values = values[:i] + values[i+1:]
+            without = KnapsackSolver().solve_parallel(rest_weights, rest_values, capacity)
+            forced = KnapsackSolver().solve_parallel(rest_weights, rest_values, capacity - weights[i])
+            assert sensitivity['value_without'][i] == without['max_value']
+            assert sensitivity['value_with'][i] == forced['max_value'] + values[i]
+
+class TestSubsetSum:
+    """
+    Bit kümesi subset-sum motoru testleri
+    """
+
+    def setUp(self):
+        self.solver = KnapsackSolver()
+
+    def test_matches_dp(self):
+        """Bit kümesi motoru değer = ağırlık için DP ile aynı sonucu vermeli"""
+        self.setUp()
+        rng = np.random.default_rng(11)
+        for interval in (None, 1, 3):
+            weights = rng.integers(1, 500, 15).tolist()
+            capacity = int(rng.integers(100, 3000))
+
+            expected = KnapsackSolver().solve_parallel(weights, weights, capacity)
+            result = self.solver.solve_subset_sum(weights, capacity, checkpoint_interval=interval)
+
+            assert result['max_value'] == expected['max_value']
+            assert result['total_weight'] == result['max_value']
+            assert len(set(result['selected_items'])) == len(result['selected_items'])
+
+    def test_unreachable_and_large_capacity(self):
+        """Tek sayılar çift ağırlıklarla doldurulamaz; büyük kapasitede de çalışmalı"""
+        self.setUp()
+        result = self.solver.solve_subset_sum([4, 6, 10], 9)
+        assert result['max_value'] == 6
+
+        weights = [2 * w for w in range(300_000, 300_040)]
+        result = self.solver.solve_subset_sum(weights, 10 ** 7 + 1)
+        assert result['max_value'] <= 10 ** 7 + 1
+        assert result['max_value'] % 2 == 0
+        assert result['total_weight'] == result['max_value']
+
+class TestParetoKnapsack:
+    """
+    Pareto durum listesi motoru testleri
+    """
+
+    def setUp(self):
+        self.solver = KnapsackSolver()
+
+    def test_matches_dp(self):
+        """Pareto motoru kapasite indeksli DP ile aynı optimumu vermeli"""
+        self.setUp()
+        rng = np.random.default_rng(13)
+        for _ in range(5):
+            weights = rng.integers(1, 60, 14).tolist()
+            values = rng.integers(1, 60, 14).tolist()
+            capacity = int(rng.integers(20, 300))
+
+            expected = KnapsackSolver().solve_parallel(weights, values, capacity)
+            result = self.solver.solve_pareto(weights, values, capacity)
+
+            assert result['max_value'] == expected['max_value'] == result['total_value']
+            assert result['total_weight'] <= capacity
+
+    def test_huge_capacity(self):
+        """Durum sayısı W'den bağımsız olmalı; cephe baskın olmayan durumlar içermeli"""
+        self.setUp()
+        weights = [10 ** 12, 3 * 10 ** 12, 4 * 10 ** 12]
+        values = [5, 9, 11]
+        result = self.solver.solve_pareto(weights, values, 5 * 10 ** 12)
+
+        assert result['max_value'] == 16
+        assert result['selected_items'] == [0, 2]
+        front = result['pareto_front']
+        assert np.all(np.diff(front[:, 0]) > 0) and np.all(np.diff(front[:, 1]) > 0)
+
+    def test_state_limit(self):
+        """Durum sınırı aşılınca MemoryError fırlatılmalı"""
+        self.setUp()
+        with pytest.raises(MemoryError):
+            self.solver.solve_pareto([1, 2, 4, 8], [1, 2, 4, 8], 15, max_states=4)
+
+class TestMemoryBudget:
+    """
+    Bellek bütçesi ve kademeli motor düşürme testleri
+    """
+
+    def setUp(self):
+        self.weights = [23, 31, 29, 44, 53, 38, 63, 85, 89, 82]
+        self.values = [92, 57, 49, 68, 60, 43, 67, 84, 87, 72]
+        self.capacity = 165
+        self.expected = KnapsackSolver().solve_parallel(self.weights, self.values, self.capacity)
+
+    def test_linear_space_matches_dp(self):
+        """Doğrusal bellekli motor tam tabloyla aynı optimumu bulmalı"""
+        self.setUp()
+        rng = np.random.default_rng(5)
+        for _ in range(20):
+            n = int(rng.integers(1, 12))
+            weights = rng.integers(1, 30, n).tolist()
+            values = rng.integers(1, 30, n).tolist()
+            capacity = int(rng.integers(1, 100))
+
+            expected = KnapsackSolver().solve_parallel(weights, values, capacity)
+            result = KnapsackSolver().solve_linear_space(weights, values, capacity)
+
+            assert result['max_value'] == expected['max_value']
+            assert result['total_weight'] <= capacity
+            assert result['dp_table'] is None
+
+    def test_downgrade_levels(self):
+        """Bütçe küçüldükçe daha ucuz seviyelere düşülmeli, sonuç değişmemeli"""
+        self.setUp()
+        estimates = KnapsackSolver.estimate_memory(len(self.weights), self.capacity, record_all=True)
+        totals = {level: sum(phases.values()) for level, phases in estimates.items()}
+
+        for level in ('steps', 'no_trace', 'bitpacked', 'linear'):
+            solver = KnapsackSolver(max_memory=totals[level])
+            result = solver.solve_within_budget(self.weights, self.values, self.capacity,
+                                                record_all=True)
+
+            assert result['memory']['level'] == level
+            assert result['memory']['estimate'] <= totals[level]
+            assert result['max_value'] == self.expected['max_value']
+
+        with pytest.raises(MemoryError):
+            KnapsackSolver(max_memory=1).solve_within_budget(self.weights, self.values, self.capacity)
+
+    def test_exact_levels_stay_within_estimate(self):
+        """Kesin seviyelerin gerçek tepe ayırması kendi tahminini aşmamalı"""
+        self.setUp()
+        capacity = 200000
+        estimates = KnapsackSolver.estimate_memory(len(self.weights), capacity, record_all=True)
+
+        for level in ('steps', 'no_trace', 'bitpacked', 'linear'):
+            budget = sum(estimates[level].values())
+            tracemalloc.start()
+            result = KnapsackSolver(max_memory=budget).solve_within_budget(
+                self.weights, self.values, capacity, record_all=True)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            assert result['memory']['level'] == level
+            assert result['max_value'] == sum(self.values)
+            assert peak <= budget
+
+    def test_approximate_stays_within_budget(self):
+        """Yaklaşık seviye ve onun DP aşaması bütçeden fazla bellek ayırmamalı"""
+        self.setUp()
+        budget = 20 * 1024 ** 2
+        capacity = 10 ** 7
+
+        tracemalloc.start()
+        result = KnapsackSolver(max_memory=budget).solve_within_budget(
+            self.weights, self.values, capacity, time_budget=1.0)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert result['memory']['level'] == 'approximate'
+        assert len(result['memory']['downgrades']) == 4
+        assert not result['memory']['export_table']
+        assert result['max_value'] == sum(self.values)
+        assert peak <= budget
+
+        # DP aşaması yalnızca değer satırı ve geçicileriyle birlikte sığarsa çalışmalı
+        rng = np.random.default_rng(3)
+        weights = rng.integers(1000, 5000, 60)
+        values = (weights + 97).tolist()
+        weights = weights.tolist()
+        capacity = sum(weights) // 2 + 1
+        for budget in (4 * 1024 ** 2, 2 * 1024 ** 2):
+            tracemalloc.start()
+            result = KnapsackSolver().solve_anytime(weights, values, capacity, time_budget=2.0,
+                                                    max_memory=budget)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            phases = [phase['phase'] for phase in result['phases']]
+            assert ('dp' in phases) == (budget == 4 * 1024 ** 2)
+            assert peak <= budget
+
+    def test_engines_refuse_over_budget(self):
+        """Bütçeyi aşan tablolar ayrılmadan MemoryError fırlatılmalı"""
+        self.setUp()
+        solver = KnapsackSolver(max_memory=1024)
+        for solve in ('solve_knapsack_with_steps', 'solve_parallel', 'solve_linear_space'):
+            with pytest.raises(MemoryError):
+                getattr(solver, solve)(self.weights, self.values, 10 ** 6)
+        with pytest.raises(MemoryError):
+            solver.solve_by_value(self.weights, [10 ** 6] * len(self.weights), self.capacity)
+        with pytest.raises(MemoryError):
+            solver.solve_subset_sum(self.weights, 10 ** 6)
+        with pytest.raises(MemoryError):
+            solver.solve_multiple_choice_knapsack(self.weights, self.values,
+                                                  [i % 3 for i in range(10)], 10 ** 6)
+        with pytest.raises(MemoryError):
+            KnapsackSolver(max_memory=10 ** 5).solve_pareto(list(range(1, 41)),
+                                                            list(range(1, 41)), 10 ** 6)
+
+        # Çok boyutlu motor da çözücünün bütçesine göre dal-sınıra geçmeli
+        multidimensional = solver.solve_multidimensional_knapsack(
+            [[w, w] for w in self.weights], self.values, [self.capacity, self.capacity])
+        assert multidimensional['engine'] == 'branch_and_bound'
+        assert multidimensional['max_value'] == self.expected['max_value']
+
+        result = KnapsackSolver(max_memory=10 ** 6).solve_knapsack_with_steps(
+            self.weights, self.values, self.capacity, trace=False)
+        assert result['steps'] == []
+        assert result['max_value'] == self.expected['max_value']
+
+
+class TestParallelKnapsack:
+    """
+    Çok çekirdekli satır-paralel DP testleri
+    """
+
+    def test_parallel_matches_sequential(self):
+        """Küçük bloklarla paralel çözüm sıralı çözümle aynı olmalı"""
+        weights = [4, 7, 3, 9, 5, 2, 8]
+        values = [9, 15, 5, 20, 11, 3, 16]
+        capacity = 25
+
+        sequential = KnapsackSolver().solve_knapsack_with_steps(weights, values, capacity)
+        parallel = KnapsackSolver().solve_parallel(weights, values, capacity,
+                                                   workers=4, block_size=8)
+
+        assert parallel['max_value'] == sequential['max_value']
+        assert parallel['total_value'] == sequential['max_value']
+        assert parallel['total_weight'] <= capacity
+        assert parallel['blocks_per_row'] == 4
+        assert parallel['workers'] == 4
+
+class TestAnytimeKnapsack:
+    """
+    Süre bütçeli (anytime) çözüm testleri
+    """
+
+    def setUp(self):
+        self.solver = KnapsackSolver()
+        self.weights = [12, 7, 11, 8, 9, 6, 14]
+        self.values = [24, 13, 23, 15, 16, 10, 30]
+        self.capacity = 26
+
+    def test_anytime_reaches_optimum(self):
+        """Yeterli sürede optimum bulunmalı ve açık sıfır olmalı"""
+        self.setUp()
+        exact = KnapsackSolver().solve_knapsack_with_steps(self.weights, self.values,
+                                                           self.capacity)
+        result = self.solver.solve_anytime(self.weights, self.values, self.capacity,
+                                           time_budget=5.0)
+
+        assert result['optimal']
+        assert result['max_value'] == exact['max_value']
+        assert result['upper_bound'] == result['max_value']
+        assert result['gap'] == 0.0
+
+    def test_zero_budget_reports_gap(self):
+        """Süre yoksa yine geçerli bir çözüm ve üst sınır dönmeli"""
+        self.setUp()
+        result = self.solver.solve_anytime(self.weights, self.values, self.capacity,
+                                           time_budget=0.0)
+
+        assert result['total_weight'] <= self.capacity
+        assert result['upper_bound'] >= result['max_value']
+        assert 0.0 <= result['gap'] < 1.0
+        assert result['phases'][0]['phase'] == 'greedy'
 
 def test_empty_input():
     """Boş girdi testi"""
@@ -0,0 +1,80 @@
+import os
+
+import numpy as np
+
+from algorithm import KnapsackSolver
+from instance_library import (BENCHMARK_SPECS, InstanceLibrary, LIBRARY_VERSION, build_library,
+                              default_library_path, solve_with_library)
+from utils import SAMPLE_PROBLEMS, load_sample_data
+
+
+def test_library_answers_known_instances(tmp_path):
+    """Kütüphane örnekleri ve kıyaslamaları çözücüyle aynı sonuçla, kopyasız döndürmeli"""
+    library = InstanceLibrary(str(tmp_path / 'library.bin'))
+    assert len(library) == len(SAMPLE_PROBLEMS) + len(BENCHMARK_SPECS)
+
+    for name in library.names():
+        instance = library.instance(name)
+        expected = KnapsackSolver().solve_parallel(instance['weights'], instance['values'],
+                                                   instance['capacity'])
+        result = library.lookup(instance['weights'].tolist(), instance['values'],
+                                instance['capacity'])
+
+        assert result['max_value'] == expected['max_value']
+        assert result['selected_items'].tolist() == expected['selected_items']
+        assert isinstance(result['last_row'], np.memmap)
+        assert not result['last_row'].flags.writeable
+        assert result['bounds']['lower'] <= result['max_value'] <= result['bounds']['upper']
+        assert result['library']['version'] == LIBRARY_VERSION
+        assert result['optimal'] and result['upper_bound'] == result['max_value']
+
+    sample = SAMPLE_PROBLEMS["Basit Örnek"]
+    result = library.lookup(sample['weights'], sample['values'], sample['capacity'])
+    assert np.array_equal(result['dp_table'], KnapsackSolver().solve_knapsack_with_steps(
+        sample['weights'], sample['values'], sample['capacity'])['dp_table'])
+    assert result['steps'][1]['item'] == 1
+    assert library.best_value("Basit Örnek", 30) == 160
+
+
+def test_miss_and_stale_file(tmp_path):
+    """Bilinmeyen örnekler çözülmeli; bozuk veya eski sürüm dosya yeniden oluşturulmalı"""
+    path = tmp_path / 'library.bin'
+    path.write_bytes(b'eski dosya')
+
+    library = InstanceLibrary(str(path))
+    assert library.lookup([3, 4, 5], [30, 40, 50], 9) is None
+    assert path.read_bytes()[:7] == b'KNAPLIB'
+    assert solve_with_library([3, 4, 5], [30, 40, 50], 9, library=library)['max_value'] == 90
+
+    missing = InstanceLibrary(str(tmp_path / 'yok.bin'), auto_build=False)
+    assert len(missing) == 0
+    assert solve_with_library([3, 4, 5], [30, 40, 50], 9, library=missing,
+                              solve=lambda: {'max_value': -1})['max_value'] == -1
+
+    build_library(str(path))
+    assert InstanceLibrary(str(path), auto_build=False).names(benchmark=False) == \
+        list(SAMPLE_PROBLEMS)
+    assert load_sample_data() is SAMPLE_PROBLEMS
+
+
+def test_untrusted_file_is_rebuilt(tmp_path, monkeypatch):
+    """Başkalarınca yazılabilen dosya veya dizindeki kütüphaneye güvenilmemeli"""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    assert default_library_path().startswith(str(tmp_path / 'cache'))
+
+    path = build_library(str(tmp_path / 'library.bin'))
+    assert len(InstanceLibrary(path, auto_build=False)) > 0
+    assert not os.stat(path).st_mode & 0o077
+
+    os.chmod(path, 0o666)
+    assert len(InstanceLibrary(path, auto_build=False)) == 0
+    assert len(InstanceLibrary(path)) > 0
+    assert not os.stat(path).st_mode & 0o022
+
+    shared = tmp_path / 'shared'
+    shared.mkdir()
+    path = build_library(str(shared / 'library.bin'))
+    os.chmod(shared, 0o777)
+    assert len(InstanceLibrary(path, auto_build=False)) == 0
+    os.chmod(shared, 0o1777)
+    assert len(InstanceLibrary(path, auto_build=False)) > 0
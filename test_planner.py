@@ -0,0 +1,76 @@
+from planner import analyze_instance, plan_engine, solve_with_plan
+from algorithm import KnapsackSolver
+
+
+def test_analyze_instance():
+    """EBOB ve ölçeklenmiş kapasite doğru hesaplanmalı"""
+    features = analyze_instance([10, 20, 30], [60, 100, 120], 55)
+
+    assert features['weight_gcd'] == 10
+    assert features['value_gcd'] == 20
+    assert features['scaled_capacity'] == 5
+    assert features['total_value'] == 280
+
+
+def test_plan_respects_memory_budget():
+    """Bütçeyi aşan motorlar seçilmemeli, hiçbiri sığmazsa anytime seçilmeli"""
+    weights = [1000 + i for i in range(30)]
+    values = [1 + i for i in range(30)]
+
+    plan = plan_engine(weights, values, 10 ** 7, require_steps=True)
+    assert plan['engine'] != 'steps'
+    assert plan['predictions'][plan['engine']]['fits']
+    assert plan['explanation']
+
+    plan = plan_engine(weights, values, 10 ** 6, memory_budget=100)
+    assert plan['engine'] == 'anytime'
+
+
+def test_solve_with_plan_matches_dp():
+    """Planlı çözüm her motorda aynı optimumu vermeli"""
+    weights = [12, 18, 30, 42, 6]
+    values = [10, 40, 30, 50, 20]
+    capacity = 60
+
+    expected = KnapsackSolver().solve_knapsack_with_steps(weights, values, capacity)
+    for require_steps in (True, False):
+        result = solve_with_plan(weights, values, capacity, require_steps=require_steps)
+        assert result['max_value'] == expected['max_value']
+        assert result['total_weight'] <= capacity
+        assert 'plan' in result
+        assert result['engine'] == result['plan']['engine']
+        assert result['optimal'] and result['gap'] == 0.0
+        assert result['upper_bound'] == expected['max_value']
+
+    # Bütçe yalnızca yaklaşık motora yetiyorsa optimallik iddia edilmemeli
+    weights = [1000 + 37 * i for i in range(30)]
+    values = [10 ** 9 + 7919 * i for i in range(30)]
+    result = solve_with_plan(weights, values, 12345, memory_budget=100 * 1024,
+                             require_steps=True, time_budget=0.2)
+    assert result['engine'] == 'anytime'
+    assert result['upper_bound'] >= result['max_value']
+    assert result['optimal'] == (result['gap'] == 0.0)
+
+
+def test_subset_sum_engine_selected():
+    """Değer = ağırlık olan problemlerde bit kümesi motoru seçilmeli"""
+    weights = [34, 21, 55, 89, 13, 8]
+    plan = plan_engine(weights, weights, 150)
+    assert plan['features']['subset_sum']
+    assert plan['engine'] == 'subset_sum'
+
+    result = solve_with_plan([2 * w for w in weights], [2 * w for w in weights], 301)
+    assert result['plan']['engine'] == 'subset_sum'
+    assert result['max_value'] == result['total_weight'] == 288
+
+
+def test_pareto_engine_for_huge_capacity():
+    """Az eşyalı, dev kapasiteli problemlerde Pareto motoru seçilmeli"""
+    weights = [(3 + i) * 10 ** 11 + 2 * i + 1 for i in range(12)]
+    values = [(7 + 2 * i) * 10 ** 9 + i for i in range(12)]
+    plan = plan_engine(weights, values, 2 * 10 ** 12)
+    assert plan['engine'] == 'pareto'
+
+    result = solve_with_plan(weights, values, 2 * 10 ** 12)
+    assert result['total_weight'] <= 2 * 10 ** 12
+    assert result['max_value'] == result['total_value']
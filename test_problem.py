@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from algorithm import KnapsackSolver
+from problem import ProblemValidationError, check_problem, describe_errors, normalize_problem
+from utils import validate_input
+
+
+def test_normalized_arrays_are_readonly_and_shared():
+    """Diziler salt okunur int64 olmalı; int64 girdiler ve tekrar çağrılar kopyalanmamalı"""
+    source = np.array([10, 20, 30], dtype=np.int64)
+    problem = normalize_problem(source, [60, 100, 120], 50)
+
+    assert problem.weights.dtype == np.int64 and problem.values.dtype == np.int64
+    assert not problem.weights.flags.writeable
+    assert np.shares_memory(problem.weights, source)
+    assert source.flags.writeable
+
+    assert normalize_problem(problem.weights, problem.values, 50) is problem
+    assert normalize_problem(problem) is problem
+
+
+def test_cache_round_trip():
+    """check_problem sonucu önbelleğe girmeli; salt okunur int64 diziler olduğu gibi kullanılmalı"""
+    weights = np.array([10, 20, 30], dtype=np.int64)
+    values = np.array([60, 100, 120], dtype=np.int64)
+    weights.flags.writeable = False
+    values.flags.writeable = False
+
+    problem, errors = check_problem(weights, values, 50)
+    assert not errors
+    assert problem.weights is weights and problem.values is values
+    assert normalize_problem(weights, values, 50) is problem
+    assert normalize_problem(problem.weights, problem.values, problem.capacity) is problem
+
+    checked, _ = check_problem([12, 18, 30], [10, 40, 30], 60)
+    assert normalize_problem(checked.weights, checked.values, 60) is checked
+
+
+def test_cached_statistics():
+    """Türetilmiş istatistikler doğru hesaplanmalı"""
+    problem = normalize_problem([12, 18, 30], [10, 40, 30], 60)
+
+    assert problem.n == 3
+    assert problem.total_weight == 60
+    assert problem.total_value == 80
+    assert problem.weight_gcd == 6
+    assert problem.value_gcd == 10
+    assert problem.efficiency.tolist() == pytest.approx([10 / 12, 40 / 18, 1.0])
+    assert not problem.is_subset_sum
+
+
+def test_per_item_errors():
+    """Her hata türü hatalı eşyaların indekslerini raporlamalı"""
+    problem, errors = check_problem([5, -1, 0, 70], [1, 2, -3, 4], 60)
+
+    assert problem is None
+    assert [error['message'] for error in errors] == [
+        "Tüm ağırlıklar pozitif olmalı",
+        "Tüm değerler pozitif olmalı",
+        "En az bir eşya çantaya sığmalı"
+    ]
+    assert errors[0]['items'].tolist() == [1, 2]
+    assert errors[2]['items'].tolist() == [3]
+    assert describe_errors(errors, [5, -1, 0, 70], [1, 2, -3, 4])[1] == \
+        "Tüm değerler pozitif olmalı: eşya 3 (-3)"
+
+    _, errors = check_problem([1.0, 2.5], [1, 2], 5)
+    assert errors[0]['items'].tolist() == [1]
+
+    with pytest.raises(ProblemValidationError):
+        normalize_problem([], [], 10)
+    assert validate_input([10, 20], [1], 30) == \
+        (False, "Ağırlık ve değer listelerinin uzunluğu eşit olmalı")
+
+
+def test_engines_accept_readonly_arrays():
+    """Motorlar normalize edilmiş dizilerle liste girdisiyle aynı sonucu vermeli"""
+    weights, values = [12, 18, 30, 42, 6], [10, 40, 30, 50, 20]
+    problem = normalize_problem(weights, values, 60)
+
+    expected = KnapsackSolver().solve_knapsack_with_steps(weights, values, 60)
+    for solve in ('solve_knapsack_with_steps', 'solve_parallel', 'solve_by_value', 'solve_pareto',
+                  'solve_top_k', 'solve_sensitivity', 'solve_greedy_comparison'):
+        result = getattr(KnapsackSolver(), solve)(problem.weights, problem.values, 60)
+        if solve != 'solve_greedy_comparison':
+            assert result['max_value'] == expected['max_value']
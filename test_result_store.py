@@ -0,0 +1,81 @@
+import os
+
+import numpy as np
+import pytest
+
+from algorithm import KnapsackSolver
+from result_store import ResultStore
+
+
+def _solve():
+    return KnapsackSolver().solve_knapsack_with_steps([10, 20, 30], [60, 100, 120], 50)
+
+
+def test_put_and_get_with_session_usage():
+    """Depolanan sonuç tanıtıcıyla geri alınmalı ve oturum kullanımı raporlanmalı"""
+    store = ResultStore()
+    result = _solve()
+    handle = store.put(result, 'a')
+
+    assert store.get(handle) is result
+    assert store.session_usage('a')['memory_bytes'] > 0
+    assert store.session_usage('b')['results'] == 0
+
+    store.release_session('a')
+    assert store.get(handle) is None
+    assert store.stats()['memory_bytes'] == 0
+
+
+def test_spill_to_disk(tmp_path):
+    """Bellek sınırı aşılınca eski sonuç diske taşınmalı ve aynı içerikle okunmalı"""
+    store = ResultStore(max_bytes=1, spill_dir=str(tmp_path))
+    first = _solve()
+    first_handle = store.put(first, 'a')
+    second_handle = store.put(_solve(), 'b')
+
+    spilled = store.get(first_handle)
+    assert isinstance(spilled['dp_table'], np.memmap)
+    assert np.array_equal(spilled['dp_table'], first['dp_table'])
+    assert np.array_equal(spilled['steps'][2]['table_state'], first['steps'][2]['table_state'])
+    assert spilled['max_value'] == 220
+    assert store.session_usage('a')['memory_bytes'] == 0
+    assert store.session_usage('a')['disk_bytes'] > 0
+    assert store.get(second_handle) is not None
+
+    store.release(first_handle)
+    assert not os.path.exists(os.path.join(str(tmp_path), first_handle))
+
+
+def test_eviction_without_spill():
+    """Taşma dizini yoksa en eski sonuç depodan çıkarılmalı"""
+    store = ResultStore(max_bytes=_solve()['dp_table'].nbytes * 2)
+    first_handle = store.put(_solve(), 'a')
+    second_handle = store.put(_solve(), 'a')
+
+    assert store.get(first_handle) is None
+    assert store.get(second_handle) is not None
+    assert store.stats()['results'] == 1
+
+
+def test_oversized_result_spilled_or_rejected(tmp_path):
+    """Tek başına sınırı aşan sonuç bellekte kalmamalı: diske taşınmalı ya da reddedilmeli"""
+    store = ResultStore(max_bytes=1, spill_dir=str(tmp_path))
+    handle = store.put(_solve(), 'a')
+
+    assert isinstance(store.get(handle)['dp_table'], np.memmap)
+    assert store.stats()['memory_bytes'] == 0
+    assert store.get(handle)['max_value'] == 220
+
+    class Owner:
+        released = False
+
+        def release(self):
+            self.released = True
+
+    owner = Owner()
+    store = ResultStore(max_bytes=1)
+    with pytest.raises(MemoryError):
+        store.put(_solve(), 'a', owner=owner)
+    assert owner.released
+    assert store.stats()['results'] == 0
+    assert store.stats()['memory_bytes'] == 0
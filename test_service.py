@@ -0,0 +1,162 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from planner import calibrate
+from service import SolveService, parse_solve_request
+
+
+async def _http(port: int, method: str, path: str, body: dict = None):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    data = json.dumps(body).encode('utf-8') if body is not None else b''
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+                 f"Content-Length: {len(data)}\r\n\r\n".encode('latin-1') + data)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, payload = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), json.loads(payload)
+
+
+def test_parse_solve_request():
+    """Geçersiz istekler validate_input mesajıyla reddedilmeli"""
+    request, _ = parse_solve_request(b'{"weights": [10, 20], "values": [60, 100], "capacity": 30}')
+    assert request['mode'] == '01'
+
+    request, message = parse_solve_request(b'{"weights": [10, -1], "values": [60, 100], "capacity": 30}')
+    assert request is None
+    assert message == "Tüm ağırlıklar pozitif olmalı"
+
+    request, message = parse_solve_request(b'not json')
+    assert request is None
+
+
+def test_solve_and_metrics_over_http():
+    """HTTP üzerinden çözüm ve metrik uç noktaları"""
+    async def scenario():
+        service = SolveService(workers=2, executor=ThreadPoolExecutor(max_workers=2))
+        server = await service.start('127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            problem = {'weights': [10, 20, 30], 'values': [60, 100, 120], 'capacity': 50}
+            first, second = await asyncio.gather(
+                _http(port, 'POST', '/solve', problem),
+                _http(port, 'POST', '/solve', problem)
+            )
+            bad = await _http(port, 'POST', '/solve', {'weights': [], 'values': [], 'capacity': 5})
+            metrics = await _http(port, 'GET', '/metrics')
+        finally:
+            server.close()
+            await server.wait_closed()
+            service.executor.shutdown()
+        return first, second, bad, metrics
+
+    first, second, bad, metrics = asyncio.run(scenario())
+
+    assert first[0] == second[0] == 200
+    assert first[1] == second[1]
+    assert first[1]['max_value'] == 220
+    assert first[1]['selected_items'] == [1, 2]
+    assert first[1]['optimal'] and first[1]['gap'] == 0.0
+    assert first[1]['upper_bound'] == 220
+    assert first[1]['engine']
+    assert bad[0] == 400
+    assert metrics[0] == 200
+    assert metrics[1]['completed'] + metrics[1]['coalesced'] == 2
+    assert metrics[1]['queue_depth'] == 0
+    assert 'p50_ms' in metrics[1]['latency']
+
+
+def test_backpressure():
+    """Kuyruk doluyken yeni istekler 503 almalı"""
+    async def scenario():
+        service = SolveService(workers=1, max_queue=0, executor=ThreadPoolExecutor(max_workers=1))
+        server = await service.start('127.0.0.1', 0)
+        status, body = await service.solve({'mode': '01', 'weights': [1], 'values': [1],
+                                            'capacity': 1})
+        server.close()
+        await server.wait_closed()
+        service.executor.shutdown()
+        return status, service.metrics()
+
+    status, metrics = asyncio.run(scenario())
+
+    assert status == 503
+    assert metrics['rejected'] == 1
+
+
+def test_approximate_response_reports_gap():
+    """Bütçe yalnızca yaklaşık motora yetiyorsa yanıt optimallik iddia etmemeli"""
+    async def scenario():
+        service = SolveService(workers=1, executor=ThreadPoolExecutor(max_workers=1),
+                               memory_budget=100 * 1024)
+        server = await service.start('127.0.0.1', 0)
+        try:
+            return await service.solve({'mode': '01',
+                                        'weights': [1000 + 37 * i for i in range(30)],
+                                        'values': [10 ** 9 + 7919 * i for i in range(30)],
+                                        'capacity': 12345})
+        finally:
+            server.close()
+            await server.wait_closed()
+            service.executor.shutdown()
+
+    status, body = asyncio.run(scenario())
+
+    assert status == 200
+    assert body['engine'] == 'anytime'
+    assert body['upper_bound'] >= body['max_value']
+    assert body['optimal'] == (body['gap'] == 0.0)
+
+
+def test_coalesced_failure_and_memory_budget():
+    """Öncü iş başarısız olursa birleştirilen istek de aynı 500 yanıtını almalı"""
+    async def scenario():
+        service = SolveService(workers=1, executor=ThreadPoolExecutor(max_workers=1),
+                               memory_budget=1024 ** 2)
+        server = await service.start('127.0.0.1', 0)
+        # Bütçeyi aşan tablo ayrılmadan reddedilir
+        request = {'mode': 'bounded', 'weights': [3, 5], 'values': [4, 7], 'counts': [2, 2],
+                   'capacity': 10 ** 6}
+        try:
+            responses = await asyncio.gather(service.solve(request), service.solve(request))
+            solved = await service.solve({'mode': '01', 'weights': [10, 20, 30],
+                                          'values': [60, 100, 120], 'capacity': 50})
+        finally:
+            server.close()
+            await server.wait_closed()
+            service.executor.shutdown()
+        return responses, solved, service.metrics()
+
+    (leader, follower), solved, metrics = asyncio.run(scenario())
+
+    assert leader[0] == follower[0] == 500
+    assert leader[1] == follower[1]
+    assert 'bütçe' in leader[1]['error']
+    assert metrics['coalesced'] == 1
+    assert metrics['failed'] == 2
+    assert solved[0] == 200
+    assert solved[1]['max_value'] == 220
+
+
+def test_workers_reuse_parent_calibration():
+    """İşçi süreçler planlayıcıyı yeniden ölçmeden ana sürecin katsayılarını kullanmalı"""
+    async def scenario():
+        service = SolveService(workers=1)
+        server = await service.start('127.0.0.1', 0)
+        try:
+            loop = asyncio.get_running_loop()
+            worker_calibration = await loop.run_in_executor(service.executor, calibrate)
+            status, body = await service.solve({'mode': '01', 'weights': [10, 20, 30],
+                                                'values': [60, 100, 120], 'capacity': 50})
+        finally:
+            server.close()
+            await server.wait_closed()
+            service.close()
+        return worker_calibration, status, body
+
+    worker_calibration, status, body = asyncio.run(scenario())
+
+    assert worker_calibration == calibrate()
+    assert status == 200
+    assert body['max_value'] == 220
@@ -0,0 +1,103 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pytest
+
+from algorithm import KnapsackSolver
+from result_store import ResultStore
+from shared_result import attach_result, export_result, solve_in_process
+from utils import KnapsackVisualizer, create_downloadable_results, export_to_csv
+
+WEIGHTS = [10, 20, 30, 15, 25]
+VALUES = [60, 100, 120, 70, 90]
+CAPACITY = 60
+
+
+def _segment_exists(name: str) -> bool:
+    try:
+        SharedMemory(name=name).close()
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def test_export_and_attach_are_zero_copy():
+    """Bağlanan sonuç paylaşılan segmentlerin salt okunur görünümlerini kullanmalı"""
+    expected = KnapsackSolver().solve_knapsack_with_steps(WEIGHTS, VALUES, CAPACITY)
+    descriptor = export_result(expected)
+
+    # Adım kaydının tablosu dp_table ile aynı segmenti kullanır
+    assert descriptor['traces']['steps']['table'] == descriptor['arrays']['dp_table']
+
+    shared = attach_result(descriptor)
+    result = shared.result
+    assert np.array_equal(result['dp_table'], expected['dp_table'])
+    assert result['selected_items'].tolist() == expected['selected_items']
+    assert result['max_value'] == expected['max_value']
+    assert not result['dp_table'].flags.writeable
+    assert np.shares_memory(result['steps'].dp_table, result['dp_table'])
+    assert result['steps'][3]['value'] == expected['steps'][3]['value']
+
+    name = descriptor['arrays']['dp_table']['name']
+    shared.release()
+    assert not _segment_exists(name)
+
+
+def test_consumers_read_shared_views():
+    """Dışa aktarıcılar ve ısı haritası paylaşılan dizileri doğrudan okuyabilmeli"""
+    expected = KnapsackSolver().solve_knapsack_with_steps(WEIGHTS, VALUES, CAPACITY)
+    with attach_result(export_result(expected)) as shared:
+        result = shared.result
+        assert create_downloadable_results(result, WEIGHTS, VALUES, CAPACITY) == \
+            create_downloadable_results(expected, WEIGHTS, VALUES, CAPACITY)
+        assert export_to_csv(WEIGHTS, VALUES, CAPACITY, result['selected_items']) == \
+            export_to_csv(WEIGHTS, VALUES, CAPACITY, expected['selected_items'])
+        fig = KnapsackVisualizer().create_dp_table_heatmap(result['dp_table'])
+        assert np.array_equal(fig.data[0].z, expected['dp_table'])
+
+
+def test_process_handoff_and_store_ownership():
+    """Süreçten gelen sonuç depoya sahipliğiyle verilmeli ve silinince segmentler kalkmalı"""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        shared = solve_in_process(executor, 'solve_parallel', WEIGHTS, VALUES, CAPACITY)
+
+    expected = KnapsackSolver().solve_parallel(WEIGHTS, VALUES, CAPACITY)
+    assert shared.result['max_value'] == expected['max_value']
+    names = [segment.name for segment in shared.segments]
+
+    store = ResultStore()
+    handle = store.put(shared.result, 'a', owner=shared)
+    assert store.get(handle)['selected_items'].tolist() == expected['selected_items']
+    assert all(_segment_exists(name) for name in names)
+
+    store.release(handle)
+    assert shared.released
+    assert not any(_segment_exists(name) for name in names)
+
+
+def test_bounded_selection_counts():
+    """Sınırlı motorun {indeks: adet} seçimi indeks ve adet dizileriyle paylaşılmalı"""
+    counts = [2, 1, 3, 1, 2]
+    expected = KnapsackSolver().solve_bounded_knapsack(WEIGHTS, VALUES, counts, CAPACITY)
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        shared = solve_in_process(executor, 'solve_bounded_knapsack', WEIGHTS, VALUES, counts,
+                                  CAPACITY)
+    with shared:
+        result = shared.result
+        assert result['selected_items'] == expected['selected_items']
+        assert result['max_value'] == expected['max_value']
+
+        exported = json.loads(create_downloadable_results(result, WEIGHTS, VALUES, CAPACITY))
+        assert exported['solution']['selected_items'] == list(expected['selected_items'])
+        assert exported['solution']['quantities'] == list(expected['selected_items'].values())
+        assert 'error' not in exported
+
+
+def test_worker_errors_propagate():
+    """Çalışan süreçteki hata çağırana iletilmeli"""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(MemoryError):
+            solve_in_process(executor, 'solve_parallel', WEIGHTS, VALUES, 10 ** 6, max_memory=1024)
@@ -0,0 +1,77 @@
+import threading
+import time
+
+from result_store import ResultStore
+from solve_jobs import JOB_CANCELLED, JOB_DONE, JOB_FAILED, SolveJobManager
+
+
+def _wait(job, timeout: float = 10.0):
+    deadline = time.time() + timeout
+    while job.running and time.time() < deadline:
+        time.sleep(0.01)
+    return job
+
+
+def test_job_completes_into_store():
+    """Biten işin sonucu depoya yazılmalı ve ilerleme tamamlanmalı"""
+    store = ResultStore()
+    manager = SolveJobManager(workers=1, store=store)
+
+    def task(job):
+        job.partial = job.solver().solve_greedy_comparison([10, 20, 30], [60, 100, 120], 50)
+        return job.solver().solve_knapsack_with_steps([10, 20, 30], [60, 100, 120], 50)
+
+    job = _wait(manager.submit('a', task))
+    manager.shutdown()
+
+    assert job.status == JOB_DONE
+    assert job.progress == 1.0
+    assert job.partial['total_value'] == 160
+    assert store.get(job.result_handle)['max_value'] == 220
+    assert manager.get(job.job_id) is job
+
+
+def test_cancel_stops_solver():
+    """İptal edilen iş bir sonraki satırda durmalı, kısmi sonuç korunmalı"""
+    manager = SolveJobManager(workers=1, store=ResultStore())
+    release = threading.Event()
+
+    def task(job):
+        job.partial = {'total_value': 1}
+        release.wait()
+        return job.solver().solve_parallel([1] * 50, [1] * 50, 1000)
+
+    job = manager.submit('a', task)
+    assert manager.cancel(job.job_id)
+    release.set()
+    _wait(job)
+    manager.shutdown()
+
+    assert job.status == JOB_CANCELLED
+    assert job.result_handle is None
+    assert job.partial == {'total_value': 1}
+    assert not manager.cancel(job.job_id)
+
+
+def test_resubmit_cancels_running_job_and_reports_errors():
+    """Aynı oturumda yeni iş eskisini iptal etmeli; hatalar işe kaydedilmeli"""
+    manager = SolveJobManager(workers=2, store=ResultStore())
+    release = threading.Event()
+
+    def slow(job):
+        release.wait()
+        return job.solver().solve_by_value([1, 2], [1, 2], 3)
+
+    def broken(job):
+        raise ValueError("bozuk girdi")
+
+    first = manager.submit('a', slow)
+    second = manager.submit('a', broken)
+    release.set()
+    _wait(first)
+    _wait(second)
+    manager.shutdown()
+
+    assert first.status == JOB_CANCELLED
+    assert second.status == JOB_FAILED
+    assert second.error == "bozuk girdi"
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from utils import (INSTANCE_CLASSES, KnapsackVisualizer, create_random_problem, export_to_csv,
+                   generate_instance, selection_mask, stream_instances)
+
+
+def test_seeded_generation_is_reproducible():
+    """Aynı tohum aynı problemi, tohumsuz çağrılar farklı problemleri vermeli"""
+    first = create_random_problem(50, 20, 50, seed=7)
+    second = create_random_problem(50, 20, 50, seed=7)
+    assert first == second
+
+    unseeded = [create_random_problem(50, 20, 50)['weights'] for _ in range(3)]
+    assert unseeded[0] != unseeded[1] or unseeded[1] != unseeded[2]
+
+
+@pytest.mark.parametrize("kind", list(INSTANCE_CLASSES))
+def test_instance_classes(kind):
+    """Her sınıf geçerli ve sınıfına uygun örnek üretmeli"""
+    instance = generate_instance(2000, kind, max_weight=1000, seed=1)
+    weights, values = instance['weights'], instance['values']
+
+    assert len(weights) == len(values) == 2000
+    assert weights.min() > 0 and values.min() > 0
+    assert weights.max() <= instance['capacity']
+    if kind == 'subset_sum':
+        assert np.array_equal(weights, values)
+    if kind == 'strongly_correlated':
+        assert np.all(values - weights == 100)
+    if kind == 'inverse_strongly_correlated':
+        assert np.all(weights - values == 100)
+
+
+def test_stream_instances():
+    """Akış, grupları tohuma göre tekrarlanabilir biçimde üretmeli"""
+    batches = list(stream_instances(5, 100, kind='weakly_correlated', seed=3, batch_size=2))
+    again = list(stream_instances(5, 100, kind='weakly_correlated', seed=3, batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert np.array_equal(batches[2][0]['weights'], again[2][0]['weights'])
+    assert not np.array_equal(batches[0][0]['weights'], batches[0][1]['weights'])
+
+
+def test_selection_mask_and_csv():
+    """Seçim maskesi liste ve sözlük seçimlerini desteklemeli, CSV ona göre işaretlemeli"""
+    assert selection_mask(4, [0, 2]).tolist() == [True, False, True, False]
+    assert selection_mask(3, {1: 2}).tolist() == [False, True, False]
+
+    csv = export_to_csv([10, 20, 30], [60, 100, 120], 50, [1, 2])
+    assert csv.splitlines()[1].endswith('Hayır')
+    assert csv.splitlines()[3].endswith('Evet')
+
+
+def test_items_chart_scales_with_item_count():
+    """Büyük eşya sayılarında grafik eşya başına veri taşımamalı"""
+    visualizer = KnapsackVisualizer()
+    payloads = []
+    for n in (50_000, 500_000):
+        instance = generate_instance(n, seed=2)
+        selected = np.flatnonzero(instance['weights'] < 300)
+        fig = visualizer.create_items_comparison_chart(instance['weights'], instance['values'],
+                                                       selected)
+        payloads.append(len(fig.to_json()))
+        assert {trace.type for trace in fig.data} == {'bar', 'heatmap', 'contour'}
+
+    assert payloads[1] < payloads[0] * 1.5
+
+    small = visualizer.create_items_comparison_chart([10, 20, 30], [60, 100, 120], [1, 2])
+    colors = list(small.data[0].marker.color)
+    assert colors[0] != colors[1] and colors[1] == colors[2]
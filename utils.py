@@ -7,59 +7,53 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from typing import List, Tuple, Dict, Any
 
+from problem import check_problem, normalize_problem
+
+# Örnek problemler modül yüklenirken bir kez oluşturulur; çağıranlar değiştirmemeli
+SAMPLE_PROBLEMS = {
+    "Basit Örnek": {
+        "weights": [10, 20, 30],
+        "values": [60, 100, 120],
+        "capacity": 50,
+        "description": "3 eşyalı basit örnek problem"
+    },
+    "Klasik Örnek": {
+        "weights": [2, 1, 3, 2],
+        "values": [12, 10, 20, 15],
+        "capacity": 5,
+        "description": "4 eşyalı klasik problem"
+    },
+    "Orta Seviye": {
+        "weights": [5, 4, 6, 3, 2, 7],
+        "values": [10, 40, 30, 50, 35, 25],
+        "capacity": 15,
+        "description": "6 eşyalı orta seviye problem"
+    },
+    "Büyük Örnek": {
+        "weights": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
+        "values": [1, 4, 7, 9, 12, 13, 14, 15, 16, 17],
+        "capacity": 25,
+        "description": "10 eşyalı büyük problem"
+    }
+}
+
 def load_sample_data() -> Dict[str, Any]:
     """
     Örnek knapsack problemleri döner
+    
+    Çözümleri instance_library'de önceden hesaplanmıştır.
     """
-    samples = {
-        "Basit Örnek": {
-            "weights": [10, 20, 30],
-            "values": [60, 100, 120],
-            "capacity": 50,
-            "description": "3 eşyalı basit örnek problem"
-        },
-        "Klasik Örnek": {
-            "weights": [2, 1, 3, 2],
-            "values": [12, 10, 20, 15],
-            "capacity": 5,
-            "description": "4 eşyalı klasik problem"
-        },
-        "Orta Seviye": {
-            "weights": [5, 4, 6, 3, 2, 7],
-            "values": [10, 40, 30, 50, 35, 25],
-            "capacity": 15,
-            "description": "6 eşyalı orta seviye problem"
-        },
-        "Büyük Örnek": {
-            "weights": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-            "values": [1, 4, 7, 9, 12, 13, 14, 15, 16, 17],
-            "capacity": 25,
-            "description": "10 eşyalı büyük problem"
-        }
-    }
-    return samples
+    return SAMPLE_PROBLEMS
 
 def validate_input(weights: List[int], values: List[int], capacity: int) -> Tuple[bool, str]:
     """
     Kullanıcı girdilerini doğrular
-    """
-    if not weights or not values:
-        return False, "Ağırlık ve değer listeleri boş olamaz"
-    
-    if len(weights) != len(values):
-        return False, "Ağırlık ve değer listelerinin uzunluğu eşit olmalı"
-    
-    if any(w <= 0 for w in weights):
-        return False, "Tüm ağırlıklar pozitif olmalı"
-    
-    if any(v <= 0 for v in values):
-        return False, "Tüm değerler pozitif olmalı"
     
-    if capacity <= 0:
-        return False, "Kapasite pozitif olmalı"
-    
-    if max(weights) > capacity:
-        return False, "En az bir eşya çantaya sığmalı"
+    Eşya bazında hata ayrıntıları için problem.check_problem kullanılabilir.
+    """
+    problem, errors = check_problem(weights, values, capacity)
+    if problem is None:
+        return False, errors[0]['message']
     
     return True, "Geçerli girdi"
 
@@ -82,7 +76,11 @@ def create_downloadable_results(result: Dict[str, Any], weights: List[int],
     """
     try:
         # Convert NumPy arrays to lists for JSON serialization
-        dp_table_list = result['dp_table'].tolist() if hasattr(result['dp_table'], 'tolist') else result['dp_table']
+        # Bellek bütçesi tablonun dışa aktarımına izin vermiyorsa tablo atlanır
+        if result.get('memory', {}).get('export_table') is False:
+            dp_table_list = None
+        else:
+            dp_table_list = None if result['dp_table'] is None else np.asarray(result['dp_table']).tolist()
         
         # Ensure all numeric values are Python native types
         output = {
@@ -93,7 +91,7 @@ def create_downloadable_results(result: Dict[str, Any], weights: List[int],
             },
             "solution": {
                 "max_value": int(result['max_value']) if isinstance(result['max_value'], (np.integer, np.floating)) else result['max_value'],
-                "selected_items": [int(item) for item in result['selected_items']],
+                "selected_items": _selected_indices(result['selected_items']).tolist(),
                 "total_weight": int(result['total_weight']) if isinstance(result['total_weight'], (np.integer, np.floating)) else result['total_weight'],
                 "total_value": int(result['total_value']) if isinstance(result['total_value'], (np.integer, np.floating)) else result['total_value'],
                 "execution_time": float(result['execution_time']) if isinstance(result['execution_time'], (np.integer, np.floating)) else result['execution_time']
@@ -105,6 +103,10 @@ def create_downloadable_results(result: Dict[str, Any], weights: List[int],
             }
         }
         
+        # Sınırlı / sınırsız motorların {indeks: adet} seçimlerinde adetler ayrıca yazılır
+        if isinstance(result['selected_items'], dict):
+            output["solution"]["quantities"] = [int(q) for q in result['selected_items'].values()]
+        
         return json.dumps(output, indent=2, ensure_ascii=False)
         
     except Exception as e:
@@ -143,50 +145,140 @@ def parse_list_input(input_str: str) -> List[int]:
     except ValueError:
         return []
 
-def create_random_problem(num_items: int, max_weight: int, max_value: int, 
-                         capacity_ratio: float = 0.5) -> Dict[str, Any]:
+INSTANCE_CLASSES = {
+    "uncorrelated": "İlişkisiz",
+    "weakly_correlated": "Zayıf ilişkili",
+    "strongly_correlated": "Güçlü ilişkili",
+    "inverse_strongly_correlated": "Ters güçlü ilişkili",
+    "subset_sum": "Alt küme toplamı",
+    "spanner": "Spanner (2, 10)"
+}
+
+def generate_instance(num_items: int, kind: str = "uncorrelated", max_weight: int = 1000,
+                      max_value: int = None, capacity_ratio: float = 0.5,
+                      seed: Any = None) -> Dict[str, Any]:
     """
-    Rastgele knapsack problemi oluşturur
+    Standart zor knapsack sınıflarından vektörel olarak örnek üretir
+
+    Args:
+        num_items: Eşya sayısı (milyonlarca eşya desteklenir)
+        kind: INSTANCE_CLASSES anahtarlarından biri
+        max_weight: Ağırlık aralığı R (ağırlıklar [1, R])
+        max_value: İlişkisiz sınıfta değer aralığı (varsayılan: max_weight)
+        capacity_ratio: Kapasitenin toplam ağırlığa oranı
+        seed: np.random.Generator tohumu; None ise her çağrıda farklı örnek
+
+    Returns:
+        NumPy dizileri olarak 'weights', 'values' ile 'capacity', 'kind', 'seed'
     """
-    np.random.seed(42)  # Reproducibility için
-    
-    weights = np.random.randint(1, max_weight + 1, num_items).tolist()
-    values = np.random.randint(1, max_value + 1, num_items).tolist()
-    capacity = int(sum(weights) * capacity_ratio)
-    
+    if kind not in INSTANCE_CLASSES:
+        raise ValueError(f"Bilinmeyen problem sınıfı: {kind}")
+
+    rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+    R = int(max_weight)
+    max_value = int(max_value or R)
+    spread = max(R // 10, 1)
+
+    if kind == "spanner":
+        # Az sayıda güçlü ilişkili "spanner" eşyasının katları (Pisinger)
+        span_weights = rng.integers(1, R + 1, 2)
+        span_values = span_weights + spread
+        span_weights = np.ceil(2 * span_weights / 10).astype(np.int64)
+        span_values = np.ceil(2 * span_values / 10).astype(np.int64)
+        base = rng.integers(0, 2, num_items)
+        multiplier = rng.integers(1, 11, num_items)
+        weights = span_weights[base] * multiplier
+        values = span_values[base] * multiplier
+    elif kind == "inverse_strongly_correlated":
+        values = rng.integers(1, R + 1, num_items)
+        weights = values + spread
+    else:
+        weights = rng.integers(1, R + 1, num_items)
+        if kind == "uncorrelated":
+            values = rng.integers(1, max_value + 1, num_items)
+        elif kind == "weakly_correlated":
+            values = np.maximum(weights + rng.integers(-spread, spread + 1, num_items), 1)
+        elif kind == "strongly_correlated":
+            values = weights + spread
+        else:  # subset_sum
+            values = weights.copy()
+
+    weights = weights.astype(np.int64)
+    values = values.astype(np.int64)
+    capacity = max(int(weights.sum() * capacity_ratio), int(weights.max()) if num_items else 1)
+
     return {
         "weights": weights,
         "values": values,
         "capacity": capacity,
-        "description": f"{num_items} eşyalı rastgele problem"
+        "kind": kind,
+        "seed": seed if not isinstance(seed, np.random.Generator) else None,
+        "description": f"{num_items} eşyalı rastgele problem ({INSTANCE_CLASSES[kind]})"
+    }
+
+def stream_instances(num_instances: int, num_items: int, kind: str = "uncorrelated",
+                     seed: int = None, batch_size: int = 1, **kwargs):
+    """
+    Yük testi ve kıyaslamalar için bağımsız örnek grupları üretir
+
+    Her örnek SeedSequence.spawn ile türetilmiş kendi üretecini kullanır;
+    aynı tohum aynı örnek dizisini verir.
+
+    Yields:
+        batch_size uzunluğunda generate_instance sonuç listeleri
+    """
+    children = np.random.SeedSequence(seed).spawn(num_instances)
+    batch = []
+    for child in children:
+        batch.append(generate_instance(num_items, kind, seed=np.random.default_rng(child), **kwargs))
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def create_random_problem(num_items: int, max_weight: int, max_value: int, 
+                         capacity_ratio: float = 0.5, kind: str = "uncorrelated",
+                         seed: int = None) -> Dict[str, Any]:
+    """
+    Rastgele knapsack problemi oluşturur (seed verilirse tekrarlanabilir)
+    """
+    instance = generate_instance(num_items, kind, max_weight, max_value, capacity_ratio, seed)
+    
+    return {
+        "weights": instance["weights"].tolist(),
+        "values": instance["values"].tolist(),
+        "capacity": instance["capacity"],
+        "description": instance["description"]
     }
 
 def display_problem_info(weights: List[int], values: List[int], capacity: int):
     """
     Problem bilgilerini güzel bir şekilde gösterir
     """
+    problem = normalize_problem(weights, values, capacity)
     st.subheader("📊 Problem Bilgileri")
     
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.metric("Eşya Sayısı", len(weights))
-        st.metric("Toplam Ağırlık", sum(weights))
+        st.metric("Eşya Sayısı", problem.n)
+        st.metric("Toplam Ağırlık", problem.total_weight)
     
     with col2:
         st.metric("Çanta Kapasitesi", capacity)
-        st.metric("Ortalama Ağırlık", f"{np.mean(weights):.1f}")
+        st.metric("Ortalama Ağırlık", f"{problem.mean_weight:.1f}")
     
     with col3:
-        st.metric("Toplam Değer", sum(values))
-        st.metric("Ortalama Değer", f"{np.mean(values):.1f}")
+        st.metric("Toplam Değer", problem.total_value)
+        st.metric("Ortalama Değer", f"{problem.mean_value:.1f}")
     
     # Eşya detayları tablosu
     df = pd.DataFrame({
-        'Eşya': [f'Eşya {i+1}' for i in range(len(weights))],
-        'Ağırlık': weights,
-        'Değer': values,
-        'Verimlilik (Değer/Ağırlık)': [f"{v/w:.2f}" for v, w in zip(values, weights)]
+        'Eşya': np.arange(1, problem.n + 1),
+        'Ağırlık': problem.weights,
+        'Değer': problem.values,
+        'Verimlilik (Değer/Ağırlık)': np.round(problem.efficiency, 2)
     })
     
     st.subheader("🎒 Eşya Detayları")
@@ -230,22 +322,38 @@ def get_algorithm_explanation() -> str:
     Bu algoritma optimal çözümü garanti eder ve tüm alt problemleri çözerek ana problemi çözer.
     """
 
+def _selected_indices(selected_items) -> np.ndarray:
+    """
+    Seçilen eşya indekslerini (liste, dizi veya {indeks: adet} sözlüğü) int64 diziye çevirir
+    """
+    if isinstance(selected_items, dict):
+        return np.fromiter(selected_items, dtype=np.int64, count=len(selected_items))
+    # int64 diziler ve paylaşılan bellek görünümleri kopyalanmadan kullanılır
+    return np.asarray(selected_items, dtype=np.int64)
+
+def selection_mask(num_items: int, selected_items) -> np.ndarray:
+    """
+    Seçilen eşya indekslerini (liste veya {indeks: adet} sözlüğü) boolean maskeye çevirir
+    """
+    mask = np.zeros(num_items, dtype=bool)
+    mask[_selected_indices(selected_items)] = True
+    return mask
+
 def export_to_csv(weights: List[int], values: List[int], capacity: int, 
                   selected_items: List[int]) -> str:
     """
     Sonuçları CSV formatında export eder
     """
-    data = []
-    for i, (w, v) in enumerate(zip(weights, values)):
-        data.append({
-            'Eşya_No': i + 1,
-            'Ağırlık': w,
-            'Değer': v,
-            'Verimlilik': v/w,
-            'Seçildi': 'Evet' if i in selected_items else 'Hayır'
-        })
+    problem = normalize_problem(weights, values, capacity, require_fit=False)
+    mask = selection_mask(problem.n, selected_items)
     
-    df = pd.DataFrame(data)
+    df = pd.DataFrame({
+        'Eşya_No': np.arange(1, problem.n + 1),
+        'Ağırlık': problem.weights,
+        'Değer': problem.values,
+        'Verimlilik': problem.efficiency,
+        'Seçildi': np.where(mask, 'Evet', 'Hayır')
+    })
     return df.to_csv(index=False, encoding='utf-8-sig')
 
 # ===================================
@@ -257,15 +365,33 @@ class KnapsackVisualizer:
     Knapsack problemi için görselleştirme sınıfı
     """
     
+    # Bu eşya sayısından sonra eşya başına çubuk ve etiket çizilmez
+    BAR_ITEM_LIMIT = 200
+    # Bu eşya sayısından sonra dağılım grafiği yoğunluk haritasına dönüşür
+    SCATTER_ITEM_LIMIT = 20_000
+    HISTOGRAM_BINS = 50
+    # İlerleme grafiğinde çizilecek en fazla adım
+    PROGRESS_POINT_LIMIT = 2000
+    DENSITY_BINS = 60
+    
     def __init__(self):
         pass
     
-    def create_dp_table_heatmap(self, dp_table: np.ndarray, step: int = None) -> go.Figure:
+    def create_dp_table_heatmap(self, dp_table: np.ndarray, step: int = None,
+                                row_offset: int = 0, col_offset: int = 0) -> go.Figure:
         """
         DP tablosunu ısı haritası olarak görselleştirir
+        
+        row_offset/col_offset, tablonun bir penceresi çizildiğinde eksenlerde
+        gerçek eşya ve kapasite indekslerini göstermek için kullanılır.
         """
+        # Paylaşılan bellek veya bellek eşlemeli tablolar kopyalanmadan görünüm olarak okunur
+        dp_table = np.asarray(dp_table)
+        rows, cols = dp_table.shape
         fig = go.Figure(data=go.Heatmap(
             z=dp_table,
+            x=np.arange(col_offset, col_offset + cols),
+            y=np.arange(row_offset, row_offset + rows),
             colorscale='Viridis',
             showscale=True,
             colorbar=dict(title="Maksimum Değer"),
@@ -287,60 +413,91 @@ class KnapsackVisualizer:
                                     selected_items: List[int]) -> go.Figure:
         """
         Eşyaları karşılaştırmalı olarak görselleştirir
+        
+        Eşya sayısı BAR_ITEM_LIMIT'i aşınca eşya başına çubuklar yerine histogramlar,
+        SCATTER_ITEM_LIMIT'i aşınca dağılım grafiği yerine yoğunluk haritası çizilir;
+        böylece grafik boyutu eşya sayısıyla büyümez.
         """
-        n = len(weights)
-        items = list(range(n))
-        colors = ['Seçildi' if i in selected_items else 'Seçilmedi' for i in items]
+        weight_array = np.asarray(weights)
+        value_array = np.asarray(values)
+        n = len(weight_array)
+        mask = selection_mask(n, selected_items)
         
         # Verimlilik oranları (değer/ağırlık)
-        efficiency = [values[i]/weights[i] for i in items]
+        efficiency = value_array / weight_array
+        selected_color = px.colors.qualitative.Set1[0]
+        other_color = px.colors.qualitative.Set1[1]
         
         fig = make_subplots(
             rows=2, cols=2,
             subplot_titles=('Eşya Ağırlıkları', 'Eşya Değerleri', 
                           'Verimlilik Oranı (Değer/Ağırlık)', 'Değer vs Ağırlık'),
-            specs=[[{"type": "bar"}, {"type": "bar"}],
-                   [{"type": "bar"}, {"type": "scatter"}]]
+            specs=[[{"type": "xy"}, {"type": "xy"}],
+                   [{"type": "xy"}, {"type": "xy"}]]
         )
         
-        # Ağırlık grafiği
-        fig.add_trace(
-            go.Bar(x=[f'Eşya {i}' for i in items], y=weights, 
-                  marker_color=[px.colors.qualitative.Set1[0] if i in selected_items 
-                               else px.colors.qualitative.Set1[1] for i in items],
-                  name='Ağırlık'),
-            row=1, col=1
-        )
-        
-        # Değer grafiği
-        fig.add_trace(
-            go.Bar(x=[f'Eşya {i}' for i in items], y=values,
-                  marker_color=[px.colors.qualitative.Set1[0] if i in selected_items 
-                               else px.colors.qualitative.Set1[1] for i in items],
-                  name='Değer'),
-            row=1, col=2
-        )
-        
-        # Verimlilik grafiği
-        fig.add_trace(
-            go.Bar(x=[f'Eşya {i}' for i in items], y=efficiency,
-                  marker_color=[px.colors.qualitative.Set1[0] if i in selected_items 
-                               else px.colors.qualitative.Set1[1] for i in items],
-                  name='Verimlilik'),
-            row=2, col=1
-        )
+        # Ağırlık, değer ve verimlilik grafikleri
+        positions = [(1, 1, weight_array, 'Ağırlık'), (1, 2, value_array, 'Değer'),
+                     (2, 1, efficiency, 'Verimlilik')]
+        if n <= self.BAR_ITEM_LIMIT:
+            labels = [f'Eşya {i}' for i in range(n)]
+            colors = np.where(mask, selected_color, other_color)
+            for row, col, data, name in positions:
+                fig.add_trace(go.Bar(x=labels, y=data, marker_color=colors, name=name),
+                              row=row, col=col)
+        else:
+            # Seçilen/seçilmeyen eşyaların yığılmış histogramları
+            for row, col, data, name in positions:
+                counts, edges = np.histogram(data, bins=self.HISTOGRAM_BINS)
+                selected_counts, _ = np.histogram(data[mask], bins=edges)
+                centers = (edges[:-1] + edges[1:]) / 2
+                for y, color, label in ((selected_counts, selected_color, 'Seçildi'),
+                                        (counts - selected_counts, other_color, 'Seçilmedi')):
+                    fig.add_trace(go.Bar(x=centers, y=y, width=np.diff(edges), marker_color=color,
+                                         name=f'{name} ({label})'),
+                                  row=row, col=col)
+            fig.update_layout(barmode='stack')
         
         # Scatter plot
-        fig.add_trace(
-            go.Scatter(x=weights, y=values, mode='markers+text',
-                      marker=dict(size=[20 if i in selected_items else 10 for i in items],
-                                 color=[px.colors.qualitative.Set1[0] if i in selected_items 
-                                       else px.colors.qualitative.Set1[1] for i in items]),
-                      text=[f'E{i}' for i in items],
-                      textposition="middle center",
-                      name='Eşyalar'),
-            row=2, col=2
-        )
+        if n <= self.BAR_ITEM_LIMIT:
+            fig.add_trace(
+                go.Scatter(x=weight_array, y=value_array, mode='markers+text',
+                          marker=dict(size=np.where(mask, 20, 10),
+                                     color=np.where(mask, selected_color, other_color)),
+                          text=[f'E{i}' for i in range(n)],
+                          textposition="middle center",
+                          name='Eşyalar'),
+                row=2, col=2
+            )
+        elif n <= self.SCATTER_ITEM_LIMIT:
+            # WebGL ile çizilen, etiketsiz dağılım grafiği
+            for part, size, color, label in ((~mask, 4, other_color, 'Seçilmedi'),
+                                             (mask, 6, selected_color, 'Seçildi')):
+                fig.add_trace(
+                    go.Scattergl(x=weight_array[part], y=value_array[part], mode='markers',
+                                 marker=dict(size=size, color=color), name=label),
+                    row=2, col=2
+                )
+        else:
+            # Tüm eşyaların yoğunluğu ve seçilen eşyaların kontur çizgileri
+            counts, x_edges, y_edges = np.histogram2d(weight_array, value_array,
+                                                      bins=self.DENSITY_BINS)
+            selected_counts, _, _ = np.histogram2d(weight_array[mask], value_array[mask],
+                                                   bins=[x_edges, y_edges])
+            x_centers = (x_edges[:-1] + x_edges[1:]) / 2
+            y_centers = (y_edges[:-1] + y_edges[1:]) / 2
+            fig.add_trace(
+                go.Heatmap(x=x_centers, y=y_centers, z=counts.T, colorscale='Blues',
+                           showscale=False, name='Eşya Yoğunluğu',
+                           hovertemplate='Ağırlık: %{x}<br>Değer: %{y}<br>Eşya: %{z}<extra></extra>'),
+                row=2, col=2
+            )
+            fig.add_trace(
+                go.Contour(x=x_centers, y=y_centers, z=selected_counts.T, showscale=False,
+                           contours_coloring='lines', colorscale=[[0, selected_color], [1, selected_color]],
+                           name='Seçilen Eşyalar'),
+                row=2, col=2
+            )
         
         fig.update_layout(height=700, showlegend=False, 
                          title_text="Knapsack Eşyalarının Analizi")
@@ -354,8 +511,18 @@ class KnapsackVisualizer:
         if not steps:
             return go.Figure()
             
-        step_numbers = list(range(1, len(steps) + 1))
-        current_values = [step.get('current_value', 0) for step in steps]
+        step_numbers = np.arange(1, len(steps) + 1)
+        if hasattr(steps, 'records'):
+            # Kompakt adım kaydında değerler doğrudan diziden okunur
+            current_values = steps.records['chosen']
+        else:
+            current_values = [step.get('current_value', 0) for step in steps]
+        
+        # Çok sayıda adımda eşit aralıklı örnekleme ile nokta sayısı sınırlanır
+        if len(step_numbers) > self.PROGRESS_POINT_LIMIT:
+            sample = np.linspace(0, len(step_numbers) - 1, self.PROGRESS_POINT_LIMIT).astype(np.int64)
+            step_numbers = step_numbers[sample]
+            current_values = np.asarray(current_values)[sample]
         
         fig = go.Figure()
         
@@ -385,11 +552,20 @@ class KnapsackVisualizer:
         fig = go.Figure()
         
         # Seçilen eşyaları göster
-        selected_weights = [weights[i] for i in selected_items]
-        selected_values = [values[i] for i in selected_items]
-        selected_labels = [f'Eşya {i}' for i in selected_items]
+        selected = _selected_indices(selected_items)
+        selected_weights = np.asarray(weights)[selected]
+        selected_labels = [f'Eşya {i}' for i in selected]
+        total_weight = int(selected_weights.sum())
         
-        if selected_weights:
+        if len(selected_weights) > self.BAR_ITEM_LIMIT:
+            # En ağır eşyalar ayrı, kalanlar tek dilimde gösterilir
+            top = np.argsort(selected_weights)[::-1][:self.BAR_ITEM_LIMIT - 1]
+            selected_labels = [selected_labels[i] for i in top] + \
+                [f'Diğer {len(selected) - len(top)} eşya']
+            selected_weights = np.append(selected_weights[top],
+                                         total_weight - selected_weights[top].sum())
+        
+        if len(selected_weights):
             # Pie chart for selected items
             fig.add_trace(go.Pie(
                 labels=selected_labels,
@@ -400,7 +576,6 @@ class KnapsackVisualizer:
                 textposition='auto'
             ))
         
-        total_weight = sum(selected_weights)
         fig.update_layout(
             title=f'Çanta İçeriği (Toplam Ağırlık: {total_weight}/{capacity})',
             annotations=[dict(text=f'Kullanılan<br>Kapasite<br>{total_weight}/{capacity}', 
@@ -444,6 +619,47 @@ class KnapsackVisualizer:
         
         return fig
     
+    def create_sensitivity_chart(self, sensitivity: Dict[str, np.ndarray]) -> go.Figure:
+        """
+        Her eşyanın değerinin, optimal küme değişmeden ne kadar artıp azalabileceğini gösterir
+        
+        Seçilen eşyalar için azalış payı (negatif), seçilmeyenler için artış payı
+        çizilir. Eşya sayısı BAR_ITEM_LIMIT'i aşarsa yalnızca en duyarlı eşyalar gösterilir.
+        """
+        increase = np.asarray(sensitivity['max_increase'], dtype=np.float64)
+        decrease = np.asarray(sensitivity['max_decrease'], dtype=np.float64)
+        selected = np.isinf(increase)
+        margin = np.where(selected, decrease, increase)
+        
+        # Hiçbir değerde seçilemeyecek (sığmayan) eşyalar gösterilmez
+        items = np.flatnonzero(np.isfinite(margin))
+        title = 'Eşya Değeri Duyarlılığı (Optimal Küme Değişmeden İzin Verilen Değişim)'
+        if len(items) > self.BAR_ITEM_LIMIT:
+            items = items[np.argsort(margin[items], kind='stable')[:self.BAR_ITEM_LIMIT]]
+            items.sort()
+            title += f' - En Duyarlı {self.BAR_ITEM_LIMIT} Eşya'
+        
+        labels = [f'Eşya {i}' for i in items]
+        fig = go.Figure()
+        fig.add_trace(go.Bar(
+            x=labels, y=np.where(selected[items], -margin[items], np.nan),
+            marker_color=px.colors.qualitative.Set1[0], name='Azalış Payı (Seçilen)'
+        ))
+        fig.add_trace(go.Bar(
+            x=labels, y=np.where(selected[items], np.nan, margin[items]),
+            marker_color=px.colors.qualitative.Set1[1], name='Artış Payı (Seçilmeyen)'
+        ))
+        
+        fig.update_layout(
+            title=title,
+            xaxis_title='Eşya',
+            yaxis_title='Değer Değişimi',
+            barmode='overlay',
+            height=450
+        )
+        
+        return fig
+    
     def display_step_by_step(self, steps: List[Dict], step_index: int):
         """
         Adım adım çözümü gösterir